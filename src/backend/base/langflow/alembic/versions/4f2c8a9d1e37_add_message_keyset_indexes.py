@@ -0,0 +1,42 @@
+"""Add composite indexes for keyset pagination on the message table
+
+Revision ID: 4f2c8a9d1e37
+Revises: 182e5471b900
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "4f2c8a9d1e37"
+down_revision: str | None = "182e5471b900"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXES = {
+    "ix_message_flow_id_session_id_timestamp_id": ["flow_id", "session_id", "timestamp", "id"],
+    "ix_message_session_id_timestamp_id": ["session_id", "timestamp", "id"],
+}
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        for name, columns in INDEXES.items():
+            if name not in indexes_names:
+                batch_op.create_index(name, columns, unique=False)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        for name in INDEXES:
+            if name in indexes_names:
+                batch_op.drop_index(name)
@@ -6,6 +6,7 @@ import uuid
 from collections.abc import AsyncIterator
 
 from fastapi import BackgroundTasks, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from lfx.graph.graph.base import Graph
 from lfx.graph.utils import log_vertex_build
 from lfx.log.logger import logger
@@ -30,9 +31,13 @@ from langflow.schema.message import ErrorMessage
 from langflow.schema.schema import OutputValue
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.deps import get_chat_service, get_telemetry_service, session_scope
+from langflow.services.job_queue.backends import StoredEvent
 from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
 from langflow.services.telemetry.schema import ComponentInputsPayload, ComponentPayload, PlaygroundPayload
 
+# How long a read from the job event backend waits for new events
+STORED_EVENTS_READ_TIMEOUT = 5.0
+
 
 def _log_component_input_telemetry(
     vertex,
@@ -91,6 +96,7 @@ async def start_flow_build(
             current_user=current_user,
             flow_name=flow_name,
         )
+        await queue_service.register_job(job_id)
         queue_service.start_job(job_id, task_coro)
     except Exception as e:
         await logger.aexception("Failed to create queue and start task")
@@ -103,9 +109,21 @@ async def get_flow_events_response(
     job_id: str,
     queue_service: JobQueueService,
     event_delivery: EventDeliveryType,
+    last_event_id: str | None = None,
 ):
-    """Get events for a specific build job, either as a stream or single event."""
+    """Get events for a specific build job, either as a stream or single event.
+
+    With a job event backend, events are read from it, from any worker, after `last_event_id`
+    when given. Each event then carries its `id`, to resume from.
+    """
     try:
+        if queue_service.event_backend is not None:
+            return await get_stored_flow_events_response(
+                job_id=job_id,
+                queue_service=queue_service,
+                event_delivery=event_delivery,
+                last_event_id=last_event_id,
+            )
         main_queue, event_manager, event_task, _ = queue_service.get_queue_data(job_id)
         if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
             if event_task is None:
@@ -164,6 +182,53 @@ async def get_flow_events_response(
         raise HTTPException(status_code=500, detail=f"Unexpected error: {exc!s}") from exc
 
 
+def _with_event_id(event: StoredEvent) -> str:
+    """Add the event's id to its JSON object, without decoding it."""
+    data = event.data.decode("utf-8")
+    # Events are JSON objects with at least "event" and "data" keys
+    return f'{{"id": {json.dumps(event.event_id)}, {data[1:]}' if data.startswith("{") else data
+
+
+async def get_stored_flow_events_response(
+    *,
+    job_id: str,
+    queue_service: JobQueueService,
+    event_delivery: EventDeliveryType,
+    last_event_id: str | None,
+) -> Response:
+    """Serve a job's events from the job event backend.
+
+    Streams end with the job's events. Unlike streams served from the job's queue, a client
+    disconnecting doesn't cancel the build, so the client can resume from its last event id.
+    """
+    # Raises JobQueueNotFoundError for unknown jobs before a response is started
+    first_events = await queue_service.read_events(job_id, last_event_id)
+
+    if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
+
+        async def stream_events() -> AsyncIterator[str]:
+            events = first_events
+            last_id = last_event_id
+            while True:
+                for event in events:
+                    if event.data is None:
+                        return
+                    last_id = event.event_id
+                    yield _with_event_id(event)
+                try:
+                    events = await queue_service.read_events(job_id, last_id, timeout=STORED_EVENTS_READ_TIMEOUT)
+                except JobQueueNotFoundError:
+                    await logger.awarning(f"Events of job {job_id} expired while streaming")
+                    return
+
+        return StreamingResponse(stream_events(), media_type="application/x-ndjson")
+
+    # Polling mode - get all available events, waiting for some if there are none yet
+    events = first_events or await queue_service.read_events(job_id, last_event_id, timeout=STORED_EVENTS_READ_TIMEOUT)
+    content = "\n".join(_with_event_id(event) for event in events if event.data is not None)
+    return Response(content=content, media_type="application/x-ndjson")
+
+
 async def create_flow_response(
     queue: asyncio.Queue,
     event_manager: EventManager,
@@ -470,13 +535,14 @@ async def generate_flow_events(
 
         # send built event or error event
         try:
-            vertex_build_response_json = vertex_build_response.model_dump_json()
-            build_data = json.loads(vertex_build_response_json)
+            # Serialized once, straight to the JSON sent to the client
+            build_data_json = vertex_build_response.model_dump_json().encode("utf-8")
         except Exception as exc:
             msg = f"Error serializing vertex build response: {exc}"
             raise ValueError(msg) from exc
 
-        event_manager.on_end_vertex(data={"build_data": build_data})
+        event_manager.send_encoded_event("on_end_vertex", b'{"build_data": ' + build_data_json + b"}")
+        await event_manager.wait_for_capacity()
 
         if vertex_build_response.valid and vertex_build_response.next_vertices_ids:
             tasks = []
@@ -549,6 +615,11 @@ async def cancel_flow_build(
         ValueError: If the job doesn't exist
         asyncio.CancelledError: If the task cancellation failed
     """
+    if queue_service.event_backend is not None and not queue_service.is_local_job(job_id):
+        # The job runs on another worker, which checks the event backend for this request
+        await queue_service.request_cancel(job_id)
+        return True
+
     # Get the event task and event manager for the job
     _, _, event_task, _ = queue_service.get_queue_data(job_id)
 
@@ -14,6 +14,7 @@ from lfx.services.deps import injectable_session_scope, injectable_session_scope
 from sqlalchemy import delete
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from langflow.processing.prepared_graph import invalidate_prepared_graphs
 from langflow.services.auth.utils import get_current_active_user, get_current_active_user_mcp
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.database.models.message.model import MessageTable
@@ -311,6 +312,7 @@ async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None
         await session.exec(delete(TransactionTable).where(TransactionTable.flow_id == flow_id))
         await session.exec(delete(VertexBuildTable).where(VertexBuildTable.flow_id == flow_id))
         await session.exec(delete(Flow).where(Flow.id == flow_id))
+        invalidate_prepared_graphs(str(flow_id))
     except Exception as e:
         msg = f"Unable to cascade delete flow: {flow_id}"
         raise RuntimeError(msg, e) from e
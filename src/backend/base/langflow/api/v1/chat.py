@@ -203,12 +203,17 @@ async def get_build_events(
     queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
     *,
     event_delivery: EventDeliveryType = EventDeliveryType.STREAMING,
+    last_event_id: str | None = None,
 ):
-    """Get events for a specific build job."""
+    """Get events for a specific build job.
+
+    With a shared job queue backend, `last_event_id` resumes the events after the one with that id.
+    """
     return await get_flow_events_response(
         job_id=job_id,
         queue_service=queue_service,
         event_delivery=event_delivery,
+        last_event_id=last_event_id,
     )
 
 
@@ -9,7 +9,7 @@ from uuid import UUID, uuid4
 
 import orjson
 import sqlalchemy as sa
-from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Request, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Request, Response, UploadFile, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from lfx.custom.custom_component.component import Component
@@ -42,6 +42,7 @@ from langflow.exceptions.api import APIException, InvalidChatInputError
 from langflow.exceptions.serialization import SerializationError
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
+from langflow.processing.prepared_graph import get_prepared_graph_cache
 from langflow.processing.process import process_tweaks, run_graph_internal
 from langflow.schema.graph import Tweaks
 from langflow.services.auth.utils import api_key_security, get_current_active_user, get_webhook_user
@@ -49,9 +50,13 @@ from langflow.services.cache.utils import save_uploaded_file
 from langflow.services.database.models.flow.model import Flow, FlowRead
 from langflow.services.database.models.flow.utils import get_all_webhook_components_in_flow
 from langflow.services.database.models.user.model import User, UserRead
-from langflow.services.deps import get_session_service, get_settings_service, get_telemetry_service
+from langflow.services.deps import (
+    get_queue_service,
+    get_session_service,
+    get_settings_service,
+    get_telemetry_service,
+)
 from langflow.services.telemetry.schema import RunPayload
-from langflow.utils.compression import compress_response
 from langflow.utils.version import get_version_info
 
 if TYPE_CHECKING:
@@ -84,22 +89,50 @@ async def parse_input_request_from_body(http_request: Request) -> SimplifiedAPIR
 
 
 @router.get("/all", dependencies=[Depends(get_current_active_user)])
-async def get_all():
-    """Retrieve all component types with compression for better performance.
+async def get_all(request: Request):
+    """Retrieve all component types.
+
+    The catalog is encoded and compressed once per version and sent with an ETag, so clients
+    that send it back in `If-None-Match` get a `304 Not Modified` while the catalog is unchanged.
+    """
+    try:
+        catalog = await _get_component_catalog()
+        return catalog.response(request.headers)
+
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
 
-    Returns a compressed response containing all available component types.
+
+@router.get("/all/delta", dependencies=[Depends(get_current_active_user)])
+async def get_all_delta(since: str):
+    """Retrieve the component types changed or removed since the catalog version `since`.
+
+    `since` is the ETag of a catalog the client already has, without its quotes. When it is not
+    one of the recent versions, every component type is returned and `full` is true.
     """
-    from langflow.interface.components import get_and_cache_all_types_dict
+    from langflow.utils.component_catalog import component_catalog
 
     try:
-        all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
-        # Return compressed response using our utility function
-        return compress_response(all_types)
+        catalog = await _get_component_catalog()
+        return Response(
+            content=component_catalog.delta(catalog, since),
+            media_type="application/json",
+            headers={"ETag": catalog.etag, "Cache-Control": "private, no-cache"},
+        )
 
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+async def _get_component_catalog():
+    from lfx.interface.components import component_cache, get_and_cache_all_types_dict
+
+    from langflow.utils.component_catalog import component_catalog
+
+    all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
+    return await component_catalog.get(all_types, component_cache.version)
+
+
 def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
     # If the input_value is not None and the input_type is "chat"
     # then we need to check the tweaks if the ChatInput component is present
@@ -150,10 +183,8 @@ async def simple_run_flow(
         if flow.data is None:
             msg = f"Flow {flow_id_str} has no data"
             raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(
-            graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name, context=context
+        graph = get_prepared_graph_cache().get_run_graph(
+            flow, input_request.tweaks or {}, stream=stream, user_id=str(user_id), context=context
         )
         if run_id is None:
             run_id = str(uuid4())
@@ -326,7 +357,8 @@ async def run_flow_generator(
         await logger.aerror(f"Error running flow: {e}")
         event_manager.on_error(data={"error": str(e)})
     finally:
-        await event_manager.queue.put((None, None, time.time))
+        # Never blocks, so a cancelled run can always end its events
+        event_manager.queue.put_nowait((None, None, time.time()))
 
 
 async def check_flow_user_permission(
@@ -403,7 +435,7 @@ async def _run_flow_internal(
     start_time = time.perf_counter()
 
     if stream:
-        asyncio_queue: asyncio.Queue = asyncio.Queue()
+        asyncio_queue = get_queue_service().create_event_queue("run")
         asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
         event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
         main_task = asyncio.create_task(
@@ -420,6 +452,7 @@ async def _run_flow_internal(
         async def on_disconnect() -> None:
             await logger.adebug("Client disconnected, closing tasks")
             main_task.cancel()
+            asyncio_queue.close()
 
         return StreamingResponse(
             consume_and_yield(asyncio_queue, asyncio_queue_client_consumed),
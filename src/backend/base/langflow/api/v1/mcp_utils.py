@@ -5,23 +5,26 @@ This module serves as the single source of truth for MCP functionality.
 
 import asyncio
 import base64
+import threading
 from collections.abc import Awaitable, Callable
 from contextvars import ContextVar
+from datetime import datetime
 from functools import wraps
 from typing import Any, ParamSpec, TypeVar
 from urllib.parse import quote, unquote, urlparse
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+from cachetools import LRUCache
 from lfx.base.mcp.constants import MAX_MCP_TOOL_NAME_LENGTH
 from lfx.base.mcp.util import get_flow_snake_case, get_unique_name, sanitize_mcp_name
 from lfx.log.logger import logger
 from lfx.utils.helpers import build_content_type_from_extension
 from mcp import types
-from sqlmodel import select
+from sqlmodel import col, select
 
 from langflow.api.v1.endpoints import simple_run_flow
 from langflow.api.v1.schemas import SimplifiedAPIRequest
-from langflow.helpers.flow import json_schema_from_flow
+from langflow.helpers.flow import json_schema_from_flow_data
 from langflow.schema.message import Message
 from langflow.services.database.models import Flow
 from langflow.services.database.models.user.model import User
@@ -30,6 +33,8 @@ from langflow.services.deps import get_settings_service, get_storage_service, se
 T = TypeVar("T")
 P = ParamSpec("P")
 
+DEFAULT_MCP_TOOL_MANIFEST_CACHE_SIZE = 1024
+
 # Create context variables
 current_user_ctx: ContextVar[User] = ContextVar("current_user_ctx")
 # Carries per-request variables injected via HTTP headers (e.g., X-Langflow-Global-Var-*)
@@ -283,9 +288,60 @@ async def handle_call_tool(
         raise
 
 
+class MCPToolManifestCache:
+    """Caches the MCP tools listed for each project and the input schemas of their flows.
+
+    Building the input schema of a flow means loading its data and building its graph, so
+    schemas are kept per flow and rebuilt only when the flow's `updated_at` changes. The tools of
+    a project are kept along with the header columns of the flows they were built from, and
+    reused while those are unchanged.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MCP_TOOL_MANIFEST_CACHE_SIZE) -> None:
+        self._schemas: LRUCache[UUID, tuple[datetime | None, dict]] = LRUCache(maxsize=maxsize)
+        self._manifests: LRUCache[tuple, tuple[tuple, list[types.Tool]]] = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get_schema(self, flow_id: UUID, updated_at: datetime | None) -> dict | None:
+        if updated_at is None:
+            return None
+        with self._lock:
+            cached = self._schemas.get(flow_id)
+        if cached is None or cached[0] != updated_at:
+            return None
+        return cached[1]
+
+    def set_schema(self, flow_id: UUID, updated_at: datetime | None, schema: dict) -> None:
+        if updated_at is not None:
+            with self._lock:
+                self._schemas[flow_id] = (updated_at, schema)
+
+    def get_manifest(self, key: tuple, headers: tuple) -> list[types.Tool] | None:
+        with self._lock:
+            cached = self._manifests.get(key)
+        if cached is None or cached[0] != headers:
+            return None
+        return list(cached[1])
+
+    def set_manifest(self, key: tuple, headers: tuple, tools: list[types.Tool]) -> None:
+        with self._lock:
+            self._manifests[key] = (headers, list(tools))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._schemas.clear()
+            self._manifests.clear()
+
+
+tool_manifest_cache = MCPToolManifestCache()
+
+
 async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
     """Handle listing tools for MCP.
 
+    Only the header columns of the flows are read. The data of a flow is read, and its input
+    schema built, only when the flow changed since it was last listed.
+
     Args:
         project_id: Optional project ID to filter tools by project
         mcp_enabled_only: Whether to filter for MCP-enabled flows only
@@ -294,22 +350,47 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
     try:
         async with session_scope() as session:
             # Build query based on parameters
+            header_columns = (
+                Flow.id,
+                Flow.name,
+                Flow.description,
+                Flow.action_name,
+                Flow.action_description,
+                Flow.user_id,
+                Flow.updated_at,
+            )
             if project_id:
                 # Filter flows by project and optionally by MCP enabled status
-                flows_query = select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
+                flows_query = select(*header_columns).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
                 if mcp_enabled_only:
                     flows_query = flows_query.where(Flow.mcp_enabled == True)  # noqa: E712
             else:
                 # Get all flows
-                flows_query = select(Flow)
+                flows_query = select(*header_columns)
 
-            flows = (await session.exec(flows_query)).all()
+            flows = [flow for flow in (await session.exec(flows_query)).all() if flow.user_id is not None]
+
+            manifest_key = (str(project_id) if project_id else None, mcp_enabled_only)
+            headers = tuple(tuple(flow) for flow in flows)
+            cached_tools = tool_manifest_cache.get_manifest(manifest_key, headers)
+            if cached_tools is not None:
+                return cached_tools
+
+            schemas = {flow.id: tool_manifest_cache.get_schema(flow.id, flow.updated_at) for flow in flows}
+            stale_flow_ids = [flow_id for flow_id, schema in schemas.items() if schema is None]
+            if stale_flow_ids:
+                data_query = select(Flow.id, Flow.data, Flow.updated_at).where(col(Flow.id).in_(stale_flow_ids))
+                for flow_id, flow_data, updated_at in (await session.exec(data_query)).all():
+                    try:
+                        schemas[flow_id] = json_schema_from_flow_data(flow_data or {})
+                    except Exception as e:  # noqa: BLE001
+                        msg = f"Error in listing tools: {e!s} from flow: {flow_id}"
+                        await logger.awarning(msg)
+                        continue
+                    tool_manifest_cache.set_schema(flow_id, updated_at, schemas[flow_id])
 
             existing_names = set()
             for flow in flows:
-                if flow.user_id is None:
-                    continue
-
                 # For project-specific tools, use action names if available
                 if project_id:
                     base_name = (
@@ -337,18 +418,13 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
                         f"{flow.id}: {flow.description}" if flow.description else f"Tool generated from flow: {name}"
                     )
 
-                try:
-                    tool = types.Tool(
-                        name=name,
-                        description=description,
-                        inputSchema=json_schema_from_flow(flow),
-                    )
-                    tools.append(tool)
-                    existing_names.add(name)
-                except Exception as e:  # noqa: BLE001
-                    msg = f"Error in listing tools: {e!s} from flow: {base_name}"
-                    await logger.awarning(msg)
+                input_schema = schemas.get(flow.id)
+                if input_schema is None:
                     continue
+                tools.append(types.Tool(name=name, description=description, inputSchema=input_schema))
+                existing_names.add(name)
+
+            tool_manifest_cache.set_manifest(manifest_key, headers, tools)
     except Exception as e:
         msg = f"Error in listing tools: {e!s}"
         await logger.aexception(msg)
@@ -1,7 +1,10 @@
-from typing import Annotated
+from collections.abc import AsyncIterator
+from typing import Annotated, Any
+from urllib.parse import unquote
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlmodel import apaginate
 from sqlalchemy import delete
@@ -9,7 +12,13 @@ from sqlmodel import col, select
 
 from langflow.api.utils import DbSession, custom_params
 from langflow.schema.message import MessageResponse
-from langflow.services.auth.utils import get_current_active_user
+from langflow.services.auth.utils import get_current_active_superuser, get_current_active_user
+from langflow.services.database.models.message.crud import (
+    decode_cursor,
+    encode_cursor,
+    encode_message_cursor,
+    paginate_messages_query,
+)
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
 from langflow.services.database.models.transactions.crud import transform_transaction_table
 from langflow.services.database.models.transactions.model import TransactionTable
@@ -18,9 +27,14 @@ from langflow.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.deps import get_cache_service, session_scope
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
+MAX_PAGE_SIZE = 1000
+EXPORT_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 @router.get("/builds")
 async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
@@ -42,50 +56,133 @@ async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSes
 @router.get("/messages/sessions", dependencies=[Depends(get_current_active_user)])
 async def get_message_sessions(
     session: DbSession,
+    response: Response,
     flow_id: Annotated[UUID | None, Query()] = None,
+    limit: Annotated[int | None, Query(ge=1, le=MAX_PAGE_SIZE)] = None,
+    cursor: Annotated[str | None, Query()] = None,
 ) -> list[str]:
+    """Lists the session ids, in order.
+
+    With a `limit`, the cursor for the next page (if any) is returned in the `X-Next-Cursor` header.
+    """
     try:
         stmt = select(MessageTable.session_id).distinct()
         stmt = stmt.where(col(MessageTable.session_id).isnot(None))
 
         if flow_id:
             stmt = stmt.where(MessageTable.flow_id == flow_id)
-
-        session_ids = await session.exec(stmt)
-        return list(session_ids)
+        if limit is not None or cursor:
+            stmt = stmt.order_by(col(MessageTable.session_id))
+        if cursor:
+            (after_session_id,) = decode_cursor(cursor, 1)
+            stmt = stmt.where(col(MessageTable.session_id) > after_session_id)
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+
+        session_ids = list(await session.exec(stmt))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+    if limit is not None and len(session_ids) > limit:
+        session_ids = session_ids[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor([session_ids[-1]])
+    return session_ids
+
+
+def _messages_query(
+    flow_id: UUID | None = None,
+    session_id: str | None = None,
+    sender: str | None = None,
+    sender_name: str | None = None,
+):
+    stmt = select(MessageTable)
+    if flow_id:
+        stmt = stmt.where(MessageTable.flow_id == flow_id)
+    if session_id:
+        decoded_session_id = unquote(session_id)
+        stmt = stmt.where(MessageTable.session_id == decoded_session_id)
+    if sender:
+        stmt = stmt.where(MessageTable.sender == sender)
+    if sender_name:
+        stmt = stmt.where(MessageTable.sender_name == sender_name)
+    return stmt
 
 
 @router.get("/messages", dependencies=[Depends(get_current_active_user)])
 async def get_messages(
     session: DbSession,
+    response: Response,
     flow_id: Annotated[UUID | None, Query()] = None,
     session_id: Annotated[str | None, Query()] = None,
     sender: Annotated[str | None, Query()] = None,
     sender_name: Annotated[str | None, Query()] = None,
     order_by: Annotated[str | None, Query()] = "timestamp",
+    limit: Annotated[int | None, Query(ge=1, le=MAX_PAGE_SIZE)] = None,
+    cursor: Annotated[str | None, Query()] = None,
 ) -> list[MessageResponse]:
+    """Lists the messages matching the filters.
+
+    With a `limit` or `cursor`, messages are paginated by (timestamp, id) and the cursor for the next
+    page (if any) is returned in the `X-Next-Cursor` header.
+    """
+    paginated = limit is not None or bool(cursor)
+    if paginated and order_by not in {None, "timestamp"}:
+        raise HTTPException(status_code=400, detail="Paginated messages can only be ordered by timestamp")
     try:
-        stmt = select(MessageTable)
-        if flow_id:
-            stmt = stmt.where(MessageTable.flow_id == flow_id)
-        if session_id:
-            from urllib.parse import unquote
-
-            decoded_session_id = unquote(session_id)
-            stmt = stmt.where(MessageTable.session_id == decoded_session_id)
-        if sender:
-            stmt = stmt.where(MessageTable.sender == sender)
-        if sender_name:
-            stmt = stmt.where(MessageTable.sender_name == sender_name)
-        if order_by:
-            col = getattr(MessageTable, order_by).asc()
-            stmt = stmt.order_by(col)
-        messages = await session.exec(stmt)
-        return [MessageResponse.model_validate(d, from_attributes=True) for d in messages]
+        stmt = _messages_query(flow_id, session_id, sender, sender_name)
+        if paginated:
+            stmt = paginate_messages_query(stmt, cursor=cursor, limit=limit)
+        elif order_by:
+            order_column = getattr(MessageTable, order_by).asc()
+            stmt = stmt.order_by(order_column)
+        messages = list(await session.exec(stmt))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+    if limit is not None and len(messages) > limit:
+        messages = messages[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_message_cursor(messages[-1])
+    return [MessageResponse.model_validate(d, from_attributes=True) for d in messages]
+
+
+@router.get("/messages/export", dependencies=[Depends(get_current_active_user)])
+async def export_messages(
+    flow_id: Annotated[UUID | None, Query()] = None,
+    session_id: Annotated[str | None, Query()] = None,
+    sender: Annotated[str | None, Query()] = None,
+    sender_name: Annotated[str | None, Query()] = None,
+) -> StreamingResponse:
+    """Streams the messages matching the filters as newline-delimited JSON, in (timestamp, id) order.
+
+    Messages are read a page at a time, each in its own session, so exporting a large session
+    neither holds it in memory nor keeps a transaction open for the whole download.
+    """
+
+    async def generate() -> AsyncIterator[bytes]:
+        cursor = None
+        while True:
+            stmt = paginate_messages_query(
+                _messages_query(flow_id, session_id, sender, sender_name), cursor=cursor, limit=EXPORT_PAGE_SIZE
+            )
+            async with session_scope() as db:
+                messages = list(await db.exec(stmt))
+            page = messages[:EXPORT_PAGE_SIZE]
+            if page:
+                yield "".join(
+                    MessageResponse.model_validate(message, from_attributes=True).model_dump_json() + "\n"
+                    for message in page
+                ).encode()
+            if len(messages) <= EXPORT_PAGE_SIZE:
+                return
+            cursor = encode_message_cursor(page[-1])
+
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="messages.ndjson"'},
+    )
 
 
 @router.delete("/messages", status_code=204, dependencies=[Depends(get_current_active_user)])
@@ -198,3 +295,13 @@ async def get_transactions(
             return await apaginate(session, stmt, params=params, transformer=transform_transaction_table)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("/cache", dependencies=[Depends(get_current_active_superuser)])
+async def get_cache_stats() -> dict[str, Any]:
+    """Retrieve the statistics of this worker's cache, such as its size in bytes and its hit and eviction counts."""
+    cache_service = get_cache_service()
+    stats = getattr(cache_service, "stats", None)
+    if stats is None:
+        raise HTTPException(status_code=404, detail=f"{type(cache_service).__name__} does not report statistics")
+    return {"type": type(cache_service).__name__, **stats()}
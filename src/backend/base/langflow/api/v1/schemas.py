@@ -327,8 +327,9 @@ class VertexBuildResponse(BaseModel):
         Returns:
             dict: The serialized representation of the data with truncation applied.
         """
-        # return serialize(data, max_length=get_max_text_length())  TODO: Safe?
-        return serialize(data, max_length=get_max_text_length(), max_items=get_max_items_length())
+        # ResultDataResponse truncates its fields itself. Serializing its output again would walk it a second
+        # time, and re-truncate truncated lists, replacing their "... [truncated N items]" marker with "1 items".
+        return data.serialize_model()
 
 
 class VerticesBuiltResponse(BaseModel):
@@ -15,6 +15,7 @@ from langflow.services.auth.utils import (
     get_password_hash,
     verify_password,
 )
+from langflow.services.database.models.api_key.cache import api_key_cache
 from langflow.services.database.models.user.crud import get_user_by_id, update_user
 from langflow.services.database.models.user.model import User, UserCreate, UserRead, UserUpdate
 from langflow.services.deps import get_settings_service
@@ -143,4 +144,5 @@ async def delete_user(
         raise HTTPException(status_code=404, detail="User not found")
 
     await session.delete(user_db)
+    api_key_cache.invalidate_user(user_id)
     return {"detail": "User deleted"}
@@ -33,7 +33,13 @@ from langflow.services.database.models.flow.model import Flow
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.database.models.user.model import User
 from langflow.services.deps import get_variable_service, session_scope
-from langflow.utils.voice_utils import BYTES_PER_24K_FRAME, VAD_SAMPLE_RATE_16K, resample_24k_to_16k
+from langflow.utils.voice_utils import (
+    BYTES_PER_16K_FRAME,
+    SAMPLE_RATE_24K,
+    VAD_SAMPLE_RATE_16K,
+    StreamingResampler,
+    count_speech_frames,
+)
 
 router = APIRouter(prefix="/voice", tags=["Voice"])
 
@@ -778,27 +784,27 @@ async def flow_as_tool_websocket(
                 nonlocal vad_audio_buffer
                 last_speech_time = datetime.now(tz=timezone.utc)
                 vad = get_vad()
+                resampler = StreamingResampler(SAMPLE_RATE_24K, VAD_SAMPLE_RATE_16K)
                 while True:
-                    base64_data = await vad_queue.get()
-                    raw_chunk_24k = base64.b64decode(base64_data)
-                    vad_audio_buffer.extend(raw_chunk_24k)
-                    has_speech = False
-                    while len(vad_audio_buffer) >= BYTES_PER_24K_FRAME:
-                        frame_24k = vad_audio_buffer[:BYTES_PER_24K_FRAME]
-                        del vad_audio_buffer[:BYTES_PER_24K_FRAME]
-                        try:
-                            frame_16k = resample_24k_to_16k(frame_24k)
-                            is_speech = vad.is_speech(frame_16k, VAD_SAMPLE_RATE_16K)
-                            if is_speech:
-                                has_speech = True
-                                logger.trace("!", end="")
-                                if bot_speaking_flag[0]:
-                                    msg_handler.openai_send({"type": "response.cancel"})
-                                    bot_speaking_flag[0] = False
-                        except Exception as e:  # noqa: BLE001
-                            await logger.aerror(f"[ERROR] VAD processing failed (ValueError): {e}")
-                            continue
-                    if has_speech:
+                    # Resample and check all the audio received since the last pass at once
+                    chunks = [await vad_queue.get()]
+                    while not vad_queue.empty():
+                        chunks.append(vad_queue.get_nowait())
+                    raw_audio_24k = b"".join(base64.b64decode(chunk) for chunk in chunks)
+                    try:
+                        vad_audio_buffer.extend(resampler.process(raw_audio_24k))
+                        complete = len(vad_audio_buffer) - len(vad_audio_buffer) % BYTES_PER_16K_FRAME
+                        speech_frames = count_speech_frames(vad, vad_audio_buffer[:complete])
+                        del vad_audio_buffer[:complete]
+                    except Exception as e:  # noqa: BLE001
+                        await logger.aerror(f"[ERROR] VAD processing failed (ValueError): {e}")
+                        vad_audio_buffer.clear()
+                        continue
+                    if speech_frames:
+                        logger.trace("!" * speech_frames, end="")
+                        if bot_speaking_flag[0]:
+                            msg_handler.openai_send({"type": "response.cancel"})
+                            bot_speaking_flag[0] = False
                         last_speech_time = datetime.now(tz=timezone.utc)
                         logger.trace(".", end="")
                     else:
@@ -1,9 +1,8 @@
-import io
 import re
 import uuid
-import zipfile
 from collections.abc import AsyncGenerator, AsyncIterable
 from datetime import datetime
+from functools import partial
 from http import HTTPStatus
 from pathlib import Path
 from typing import Annotated
@@ -20,6 +19,7 @@ from langflow.services.database.models.file.model import File as UserFile
 from langflow.services.deps import get_settings_service, get_storage_service
 from langflow.services.settings.service import SettingsService
 from langflow.services.storage.service import StorageService
+from langflow.utils.zip_stream import ZipStreamEntry, stream_zip
 
 router = APIRouter(tags=["Files"], prefix="/files")
 
@@ -471,34 +471,44 @@ async def download_files_batch(
         if not files:
             raise HTTPException(status_code=404, detail="No files found")
 
-        # Create a byte stream to hold the ZIP file
-        zip_stream = io.BytesIO()
-
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
-            for file in files:
-                # Get the file content from storage
-                file_content = await storage_service.get_file(
-                    flow_id=str(current_user.id), file_name=file.path.split("/")[-1]
-                )
-
-                # Get the file extension from the original filename
-                file_extension = Path(file.path).suffix
-                # Create the filename with extension
-                filename_with_extension = f"{file.name}{file_extension}"
-
-                # Write the file to the ZIP with the proper extension
-                zip_file.writestr(filename_with_extension, file_content)
+        # Stream the ZIP as it is written, fetching a few files ahead of the writer
+        storage_flow_id = str(current_user.id)
+        entries = [
+            ZipStreamEntry(
+                # Use the extension of the stored file with the original filename
+                name=f"{file.name}{Path(file.path).suffix}",
+                open_stream=partial(
+                    storage_service.get_file_stream, flow_id=storage_flow_id, file_name=file.path.split("/")[-1]
+                ),
+                size=file.size,
+            )
+            for file in files
+        ]
+        zip_chunks = stream_zip(entries)
+        # Start writing before responding, so a missing first file is still reported as a 404
+        try:
+            first_chunk = await anext(zip_chunks)
+        except StopAsyncIteration:
+            first_chunk = b""
 
-        # Seek to the beginning of the byte stream
-        zip_stream.seek(0)
+        async def zip_stream() -> AsyncGenerator[bytes, None]:
+            try:
+                yield first_chunk
+                async for chunk in zip_chunks:
+                    yield chunk
+            except Exception:
+                # The response has started, so the error can only abort the stream
+                await logger.aexception("Error streaming files archive")
+                raise
+            finally:
+                await zip_chunks.aclose()
 
         # Generate the filename with the current datetime
         current_time = datetime.now(tz=ZoneInfo("UTC")).astimezone().strftime("%Y%m%d_%H%M%S")
         filename = f"{current_time}_langflow_files.zip"
 
         return StreamingResponse(
-            zip_stream,
+            zip_stream(),
             media_type="application/x-zip-compressed",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -439,10 +439,13 @@ async def generate_unique_flow_name(flow_name, user_id, session):
 
 def json_schema_from_flow(flow: Flow) -> dict:
     """Generate JSON schema from flow input nodes."""
-    from lfx.graph.graph.base import Graph
-
     # Get the flow's data which contains the nodes and their configurations
-    flow_data = flow.data or {}
+    return json_schema_from_flow_data(flow.data or {})
+
+
+def json_schema_from_flow_data(flow_data: dict) -> dict:
+    """Generate JSON schema from the input nodes of a flow's data."""
+    from lfx.graph.graph.base import Graph
 
     graph = Graph.from_payload(flow_data)
     input_nodes = [vertex for vertex in graph.vertices if vertex.is_input]
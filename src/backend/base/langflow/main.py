@@ -37,6 +37,7 @@ from langflow.initial_setup.setup import (
     sync_flows_from_fs,
 )
 from langflow.middleware import ContentSizeLimitMiddleware
+from langflow.services.database.write_behind import write_behind_logger
 from langflow.services.deps import (
     get_queue_service,
     get_service,
@@ -274,6 +275,8 @@ def get_lifespan(*, fix_migration=False, version=None):
             queue_service = get_queue_service()
             if not queue_service.is_started():  # Start if not already started
                 queue_service.start()
+            if get_settings_service().settings.db_write_behind_enabled:
+                await write_behind_logger.start()
             await logger.adebug(f"Flows loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
             total_time = asyncio.get_event_loop().time() - start_time
@@ -351,6 +354,11 @@ def get_lifespan(*, fix_migration=False, version=None):
 
                 # Step 2: Cleaning Up Services
                 with shutdown_progress.step(2):
+                    if write_behind_logger.is_running():
+                        try:
+                            await asyncio.wait_for(write_behind_logger.stop(), timeout=30)
+                        except asyncio.TimeoutError:
+                            await logger.awarning("Writing buffered database rows timed out after 30s.")
                     try:
                         await asyncio.wait_for(teardown_services(), timeout=30)
                     except asyncio.TimeoutError:
@@ -40,6 +40,9 @@ def _get_variable_query(
     if order_by:
         col = getattr(MessageTable, order_by).desc() if order == "DESC" else getattr(MessageTable, order_by).asc()
         stmt = stmt.order_by(col)
+        if order_by == "timestamp":
+            # Break ties on id, like the (session_id, timestamp, id) index, so the order is stable
+            stmt = stmt.order_by(MessageTable.id.desc() if order == "DESC" else MessageTable.id.asc())
     if limit:
         stmt = stmt.limit(limit)
     return stmt
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from cachetools import LRUCache
+from lfx.graph.graph.base import Graph
+
+from langflow.processing.process import process_tweaks
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from langflow.services.database.models.flow.model import Flow
+
+DEFAULT_PREPARED_GRAPH_CACHE_SIZE = 128
+
+
+class PreparedGraphCache:
+    """LRU cache of graphs built from flow data with tweaks already applied.
+
+    Cached graphs are templates: they are never run. Each request gets its own run instance
+    through `Graph.create_run_instance`, which shares the template's topology and component
+    classes but owns all per-run state.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_PREPARED_GRAPH_CACHE_SIZE) -> None:
+        self.enabled = maxsize > 0
+        self._cache: LRUCache[tuple, Graph] = LRUCache(maxsize=max(maxsize, 1))
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(flow: Flow, tweaks: dict[str, Any], *, stream: bool, user_id: str) -> tuple | None:
+        if flow.updated_at is None:
+            return None
+        tweaks_hash = hashlib.sha256(orjson.dumps(tweaks, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+        return (str(flow.id), flow.updated_at.isoformat(), flow.name, user_id, stream, tweaks_hash)
+
+    def get_run_graph(
+        self,
+        flow: Flow,
+        tweaks: dict[str, Any],
+        *,
+        stream: bool,
+        user_id: str,
+        context: dict | None = None,
+    ) -> Graph:
+        """Returns a graph ready to run for `flow`, building and caching its template on a miss."""
+        key = self.make_key(flow, tweaks, stream=stream, user_id=user_id) if self.enabled else None
+        template = None
+        if key is not None:
+            with self._lock:
+                template = self._cache.get(key)
+                if template is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+        if template is None:
+            graph_data = process_tweaks(flow.data.copy(), tweaks, stream=stream)
+            if key is None:
+                return Graph.from_payload(
+                    graph_data, flow_id=str(flow.id), user_id=user_id, flow_name=flow.name, context=context
+                )
+            template = Graph.from_payload(graph_data, flow_id=str(flow.id), user_id=user_id, flow_name=flow.name)
+            with self._lock:
+                self._cache[key] = template
+        return template.create_run_instance(context=context)
+
+    def invalidate(self, flow_id: str | None = None) -> None:
+        """Drops every prepared graph of `flow_id`, or the whole cache if no flow is given."""
+        with self._lock:
+            if flow_id is None:
+                self._cache.clear()
+                return
+            for key in [key for key in self._cache if key[0] == flow_id]:
+                self._cache.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._cache),
+                "maxsize": int(self._cache.maxsize) if self.enabled else 0,
+            }
+
+
+_prepared_graph_cache: PreparedGraphCache | None = None
+
+
+def get_prepared_graph_cache() -> PreparedGraphCache:
+    """Returns the process-wide prepared graph cache, creating it on first use."""
+    global _prepared_graph_cache  # noqa: PLW0603
+    if _prepared_graph_cache is None:
+        maxsize = getattr(
+            get_settings_service().settings, "prepared_graph_cache_size", DEFAULT_PREPARED_GRAPH_CACHE_SIZE
+        )
+        _prepared_graph_cache = PreparedGraphCache(maxsize=maxsize)
+    return _prepared_graph_cache
+
+
+def invalidate_prepared_graphs(flow_id: str) -> None:
+    """Drops the prepared graphs of a flow that was saved or deleted."""
+    if _prepared_graph_cache is not None:
+        _prepared_graph_cache.invalidate(flow_id)
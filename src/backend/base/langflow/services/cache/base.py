@@ -3,6 +3,8 @@ import asyncio
 import threading
 from typing import Generic, TypeVar
 
+from lfx.services.cache.utils import CACHE_MISS
+
 from langflow.services.base import Service
 
 LockType = TypeVar("LockType", bound=threading.Lock)
@@ -181,3 +183,35 @@ class ExternalAsyncBaseCacheService(AsyncBaseCacheService):
         Returns:
             True if the cache is connected, False otherwise.
         """
+
+    async def expire(self, *keys, lock: AsyncLockType | None = None) -> int:
+        """Restart the expiration time of keys without changing their values.
+
+        The default writes each value that is still cached back unchanged. Caches that can
+        refresh expiration times in place should override it.
+
+        Args:
+            keys: The keys of the items.
+            lock: A lock to use for the operation.
+
+        Returns:
+            How many of the keys were in the cache.
+        """
+        refreshed = 0
+        for key in keys:
+            value = await self.get(key, lock=lock)
+            if value is CACHE_MISS:
+                continue
+            await self.set(key, value, lock=lock)
+            refreshed += 1
+        return refreshed
+
+    async def delete_many(self, *keys, lock: AsyncLockType | None = None) -> None:
+        """Remove several items from the cache.
+
+        Args:
+            keys: The keys of the items to remove.
+            lock: A lock to use for the operation.
+        """
+        for key in keys:
+            await self.delete(key, lock=lock)
@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import pickle
 import threading
 import time
@@ -17,6 +18,7 @@ from langflow.services.cache.base import (
     ExternalAsyncBaseCacheService,
     LockType,
 )
+from langflow.services.cache.utils import estimate_size
 
 
 class ThreadingInMemoryCache(CacheService, Generic[LockType]):
@@ -286,6 +288,20 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
             return False
         return bool(await self._client.exists(str(key)))
 
+    @override
+    async def expire(self, *keys, lock=None) -> int:
+        if not keys:
+            return 0
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.expire(str(key), self.expiration_time)
+            return sum(await pipe.execute())
+
+    @override
+    async def delete_many(self, *keys, lock=None) -> None:
+        if keys:
+            await self._client.delete(*(str(key) for key in keys))
+
     def __repr__(self) -> str:
         """Return a string representation of the RedisCache instance."""
         return f"RedisCache(expiration_time={self.expiration_time})"
@@ -353,3 +369,203 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
 
     async def contains(self, key) -> bool:
         return key in self.cache
+
+
+class _CacheShard:
+    """The entries, lock and counters of one shard of a `ShardedMemoryCache`."""
+
+    def __init__(self) -> None:
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejections = 0
+
+    def pop(self, key) -> None:
+        if (item := self.entries.pop(key, None)) is not None:
+            self.nbytes -= item["size"]
+
+
+class ShardedMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
+    """An in-memory cache bounded by the approximate size of its entries.
+
+    Keys are spread over shards by hash, and each shard has its own lock, its own part of the
+    byte budget and its own least recently used order, so operations on different keys rarely
+    wait for each other. The size of each entry is estimated when it is set, in a thread for
+    anything larger than a scalar. Entries larger than a shard's budget, or made of too many
+    objects to size, are not cached. A background task drops expired entries every
+    `sweep_interval` seconds, so entries that are never read again don't keep using memory.
+
+    Attributes:
+        max_bytes (int): Approximate number of bytes the cache may use. 0 means no limit.
+        expiration_time (int): Time in seconds after which a cached item expires.
+        sweep_interval (float): Seconds between two sweeps of expired entries. 0 disables sweeping.
+    """
+
+    def __init__(
+        self, max_bytes: int = 512 * 1024 * 1024, shards: int = 16, expiration_time=3600, sweep_interval: float = 60
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.expiration_time = expiration_time
+        self.sweep_interval = sweep_interval
+        self._shards = [_CacheShard() for _ in range(max(shards, 1))]
+        self._shard_max_bytes = max_bytes // len(self._shards)
+        self._sweep_task: asyncio.Task | None = None
+
+    def _shard(self, key) -> _CacheShard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _is_expired(self, item: dict, now: float) -> bool:
+        return self.expiration_time is not None and now - item["time"] >= self.expiration_time
+
+    def _get(self, key):
+        shard = self._shard(key)
+        with shard.lock:
+            item = shard.entries.get(key)
+            if item is not None and self._is_expired(item, time.time()):
+                shard.pop(key)
+                shard.expirations += 1
+                item = None
+            if item is None:
+                shard.misses += 1
+                return CACHE_MISS
+            shard.entries.move_to_end(key)
+            shard.hits += 1
+            value = item["value"]
+        return pickle.loads(value) if isinstance(value, bytes) else value
+
+    async def _estimate_size(self, value) -> int:
+        limit = self._shard_max_bytes or None
+        if isinstance(value, str | bytes | int | float | bool | None):
+            return estimate_size(value, limit=limit)
+        # Walking a large value takes a while, so keep it off the event loop
+        return await asyncio.to_thread(estimate_size, value, limit=limit)
+
+    def _set(self, key, value, size: int) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            shard.pop(key)
+            if self._shard_max_bytes and size > self._shard_max_bytes:
+                shard.rejections += 1
+                return
+            while self._shard_max_bytes and shard.entries and shard.nbytes + size > self._shard_max_bytes:
+                _, evicted = shard.entries.popitem(last=False)
+                shard.nbytes -= evicted["size"]
+                shard.evictions += 1
+            shard.entries[key] = {"value": value, "time": time.time(), "size": size}
+            shard.nbytes += size
+
+    async def get(self, key, lock: asyncio.Lock | None = None):
+        if lock is None:
+            return self._get(key)
+        async with lock:
+            return self._get(key)
+
+    async def set(self, key, value, lock: asyncio.Lock | None = None) -> None:
+        self._ensure_sweeping()
+        size = await self._estimate_size(value)
+        if lock is None:
+            self._set(key, value, size)
+            return
+        async with lock:
+            self._set(key, value, size)
+
+    async def upsert(self, key, value, lock: asyncio.Lock | None = None) -> None:
+        existing_value = await self.get(key, lock)
+        if existing_value is not CACHE_MISS and isinstance(existing_value, dict) and isinstance(value, dict):
+            existing_value.update(value)
+            value = existing_value
+        await self.set(key, value, lock)
+
+    async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
+        shard = self._shard(key)
+        if lock is None:
+            with shard.lock:
+                shard.pop(key)
+            return
+        async with lock:
+            with shard.lock:
+                shard.pop(key)
+
+    async def clear(self, lock: asyncio.Lock | None = None) -> None:  # noqa: ARG002
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.nbytes = 0
+
+    async def contains(self, key) -> bool:
+        shard = self._shard(key)
+        with shard.lock:
+            item = shard.entries.get(key)
+            return item is not None and not self._is_expired(item, time.time())
+
+    def sweep(self) -> int:
+        """Drops the expired entries of every shard and returns how many were dropped."""
+        if self.expiration_time is None:
+            return 0
+        dropped = 0
+        for shard in self._shards:
+            with shard.lock:
+                now = time.time()
+                expired = [key for key, item in shard.entries.items() if self._is_expired(item, now)]
+                for key in expired:
+                    shard.pop(key)
+                shard.expirations += len(expired)
+                dropped += len(expired)
+        return dropped
+
+    def _ensure_sweeping(self) -> None:
+        if self.sweep_interval and (self._sweep_task is None or self._sweep_task.done()):
+            self._sweep_task = asyncio.create_task(self._sweep_periodically())
+
+    async def _sweep_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                if dropped := self.sweep():
+                    await logger.adebug(f"Dropped {dropped} expired cache entries")
+            except Exception:  # noqa: BLE001
+                await logger.aexception("Error sweeping expired cache entries")
+
+    def stats(self) -> dict[str, int]:
+        """Returns the number of entries, their approximate size in bytes and the hit, miss and eviction counts."""
+        stats = {
+            "entries": 0,
+            "bytes": 0,
+            "max_bytes": self.max_bytes,
+            "shards": len(self._shards),
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "rejections": 0,
+        }
+        for shard in self._shards:
+            with shard.lock:
+                stats["entries"] += len(shard.entries)
+                stats["bytes"] += shard.nbytes
+                stats["hits"] += shard.hits
+                stats["misses"] += shard.misses
+                stats["evictions"] += shard.evictions
+                stats["expirations"] += shard.expirations
+                stats["rejections"] += shard.rejections
+        return stats
+
+    async def teardown(self) -> None:
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sweep_task
+            self._sweep_task = None
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def __repr__(self) -> str:
+        return (
+            f"ShardedMemoryCache(max_bytes={self.max_bytes}, shards={len(self._shards)}, "
+            f"expiration_time={self.expiration_time})"
+        )
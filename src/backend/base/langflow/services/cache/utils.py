@@ -1,7 +1,10 @@
 import base64
 import contextlib
 import hashlib
+import sys
 import tempfile
+import types
+from collections import deque
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -156,3 +159,55 @@ def update_build_status(cache_service, flow_id: str, status: "BuildStatus") -> N
     cache_service[flow_id] = cached_flow
     cached_flow["status"] = status
     cache_service[flow_id] = cached_flow
+
+
+# Objects shared by everything cached, which are not part of an entry's size
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+# Even at the smallest object size, this many objects is about the default budget of a cache shard
+MAX_SIZED_OBJECTS = 1_000_000
+
+
+def estimate_size(value: Any, max_objects: int = MAX_SIZED_OBJECTS, limit: int | None = None) -> int:
+    """Approximate number of bytes used by `value` and the objects it references.
+
+    Follows containers, instance attributes and slots, counting each object once. Classes, modules and
+    functions are shared with the rest of the process and are not counted. Stops as soon as the size
+    exceeds `limit`. Values made of more than `max_objects` objects are reported as `sys.maxsize`
+    rather than partially counted, so callers with a byte budget treat them as over it. Containers
+    that change while they are walked are skipped, so this can run in a thread while the value is used.
+    """
+    seen: set[int] = set()
+    to_visit = [value]
+    size = 0
+    while to_visit:
+        if limit is not None and size > limit:
+            return size
+        if len(seen) >= max_objects:
+            return sys.maxsize
+        obj = to_visit.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        try:
+            size += sys.getsizeof(obj)
+        except TypeError:
+            continue
+        if isinstance(obj, str | bytes | bytearray | int | float | bool | None):
+            continue
+        try:
+            if isinstance(obj, dict):
+                to_visit.extend(obj.keys())
+                to_visit.extend(obj.values())
+            elif isinstance(obj, list | tuple | set | frozenset | deque):
+                to_visit.extend(obj)
+        except RuntimeError:
+            # The container changed size while it was walked
+            continue
+        instance_dict = getattr(obj, "__dict__", None)
+        if isinstance(instance_dict, dict):
+            to_visit.append(instance_dict)
+        slots = getattr(type(obj), "__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            with contextlib.suppress(AttributeError, TypeError):
+                to_visit.append(getattr(obj, slot))
+    return size
@@ -1,10 +1,16 @@
 import asyncio
+import uuid
+import weakref
 from collections import defaultdict
 from threading import RLock
 from typing import Any
 
+from lfx.graph.graph.base import Graph
+from lfx.graph.graph.checkpoint import GraphCheckpoint, get_run_state, get_vertex_delta, restore_graph
+from lfx.services.cache.utils import CACHE_MISS
+
 from langflow.services.base import Service
-from langflow.services.cache.base import AsyncBaseCacheService, CacheService
+from langflow.services.cache.base import AsyncBaseCacheService, CacheService, ExternalAsyncBaseCacheService
 from langflow.services.deps import get_cache_service
 
 
@@ -17,6 +23,16 @@ class ChatService(Service):
         self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
+        # Graph checkpoints written by this process, by cache key, with the graph they track
+        self._graph_checkpoints: dict[str, tuple[weakref.ref[Graph], GraphCheckpoint]] = {}
+
+    @property
+    def checkpoints_graphs(self) -> bool:
+        """Whether graphs are stored as incremental checkpoints instead of being pickled whole.
+
+        Only external caches serialize what they store, so in-memory caches keep the graph itself.
+        """
+        return isinstance(self.cache_service, ExternalAsyncBaseCacheService)
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
         """Set the cache for a client.
@@ -29,6 +45,8 @@ class ChatService(Service):
         Returns:
             bool: True if the cache was set successfully, False otherwise.
         """
+        if isinstance(data, Graph) and self.checkpoints_graphs:
+            return await self._set_graph_checkpoint(str(key), data, lock=lock or self.async_cache_locks[key])
         result_dict = {
             "result": data,
             "type": type(data),
@@ -52,7 +70,10 @@ class ChatService(Service):
             Any: The cached data.
         """
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
+            value = await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
+            if isinstance(value, dict) and isinstance(value.get("result"), GraphCheckpoint):
+                return await self._restore_graph_checkpoint(str(key), value["result"])
+            return value
         return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
 
     async def clear_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
@@ -62,6 +83,70 @@ class ChatService(Service):
             key (str): The cache key.
             lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
         """
+        self._graph_checkpoints.pop(str(key), None)
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
+            lock = lock or self.async_cache_locks[key]
+            checkpoint = await self._get_stored_checkpoint(str(key), lock=lock) if self.checkpoints_graphs else None
+            if checkpoint is not None:
+                await self.cache_service.delete_many(*checkpoint.part_keys(), lock=lock)
+            return await self.cache_service.delete(key, lock=lock)
         return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
+
+    async def _set_graph_checkpoint(self, key: str, graph: Graph, lock: asyncio.Lock) -> bool:
+        """Stores `graph` as a checkpoint: topology once, then only what changed since the last call."""
+        graph_ref, checkpoint = self._graph_checkpoints.get(key, (None, None))
+        cache_service = self.cache_service
+        replaced = None
+        if checkpoint is None or graph_ref is None or graph_ref() is not graph:
+            # The first write of a graph stores all of it, later writes only store deltas on top
+            replaced = await self._get_stored_checkpoint(key, lock=lock)
+            checkpoint = GraphCheckpoint(key=key, checkpoint_id=uuid.uuid4().hex)
+            graph.consume_changed_vertices()
+            await cache_service.set(checkpoint.topology_key(), graph, lock=lock)
+            self._graph_checkpoints[key] = (weakref.ref(graph), checkpoint)
+        else:
+            changed_vertex_ids = graph.consume_changed_vertices()
+            # The topology and the deltas written earlier must live as long as the checkpoint that refers to them
+            await cache_service.expire(
+                checkpoint.topology_key(),
+                *(checkpoint.vertex_key(vertex_id) for vertex_id in checkpoint.vertex_ids - changed_vertex_ids),
+                lock=lock,
+            )
+            for vertex_id in changed_vertex_ids:
+                vertex = graph.vertex_map.get(vertex_id)
+                if vertex is None:
+                    continue
+                await cache_service.set(checkpoint.vertex_key(vertex_id), get_vertex_delta(vertex), lock=lock)
+                checkpoint.vertex_ids.add(vertex_id)
+        await cache_service.set(checkpoint.state_key(), get_run_state(graph), lock=lock)
+        await cache_service.set(key, {"result": checkpoint, "type": Graph}, lock=lock)
+        if replaced is not None:
+            # Nothing refers to the parts of the replaced checkpoint anymore
+            await cache_service.delete_many(*replaced.part_keys(), lock=lock)
+        return await cache_service.contains(key)
+
+    async def _get_stored_checkpoint(self, key: str, lock: asyncio.Lock) -> GraphCheckpoint | None:
+        """Returns the checkpoint stored under `key`, which may have been written by another process."""
+        value = await self.cache_service.get(key, lock=lock)
+        if isinstance(value, dict) and isinstance(value.get("result"), GraphCheckpoint):
+            return value["result"]
+        return None
+
+    async def _restore_graph_checkpoint(self, key: str, checkpoint: GraphCheckpoint) -> Any:
+        """Rebuilds the graph of a checkpoint, returning a cache miss if any part of it expired."""
+        cache_service = self.cache_service
+        lock = self.async_cache_locks[key]
+        topology = await cache_service.get(checkpoint.topology_key(), lock=lock)
+        state = await cache_service.get(checkpoint.state_key(), lock=lock)
+        if topology is CACHE_MISS or state is CACHE_MISS:
+            return CACHE_MISS
+        vertex_deltas = {}
+        for vertex_id in checkpoint.vertex_ids:
+            delta = await cache_service.get(checkpoint.vertex_key(vertex_id), lock=lock)
+            if delta is CACHE_MISS:
+                return CACHE_MISS
+            vertex_deltas[vertex_id] = delta
+        graph = restore_graph(topology, state, vertex_deltas)
+        # Later writes of the restored graph continue the same checkpoint
+        self._graph_checkpoints[key] = (weakref.ref(graph), checkpoint)
+        return {"result": graph, "type": Graph}
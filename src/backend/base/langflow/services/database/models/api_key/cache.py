@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from langflow.services.database.models.user.model import User
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+@dataclass
+class _CachedKey:
+    api_key_id: UUID
+    user_id: UUID
+    user_data: dict[str, Any]
+    expires_at: float
+
+
+class ApiKeyCache:
+    """Maps verified API keys to their users for a limited time, so repeated requests skip the database.
+
+    Keys are stored as SHA-256 digests, never in clear. Entries expire `ttl` seconds after they are
+    added, and are dropped right away, in this process, when their key is deleted or their user is
+    updated or deleted. Each hit returns a new, detached `User`.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: dict[str, _CachedKey] = {}
+
+    @staticmethod
+    def _digest(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode()).hexdigest()
+
+    def get(self, api_key: str) -> tuple[UUID, User] | None:
+        """Returns the id of the key and its user, or None if the key isn't cached."""
+        digest = self._digest(api_key)
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._entries.pop(digest, None)
+            return None
+        return entry.api_key_id, User.model_validate(entry.user_data)
+
+    def set(self, api_key: str, api_key_id: UUID, user: User, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        if len(self._entries) >= self.max_entries:
+            self._evict()
+        self._entries[self._digest(api_key)] = _CachedKey(
+            api_key_id=api_key_id,
+            user_id=user.id,
+            user_data=user.model_dump(),
+            expires_at=time.monotonic() + ttl,
+        )
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for digest in [digest for digest, entry in self._entries.items() if entry.expires_at <= now]:
+            del self._entries[digest]
+        while len(self._entries) >= self.max_entries:
+            # Dicts keep insertion order, so this drops the oldest entry
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate_key(self, api_key: str) -> None:
+        self._entries.pop(self._digest(api_key), None)
+
+    def invalidate_user(self, user_id: UUID | str) -> None:
+        user_id = str(user_id)
+        for digest in [digest for digest, entry in self._entries.items() if str(entry.user_id) == user_id]:
+            del self._entries[digest]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Create a global instance of the cache
+api_key_cache = ApiKeyCache()
@@ -5,9 +5,10 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlmodel import col, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from langflow.services.database.models.api_key.cache import api_key_cache
 from langflow.services.database.models.api_key.model import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
 from langflow.services.database.models.user.model import User
 from langflow.services.deps import get_settings_service
@@ -47,6 +48,17 @@ async def delete_api_key(session: AsyncSession, api_key_id: UUID) -> None:
         msg = "API Key not found"
         raise ValueError(msg)
     await session.delete(api_key)
+    api_key_cache.invalidate_key(api_key.api_key)
+
+
+async def record_api_key_uses(session: AsyncSession, uses: dict[UUID, tuple[int, datetime.datetime]]) -> None:
+    """Adds `count` to the total uses of each key and sets its last use, with one update per key."""
+    for api_key_id, (count, last_used_at) in uses.items():
+        await session.exec(
+            update(ApiKey)
+            .where(col(ApiKey.id) == api_key_id)
+            .values(total_uses=col(ApiKey.total_uses) + count, last_used_at=last_used_at)
+        )
 
 
 async def check_key(session: AsyncSession, api_key: str) -> User | None:
@@ -69,19 +81,46 @@ async def check_key(session: AsyncSession, api_key: str) -> User | None:
 
 
 async def _check_key_from_db(session: AsyncSession, api_key: str, settings_service) -> User | None:
-    """Validate API key against the database."""
+    """Validate API key against the database.
+
+    Verified keys are cached for `api_key_cache_ttl` seconds. While the write-behind logger runs,
+    uses are counted in memory and written periodically, one update per key, instead of on every
+    request.
+    """
+    track_usage = settings_service.settings.disable_track_apikey_usage is not True
+    cached = api_key_cache.get(api_key)
+    if cached is not None:
+        api_key_id, user = cached
+        if track_usage:
+            await _record_use(session, api_key_id)
+        return user
+
     query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
     api_key_object: ApiKey | None = (await session.exec(query)).first()
     if api_key_object is not None:
-        if settings_service.settings.disable_track_apikey_usage is not True:
-            api_key_object.total_uses += 1
-            api_key_object.last_used_at = datetime.datetime.now(datetime.timezone.utc)
-            session.add(api_key_object)
-            await session.flush()
+        if track_usage:
+            await _record_use(session, api_key_object.id, api_key_object)
+        api_key_cache.set(api_key, api_key_object.id, api_key_object.user, settings_service.settings.api_key_cache_ttl)
         return api_key_object.user
     return None
 
 
+async def _record_use(session: AsyncSession, api_key_id: UUID, api_key_object: ApiKey | None = None) -> None:
+    # Imported here because the write-behind logger imports this module
+    from langflow.services.database.write_behind import write_behind_logger
+
+    if write_behind_logger.is_running():
+        write_behind_logger.add_api_key_use(api_key_id)
+        return
+    if api_key_object is None:
+        await record_api_key_uses(session, {api_key_id: (1, datetime.datetime.now(datetime.timezone.utc))})
+        return
+    api_key_object.total_uses += 1
+    api_key_object.last_used_at = datetime.datetime.now(datetime.timezone.utc)
+    session.add(api_key_object)
+    await session.flush()
+
+
 async def _check_key_from_env(session: AsyncSession, api_key: str, settings_service) -> User | None:
     """Validate API key against the environment variable.
 
@@ -1,6 +1,13 @@
+import base64
+import binascii
+import json
+from datetime import datetime, timezone
 from uuid import UUID
 
 from lfx.utils.async_helpers import run_until_complete
+from sqlalchemy import and_, or_
+from sqlmodel import col
+from sqlmodel.sql.expression import SelectOfScalar
 
 from langflow.services.database.models.message.model import MessageTable, MessageUpdate
 from langflow.services.deps import session_scope
@@ -25,3 +32,58 @@ async def _update_message(message_id: UUID | str, message: MessageUpdate | dict)
 def update_message(message_id: UUID | str, message: MessageUpdate | dict):
     """DEPRECATED - Kept for backward compatibility. Do not use."""
     return run_until_complete(_update_message(message_id, message))
+
+
+def encode_cursor(values: list) -> str:
+    """Encodes the sort key of the last row of a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor: str, length: int) -> list:
+    """Decodes a cursor made by `encode_cursor`, raising ValueError unless it holds `length` values."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        msg = "Invalid cursor"
+        raise ValueError(msg) from e
+    if not isinstance(values, list) or len(values) != length:
+        msg = "Invalid cursor"
+        raise ValueError(msg)
+    return values
+
+
+def _naive_utc(value: datetime) -> datetime:
+    # Message timestamps are stored without a timezone, in UTC
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def encode_message_cursor(message: MessageTable) -> str:
+    return encode_cursor([_naive_utc(message.timestamp).isoformat(), str(message.id)])
+
+
+def paginate_messages_query(
+    stmt: SelectOfScalar[MessageTable], *, cursor: str | None = None, limit: int | None = None
+) -> SelectOfScalar[MessageTable]:
+    """Orders `stmt` by (timestamp, id) and keeps the rows after `cursor`.
+
+    With a limit, one extra row is selected so callers can tell whether there is a next page.
+    """
+    stmt = stmt.order_by(col(MessageTable.timestamp), col(MessageTable.id))
+    if cursor:
+        try:
+            timestamp_str, id_str = decode_cursor(cursor, 2)
+            timestamp, message_id = _naive_utc(datetime.fromisoformat(timestamp_str)), UUID(id_str)
+        except (TypeError, ValueError) as e:
+            msg = "Invalid cursor"
+            raise ValueError(msg) from e
+        stmt = stmt.where(
+            or_(
+                col(MessageTable.timestamp) > timestamp,
+                and_(col(MessageTable.timestamp) == timestamp, col(MessageTable.id) > message_id),
+            )
+        )
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    return stmt
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Annotated
 from uuid import UUID, uuid4
 
 from pydantic import ConfigDict, field_serializer, field_validator
-from sqlalchemy import Text
+from sqlalchemy import Index, Text
 from sqlmodel import JSON, Column, Field, SQLModel
 
 from langflow.schema.content_block import ContentBlock
@@ -126,6 +126,11 @@ class MessageBase(SQLModel):
 class MessageTable(MessageBase, table=True):  # type: ignore[call-arg]
     model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
     __tablename__ = "message"
+    # Keyset pagination walks a flow's sessions, and a session's messages, in (timestamp, id) order
+    __table_args__ = (
+        Index("ix_message_flow_id_session_id_timestamp_id", "flow_id", "session_id", "timestamp", "id"),
+        Index("ix_message_session_id_timestamp_id", "session_id", "timestamp", "id"),
+    )
     id: UUID = Field(default_factory=uuid4, primary_key=True)
 
     flow_id: UUID | None = Field(default=None)
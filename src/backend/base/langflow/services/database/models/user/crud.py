@@ -8,6 +8,7 @@ from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from langflow.services.database.models.api_key.cache import api_key_cache
 from langflow.services.database.models.user.model import User, UserUpdate
 
 
@@ -49,6 +50,8 @@ async def update_user(user_db: User | None, user: UserUpdate, db: AsyncSession)
     except IntegrityError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
+    # API keys cached for this user must pick up changes such as deactivation
+    api_key_cache.invalidate_user(user_db.id)
     return user_db
 
 
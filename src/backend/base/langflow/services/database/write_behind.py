@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from lfx.log.logger import logger
+
+from langflow.services.database.models.api_key.crud import record_api_key_uses
+from langflow.services.deps import get_settings_service, session_scope
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+
+class WriteBehindLogger:
+    """Counts API key uses in memory and writes them to the database in batches.
+
+    Uses are counted per key and written as one update per key. The counts are written when
+    `db_write_behind_batch_size` keys have uses waiting or every `db_write_behind_flush_interval`
+    seconds, whichever comes first. `stop` writes whatever is still counted.
+    """
+
+    def __init__(self) -> None:
+        self._api_key_uses: dict[UUID, tuple[int, datetime]] = {}
+        self._flush_event: asyncio.Event | None = None
+        self._stop_event: asyncio.Event | None = None
+        self._flush_lock: asyncio.Lock | None = None
+        self._task: asyncio.Task | None = None
+        self._batch_size = 1
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> int:
+        """Number of API keys with uses waiting to be written."""
+        return len(self._api_key_uses)
+
+    async def start(self) -> None:
+        """Start the background writer."""
+        if self.is_running():
+            await logger.awarning("Write-behind logger is already running")
+            return
+        self._batch_size = get_settings_service().settings.db_write_behind_batch_size
+        self._flush_event = asyncio.Event()
+        self._stop_event = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run())
+        await logger.adebug("Started write-behind logger")
+
+    async def stop(self) -> None:
+        """Stop the background writer, writing every counted use first."""
+        if self._task is None or self._stop_event is None:
+            await logger.awarning("Write-behind logger is not running")
+            return
+        await logger.adebug("Stopping write-behind logger...")
+        self._stop_event.set()
+        await self._task
+        self._task = None
+        await self.flush()
+        await logger.adebug("Write-behind logger stopped")
+
+    def add_api_key_use(self, api_key_id: UUID) -> None:
+        """Count a use of an API key. Never waits on the database."""
+        count, _ = self._api_key_uses.get(api_key_id, (0, None))
+        self._api_key_uses[api_key_id] = (count + 1, datetime.now(timezone.utc))
+        if len(self._api_key_uses) >= self._batch_size and self._flush_event is not None:
+            self._flush_event.set()
+
+    async def flush(self) -> None:
+        """Write every counted use, one update per used API key."""
+        async with self._lock():
+            api_key_uses, self._api_key_uses = self._api_key_uses, {}
+            if not api_key_uses:
+                return
+            try:
+                async with session_scope() as session:
+                    await record_api_key_uses(session, api_key_uses)
+            except Exception as exc:  # noqa: BLE001
+                await logger.aerror(f"Error recording API key uses: {exc!s}")
+
+    def _lock(self) -> asyncio.Lock | contextlib.nullcontext:
+        return self._flush_lock if self._flush_lock is not None else contextlib.nullcontext()
+
+    async def _run(self) -> None:
+        """Write counted uses until stopped."""
+        settings = get_settings_service().settings
+        while self._stop_event is not None and not self._stop_event.is_set():
+            flush_task = asyncio.create_task(self._flush_event.wait())
+            stop_task = asyncio.create_task(self._stop_event.wait())
+            _, pending = await asyncio.wait(
+                [flush_task, stop_task],
+                timeout=settings.db_write_behind_flush_interval,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in pending:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+            if self._stop_event.is_set():
+                break
+            self._flush_event.clear()
+
+            try:
+                await self.flush()
+            except Exception as exc:  # noqa: BLE001
+                await logger.aerror(f"Error in write-behind logger: {exc!s}")
+
+
+# Create a global instance of the logger
+write_behind_logger = WriteBehindLogger()
@@ -0,0 +1,133 @@
+"""Shared storage for the events of build jobs, so that any worker can serve them.
+
+The job itself still runs on the worker that started it. That worker copies the events of the
+job from its local queue to a `JobEventBackend`, where other workers read them from a given event
+id onwards and can ask for the job to be cancelled.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class StoredEvent(NamedTuple):
+    """An event read from a backend. `data` is None for the end of the job's events."""
+
+    event_id: str
+    data: bytes | None
+
+
+class JobEventBackend(ABC):
+    """Where the events of build jobs are stored for readers on any worker."""
+
+    @abstractmethod
+    async def register(self, job_id: str) -> None:
+        """Records that `job_id` exists, before any of its events are appended."""
+
+    @abstractmethod
+    async def append(self, job_id: str, events: Sequence[bytes | None]) -> None:
+        """Appends events in order. None marks the end of the job's events."""
+
+    @abstractmethod
+    async def read(self, job_id: str, last_event_id: str | None = None, timeout: float = 0) -> list[StoredEvent]:
+        """Returns the events after `last_event_id` (all of them when None).
+
+        Waits up to `timeout` seconds for the first one when there are none yet.
+
+        Raises:
+            JobQueueNotFoundError: If the job is unknown or expired.
+        """
+
+    @abstractmethod
+    async def request_cancel(self, job_id: str) -> None:
+        """Asks the worker running `job_id` to cancel it.
+
+        Raises:
+            JobQueueNotFoundError: If the job is unknown or expired.
+        """
+
+    @abstractmethod
+    async def is_cancel_requested(self, job_id: str) -> bool: ...
+
+    async def close(self) -> None:  # noqa: B027
+        """Releases the backend's connections."""
+
+
+class RedisJobEventBackend(JobEventBackend):
+    """Stores each job's events in a Redis stream.
+
+    Every key expires `ttl` seconds after the job's last event, and a stream keeps about the last
+    `max_events` events.
+    """
+
+    def __init__(self, client, *, ttl: int = 3600, max_events: int = 10_000, prefix: str = "langflow:job") -> None:
+        self._client = client
+        self.ttl = ttl
+        self.max_events = max_events
+        self.prefix = prefix
+
+    @classmethod
+    def from_settings(cls, settings) -> RedisJobEventBackend:
+        # Redis is a main dependency, no need to import check
+        from redis.asyncio import StrictRedis
+
+        if settings.redis_url:
+            client = StrictRedis.from_url(settings.redis_url)
+        else:
+            client = StrictRedis(host=settings.redis_host, port=settings.redis_port, db=settings.redis_db)
+        return cls(client, ttl=settings.job_queue_event_ttl, max_events=settings.job_queue_max_events)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}:{job_id}"
+
+    def _stream_key(self, job_id: str) -> str:
+        return f"{self.prefix}:{job_id}:events"
+
+    def _cancel_key(self, job_id: str) -> str:
+        return f"{self.prefix}:{job_id}:cancel"
+
+    async def _ensure_exists(self, job_id: str) -> None:
+        from langflow.services.job_queue.service import JobQueueNotFoundError
+
+        if not await self._client.exists(self._job_key(job_id)):
+            raise JobQueueNotFoundError(job_id)
+
+    async def register(self, job_id: str) -> None:
+        await self._client.set(self._job_key(job_id), b"1", ex=self.ttl)
+
+    async def append(self, job_id: str, events: Sequence[bytes | None]) -> None:
+        if not events:
+            return
+        stream_key = self._stream_key(job_id)
+        async with self._client.pipeline(transaction=False) as pipe:
+            for data in events:
+                fields = {b"end": b"1"} if data is None else {b"data": data}
+                pipe.xadd(stream_key, fields, maxlen=self.max_events, approximate=True)
+            pipe.expire(stream_key, self.ttl)
+            pipe.expire(self._job_key(job_id), self.ttl)
+            await pipe.execute()
+
+    async def read(self, job_id: str, last_event_id: str | None = None, timeout: float = 0) -> list[StoredEvent]:
+        await self._ensure_exists(job_id)
+        block = int(timeout * 1000) or None
+        response = await self._client.xread({self._stream_key(job_id): last_event_id or "0-0"}, block=block)
+        events: list[StoredEvent] = []
+        for _stream, entries in response or []:
+            for entry_id, fields in entries:
+                event_id = entry_id.decode() if isinstance(entry_id, bytes) else str(entry_id)
+                events.append(StoredEvent(event_id, fields.get(b"data")))
+        return events
+
+    async def request_cancel(self, job_id: str) -> None:
+        await self._ensure_exists(job_id)
+        await self._client.set(self._cancel_key(job_id), b"1", ex=self.ttl)
+
+    async def is_cancel_requested(self, job_id: str) -> bool:
+        return bool(await self._client.exists(self._cancel_key(job_id)))
+
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -1,11 +1,34 @@
-from langflow.services.base import Service
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
 from langflow.services.factory import ServiceFactory
 from langflow.services.job_queue.service import JobQueueService
 
+if TYPE_CHECKING:
+    from lfx.services.settings.service import SettingsService
+
+    from langflow.services.telemetry.service import TelemetryService
+
 
 class JobQueueServiceFactory(ServiceFactory):
     def __init__(self):
         super().__init__(JobQueueService)
 
-    def create(self) -> Service:
-        return JobQueueService()
+    @override
+    def create(self, settings_service: SettingsService, telemetry_service: TelemetryService):
+        settings = settings_service.settings
+        event_backend = None
+        if settings.job_queue_backend == "redis":
+            from langflow.services.job_queue.backends import RedisJobEventBackend
+
+            event_backend = RedisJobEventBackend.from_settings(settings)
+        return JobQueueService(
+            event_backend=event_backend,
+            event_queue_max_size=settings.event_queue_max_size,
+            event_queue_policy=settings.event_queue_overflow_policy,
+            event_queue_spill_dir=settings.event_queue_spill_dir,
+            telemetry=telemetry_service.ot,
+        )
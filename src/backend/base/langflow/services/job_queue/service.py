@@ -1,12 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import weakref
+from typing import TYPE_CHECKING
 
+from lfx.events.bounded_queue import BoundedEventQueue
 from lfx.log.logger import logger
 
 from langflow.events.event_manager import EventManager
 from langflow.services.base import Service
 
+if TYPE_CHECKING:
+    from lfx.events.bounded_queue import OverflowPolicy
+
+    from langflow.services.job_queue.backends import JobEventBackend, StoredEvent
+    from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
 
 class JobQueueNotFoundError(Exception):
     """Exception raised when a job queue is not found."""
@@ -47,6 +57,12 @@ class JobQueueService(Service):
               * Related systems to finish their work
               * Inspection or recovery if needed
             Default is 300 seconds (5 minutes).
+        _event_backend (JobEventBackend | None): Shared storage for job events. When set, the events of
+            each job started here are copied to it from the job's queue, so they can be read, from any
+            worker, with `read_events`, and the job can be cancelled from any worker with `request_cancel`.
+            When None (the default), events are only available from the job's queue, on this worker.
+        _event_queue_max_size (int): Number of events each job's queue keeps in memory, 0 for no limit.
+        _event_queue_policy (OverflowPolicy): What a full job queue does with more events, see BoundedEventQueue.
 
     Example:
         service = JobQueueService()
@@ -61,17 +77,50 @@ class JobQueueService(Service):
 
     name = "job_queue_service"
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        event_backend: JobEventBackend | None = None,
+        cancel_poll_interval: float = 1.0,
+        *,
+        event_queue_max_size: int = 0,
+        event_queue_policy: OverflowPolicy = "block",
+        event_queue_spill_dir: str | None = None,
+        telemetry: OpenTelemetry | None = None,
+    ) -> None:
         """Initialize the JobQueueService.
 
         Sets up the internal registry for job queues, initializes the cleanup task, and sets the service state
         to active.
+
+        Args:
+            event_backend: Shared storage for job events, or None to keep them on this worker.
+            cancel_poll_interval: How often, in seconds, jobs running here check the event backend for
+                cancellation requests from other workers.
+            event_queue_max_size: Number of events each event queue keeps in memory, 0 for no limit.
+            event_queue_policy: What a full event queue does with more events.
+            event_queue_spill_dir: Directory of the files events are spilled to with the "spill" policy.
+            telemetry: Where the depth of event queues and their overflowing events are reported, if anywhere.
         """
         self._queues: dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]] = {}
+        self._forwarders: dict[str, asyncio.Task] = {}
+        self._event_backend = event_backend
+        self._cancel_poll_interval = cancel_poll_interval
+        self._event_queue_max_size = event_queue_max_size
+        self._event_queue_policy = event_queue_policy
+        self._event_queue_spill_dir = event_queue_spill_dir
+        self._telemetry = telemetry
+        # Live event queues by kind, to report their depth
+        self._event_queues: dict[str, weakref.WeakSet[BoundedEventQueue]] = {}
+        self._metrics_task: asyncio.Task | None = None
         self._cleanup_task: asyncio.Task | None = None
         self._closed = False
         self.ready = False
         self.CLEANUP_GRACE_PERIOD = 300  # 5 minutes before cleaning up marked tasks
+        self.QUEUE_DEPTH_REPORT_INTERVAL = 5
+
+    @property
+    def event_backend(self) -> JobEventBackend | None:
+        return self._event_backend
 
     def is_started(self) -> bool:
         """Check if the JobQueueService has started.
@@ -94,6 +143,8 @@ class JobQueueService(Service):
         """
         self._closed = False
         self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
+        if self._telemetry is not None:
+            self._metrics_task = asyncio.create_task(self._report_queue_depth())
         logger.debug("JobQueueService started: periodic cleanup task initiated.")
 
     async def stop(self) -> None:
@@ -113,10 +164,19 @@ class JobQueueService(Service):
                 exc = self._cleanup_task.exception()
                 if exc is not None:
                     raise exc
+        if self._metrics_task:
+            self._metrics_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._metrics_task
 
         # Clean up each registered job queue.
         for job_id in list(self._queues.keys()):
             await self.cleanup_job(job_id)
+        for forwarder in self._forwarders.values():
+            forwarder.cancel()
+        self._forwarders.clear()
+        if self._event_backend is not None:
+            await self._event_backend.close()
         await logger.adebug("JobQueueService stopped: all job queues have been cleaned up.")
 
     async def teardown(self) -> None:
@@ -142,7 +202,7 @@ class JobQueueService(Service):
             msg = f"Queue for job_id {job_id} already exists"
             raise ValueError(msg)
 
-        main_queue: asyncio.Queue = asyncio.Queue()
+        main_queue = self.create_event_queue("build")
         event_manager: EventManager = self._create_default_event_manager(main_queue)
 
         # Register the queue without an active task.
@@ -150,6 +210,39 @@ class JobQueueService(Service):
         logger.debug(f"Queue and event manager successfully created for job_id {job_id}")
         return main_queue, event_manager
 
+    def create_event_queue(self, kind: str) -> BoundedEventQueue:
+        """Create an event queue bounded as configured, whose depth and overflow are reported under `kind`.
+
+        Used for the queues of jobs, and for the events of streamed runs, which are not jobs.
+        """
+        queue = BoundedEventQueue(
+            self._event_queue_max_size,
+            self._event_queue_policy,
+            spill_dir=self._event_queue_spill_dir,
+            on_overflow=lambda reason: self._count_overflow(kind, reason),
+        )
+        self._event_queues.setdefault(kind, weakref.WeakSet()).add(queue)
+        return queue
+
+    def _count_overflow(self, kind: str, reason: str) -> None:
+        if self._telemetry is None:
+            return
+        try:
+            self._telemetry.increment_counter("event_queue_overflow_events", {"queue": kind, "reason": reason})
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Could not count an overflowing event: {exc}")
+
+    async def _report_queue_depth(self) -> None:
+        """Report the number of events waiting in all event queues of each kind, every few seconds."""
+        while not self._closed:
+            for kind, queues in self._event_queues.items():
+                depth = sum(queue.qsize() for queue in list(queues))
+                try:
+                    self._telemetry.update_gauge("event_queue_depth", depth, {"queue": kind})
+                except Exception as exc:  # noqa: BLE001
+                    await logger.adebug(f"Could not report the depth of {kind} event queues: {exc}")
+            await asyncio.sleep(self.QUEUE_DEPTH_REPORT_INTERVAL)
+
     def start_job(self, job_id: str, task_coro) -> None:
         """Start an asynchronous task for a given job, replacing any existing active task.
 
@@ -182,8 +275,84 @@ class JobQueueService(Service):
         # Initiate the new asynchronous task.
         task = asyncio.create_task(task_coro)
         self._queues[job_id] = (main_queue, event_manager, task, None)
+        if self._event_backend is not None and job_id not in self._forwarders:
+            self._forwarders[job_id] = asyncio.create_task(self._forward_events(job_id, main_queue))
         logger.debug(f"New task started for job_id {job_id}")
 
+    async def register_job(self, job_id: str) -> None:
+        """Make a job known to the event backend, so other workers can read its events right away.
+
+        Does nothing without an event backend.
+        """
+        if self._event_backend is not None:
+            await self._event_backend.register(job_id)
+
+    def is_local_job(self, job_id: str) -> bool:
+        """Whether the job was started by this service, on this worker."""
+        return job_id in self._queues
+
+    async def read_events(self, job_id: str, last_event_id: str | None = None, timeout: float = 0) -> list[StoredEvent]:
+        """Read a job's events after `last_event_id` from the event backend.
+
+        Raises:
+            JobQueueNotFoundError: If the job is unknown or expired.
+            RuntimeError: If there is no event backend.
+        """
+        if self._event_backend is None:
+            msg = "Job events can only be read from an event backend"
+            raise RuntimeError(msg)
+        return await self._event_backend.read(job_id, last_event_id, timeout)
+
+    async def request_cancel(self, job_id: str) -> None:
+        """Cancel a job, here if it runs on this worker, otherwise through the event backend.
+
+        Raises:
+            JobQueueNotFoundError: If the job is unknown.
+        """
+        if self.is_local_job(job_id):
+            await self.cleanup_job(job_id)
+        elif self._event_backend is not None:
+            await self._event_backend.request_cancel(job_id)
+        else:
+            raise JobQueueNotFoundError(job_id)
+
+    async def _forward_events(self, job_id: str, queue: asyncio.Queue) -> None:
+        """Copy a job's events from its queue to the event backend until the job ends.
+
+        Events waiting in the queue are appended together. While the queue is idle, the job is
+        checked for cancellation requests and for having ended without putting the end marker.
+        """
+        backend = self._event_backend
+        if backend is None:
+            return
+        while True:
+            try:
+                _, value, _ = await asyncio.wait_for(queue.get(), timeout=self._cancel_poll_interval)
+            except asyncio.TimeoutError:
+                task = self._queues.get(job_id, (None, None, None, None))[2]
+                if task is None or task.done():
+                    value = None
+                else:
+                    if await backend.is_cancel_requested(job_id):
+                        await logger.adebug(f"Cancellation requested for job_id {job_id}")
+                        task.cancel()
+                    continue
+                batch: list[bytes | None] = [value]
+            else:
+                batch = [value]
+                while value is not None and not queue.empty():
+                    _, value, _ = queue.get_nowait()
+                    batch.append(value)
+            try:
+                await backend.append(job_id, batch)
+            except Exception as exc:  # noqa: BLE001
+                await logger.aerror(f"Could not store events for job_id {job_id}: {exc}")
+            if value is None:
+                break
+        # Readers only use the event backend, so the job's queue is no longer needed here
+        self._forwarders.pop(job_id, None)
+        self._queues.pop(job_id, None)
+
     def get_queue_data(self, job_id: str) -> tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]:
         """Retrieve the complete data structure associated with a job's queue.
 
@@ -247,8 +416,20 @@ class JobQueueService(Service):
                 break
 
         await logger.adebug(f"Removed {items_cleared} items from queue for job_id {job_id}")
+        if isinstance(main_queue, BoundedEventQueue):
+            main_queue.close()
         # Remove the job entry from the registry
         self._queues.pop(job_id, None)
+
+        if forwarder := self._forwarders.pop(job_id, None):
+            forwarder.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await forwarder
+            # Let readers on other workers know that no more events are coming
+            try:
+                await self._event_backend.append(job_id, [None])
+            except Exception as exc:  # noqa: BLE001
+                await logger.aerror(f"Could not end the events of job_id {job_id}: {exc}")
         await logger.adebug(f"Cleanup successful for job_id {job_id}: resources have been released.")
 
     async def _periodic_cleanup(self) -> None:
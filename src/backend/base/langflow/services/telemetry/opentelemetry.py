@@ -140,6 +140,20 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             metric_type=MetricType.COUNTER,
             labels={"flow_id": mandatory_label},
         )
+        self._add_metric(
+            name="event_queue_depth",
+            description="The number of events waiting for clients in the event queues of builds or streamed runs",
+            unit="",
+            metric_type=MetricType.OBSERVABLE_GAUGE,
+            labels={"queue": mandatory_label},
+        )
+        self._add_metric(
+            name="event_queue_overflow_events",
+            description="The number of events coalesced, dropped or spilled to disk by full event queues",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"queue": mandatory_label, "reason": mandatory_label},
+        )
 
     def __init__(self, *, prometheus_enabled: bool = True):
         # Only initialize once
@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Iterable
 from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -35,6 +36,28 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    async def get_variables(self, user_id: UUID | str, names: Iterable[str], session: AsyncSession) -> dict[str, str]:
+        """Get the values of several variables.
+
+        Variables that are missing or can't be read are left out, so callers can report them
+        through `get_variable`.
+
+        Args:
+            user_id: The user ID.
+            names: The names of the variables.
+            session: The database session.
+
+        Returns:
+            A mapping of variable names to values.
+        """
+        values = {}
+        for name in names:
+            try:
+                values[name] = await self.get_variable(user_id=user_id, name=name, field="", session=session)
+            except (TypeError, ValueError):
+                continue
+        return values
+
     @abc.abstractmethod
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
         """List all variables.
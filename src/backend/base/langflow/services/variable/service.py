@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import os
+import time
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from lfx.log.logger import logger
-from sqlmodel import select
+from sqlmodel import col, select
 from typing_extensions import override
 
 from langflow.services.auth import utils as auth_utils
@@ -15,7 +16,7 @@ from langflow.services.variable.base import VariableService
 from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
     from uuid import UUID
 
     from lfx.services.settings.service import SettingsService
@@ -25,6 +26,43 @@ if TYPE_CHECKING:
 class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        # Decrypted values by user and name, with their type and expiry time
+        self._cache: dict[str, dict[str, tuple[float, str | None, str]]] = {}
+        self._next_purge = 0.0
+
+    def _purge_expired(self, now: float) -> None:
+        """Drop the expired values of every user, at most once per TTL, so unread secrets don't stay in memory."""
+        if now < self._next_purge:
+            return
+        self._next_purge = now + self.settings_service.settings.variable_cache_ttl
+        for user_id, entries in list(self._cache.items()):
+            for name in [name for name, (expires_at, _, _) in entries.items() if expires_at <= now]:
+                del entries[name]
+            if not entries:
+                del self._cache[user_id]
+
+    def _get_cached(self, user_id: UUID | str, name: str) -> tuple[str | None, str] | None:
+        now = time.monotonic()
+        self._purge_expired(now)
+        entry = self._cache.get(str(user_id), {}).get(name)
+        if entry is None:
+            return None
+        expires_at, type_, value = entry
+        if expires_at <= now:
+            del self._cache[str(user_id)][name]
+            return None
+        return type_, value
+
+    def _set_cached(self, user_id: UUID | str, name: str, type_: str | None, value: str) -> None:
+        now = time.monotonic()
+        self._purge_expired(now)
+        ttl = self.settings_service.settings.variable_cache_ttl
+        if ttl > 0:
+            self._cache.setdefault(str(user_id), {})[name] = (now + ttl, type_, value)
+
+    def invalidate_cache(self, user_id: UUID | str) -> None:
+        """Forget the cached variable values of a user."""
+        self._cache.pop(str(user_id), None)
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -84,24 +122,58 @@ class DatabaseVariableService(VariableService, Service):
         field: str,
         session: AsyncSession,
     ) -> str:
-        # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
-        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
-        variable = (await session.exec(stmt)).first()
+        cached = self._get_cached(user_id, name)
+        if cached is None:
+            # we get the credential from the database
+            stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
+            variable = (await session.exec(stmt)).first()
 
-        if not variable or not variable.value:
-            msg = f"{name} variable not found."
-            raise ValueError(msg)
+            if not variable or not variable.value:
+                msg = f"{name} variable not found."
+                raise ValueError(msg)
+
+            # we decrypt the value
+            value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+            self._set_cached(user_id, name, variable.type, value)
+            type_ = variable.type
+        else:
+            type_, value = cached
 
-        if variable.type == CREDENTIAL_TYPE and field == "session_id":
+        if type_ == CREDENTIAL_TYPE and field == "session_id":
             msg = (
                 f"variable {name} of type 'Credential' cannot be used in a Session ID field "
                 "because its purpose is to prevent the exposure of values."
             )
             raise TypeError(msg)
 
-        # we decrypt the value
-        return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        return value
+
+    @override
+    async def get_variables(self, user_id: UUID | str, names: Iterable[str], session: AsyncSession) -> dict[str, str]:
+        values: dict[str, str] = {}
+        missing = []
+        for name in dict.fromkeys(names):
+            cached = self._get_cached(user_id, name)
+            if cached is None:
+                missing.append(name)
+            else:
+                values[name] = cached[1]
+        if not missing:
+            return values
+
+        stmt = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(missing))
+        for variable in (await session.exec(stmt)).all():
+            if not variable.value:
+                continue
+            try:
+                value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+            except Exception as e:  # noqa: BLE001
+                # get_variable reports the error when the value is actually used
+                await logger.adebug(f"Decryption failed for variable '{variable.name}': {e}")
+                continue
+            self._set_cached(user_id, variable.name, variable.type, value)
+            values[variable.name] = value
+        return values
 
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
@@ -145,6 +217,7 @@ class DatabaseVariableService(VariableService, Service):
         session.add(variable)
         await session.flush()
         await session.refresh(variable)
+        self.invalidate_cache(user_id)
         return variable
 
     async def update_variable_fields(
@@ -169,6 +242,7 @@ class DatabaseVariableService(VariableService, Service):
         session.add(db_variable)
         await session.flush()
         await session.refresh(db_variable)
+        self.invalidate_cache(user_id)
         return db_variable
 
     @override
@@ -184,6 +258,7 @@ class DatabaseVariableService(VariableService, Service):
             msg = f"{name} variable not found."
             raise ValueError(msg)
         await session.delete(variable)
+        self.invalidate_cache(user_id)
 
     @override
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
@@ -193,6 +268,7 @@ class DatabaseVariableService(VariableService, Service):
             msg = f"{variable_id} variable not found."
             raise ValueError(msg)
         await session.delete(variable)
+        self.invalidate_cache(user_id)
 
     async def create_variable(
         self,
@@ -214,4 +290,5 @@ class DatabaseVariableService(VariableService, Service):
         session.add(variable)
         await session.flush()
         await session.refresh(variable)
+        self.invalidate_cache(user_id)
         return variable
@@ -0,0 +1,177 @@
+"""The component catalog served by `/api/v1/all`, encoded and compressed once per version.
+
+The catalog is the same for every request until the component types change, so its JSON and its
+gzip and brotli encodings are built once and reused. Each version is identified by a hash of its
+JSON, which is also its ETag, so clients that already have it get a `304 Not Modified`, and other
+workers serving the same catalog use the same ETag.
+
+The hashes of each component in the last versions are kept, so clients can fetch only the
+components that changed since the version they have.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+HISTORY_SIZE = 16
+
+# A component is identified by its category and its name
+ComponentKey = tuple[str, str]
+
+
+def _encode(value: Any) -> bytes:
+    return orjson.dumps(value, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _join_components(components: Mapping[ComponentKey, bytes]) -> bytes:
+    """The JSON object of `{category: {name: component}}` made of already encoded components."""
+    categories: dict[str, list[bytes]] = {}
+    for (category, name), encoded in components.items():
+        categories.setdefault(category, []).append(_encode(name) + b":" + encoded)
+    return (
+        b"{"
+        + b",".join(_encode(category) + b":{" + b",".join(members) + b"}" for category, members in categories.items())
+        + b"}"
+    )
+
+
+def _accepts(accept_encoding: str, encoding: str) -> bool:
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip().lower() == encoding:
+            return params.replace(" ", "") not in {"q=0", "q=0.0", "q=0.00", "q=0.000"}
+    return False
+
+
+@dataclass
+class EncodedCatalog:
+    version: str
+    body: bytes
+    gzip_body: bytes
+    brotli_body: bytes | None
+    components: dict[ComponentKey, bytes] = field(repr=False)
+    hashes: dict[ComponentKey, str] = field(repr=False)
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.version}"'
+
+    @classmethod
+    def build(cls, all_types: Mapping[str, Mapping[str, Any]]) -> EncodedCatalog:
+        components = {
+            (str(category), str(name)): _encode(component)
+            for category, members in all_types.items()
+            for name, component in members.items()
+        }
+        body = _join_components(components)
+        return cls(
+            version=hashlib.sha256(body).hexdigest()[:32],
+            body=body,
+            gzip_body=gzip.compress(body, compresslevel=GZIP_LEVEL),
+            brotli_body=brotli.compress(body, quality=BROTLI_QUALITY) if brotli is not None else None,
+            components=components,
+            hashes={key: hashlib.sha256(encoded).hexdigest() for key, encoded in components.items()},
+        )
+
+    def response(self, request_headers: Mapping[str, str]) -> Response:
+        """The catalog in the best encoding the client accepts, or a 304 if it already has this version."""
+        headers = {"ETag": self.etag, "Vary": "Accept-Encoding", "Cache-Control": "private, no-cache"}
+        if_none_match = request_headers.get("if-none-match", "")
+        if self.etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}:
+            return Response(status_code=304, headers=headers)
+
+        accept_encoding = request_headers.get("accept-encoding", "")
+        content = self.body
+        if self.brotli_body is not None and _accepts(accept_encoding, "br"):
+            content = self.brotli_body
+            headers["Content-Encoding"] = "br"
+        elif _accepts(accept_encoding, "gzip"):
+            content = self.gzip_body
+            headers["Content-Encoding"] = "gzip"
+        return Response(content=content, media_type="application/json", headers=headers)
+
+
+class ComponentCatalog:
+    """Keeps the encoded catalog of the current component types and the component hashes of recent versions."""
+
+    def __init__(self, history_size: int = HISTORY_SIZE) -> None:
+        self.history_size = history_size
+        self._catalog: EncodedCatalog | None = None
+        # The component types and version the catalog was built from, referenced so their id can't be reused
+        self._source_types: Mapping[str, Mapping[str, Any]] | None = None
+        self._source_version: int | None = None
+        self._history: OrderedDict[str, dict[ComponentKey, str]] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def get(self, all_types: Mapping[str, Mapping[str, Any]], source_version: int) -> EncodedCatalog:
+        """The encoded catalog of `all_types`, rebuilt only when `all_types` or `source_version` changed."""
+        if self._is_current(all_types, source_version):
+            return self._catalog
+        async with self._lock:
+            if not self._is_current(all_types, source_version):
+                catalog = await asyncio.to_thread(EncodedCatalog.build, all_types)
+                self._history[catalog.version] = catalog.hashes
+                self._history.move_to_end(catalog.version)
+                while len(self._history) > self.history_size:
+                    self._history.popitem(last=False)
+                self._catalog = catalog
+                self._source_types = all_types
+                self._source_version = source_version
+            return self._catalog
+
+    def _is_current(self, all_types: Mapping[str, Mapping[str, Any]], source_version: int) -> bool:
+        return self._catalog is not None and self._source_types is all_types and self._source_version == source_version
+
+    def delta(self, catalog: EncodedCatalog, since: str) -> bytes:
+        """The JSON of the components changed or removed since version `since`.
+
+        Returns every component, with `"full": true`, when `since` is not a recent version.
+        """
+        old_hashes = self._history.get(since)
+        if old_hashes is None:
+            changed = catalog.components
+            removed: dict[str, list[str]] = {}
+        else:
+            changed = {
+                key: encoded
+                for key, encoded in catalog.components.items()
+                if old_hashes.get(key) != catalog.hashes[key]
+            }
+            removed = {}
+            for category, name in old_hashes.keys() - catalog.hashes.keys():
+                removed.setdefault(category, []).append(name)
+        return (
+            b'{"version":'
+            + _encode(catalog.version)
+            + b',"since":'
+            + _encode(since)
+            + b',"full":'
+            + (b"true" if old_hashes is None else b"false")
+            + b',"changed":'
+            + _join_components(changed)
+            + b',"removed":'
+            + _encode(removed)
+            + b"}"
+        )
+
+
+component_catalog = ComponentCatalog()
@@ -1,10 +1,11 @@
 import asyncio
 import base64
+import math
 from pathlib import Path
 
 import numpy as np
 from lfx.log import logger
-from scipy.signal import resample
+from scipy.signal import firwin, resample, upfirdn
 
 SAMPLE_RATE_24K = 24000
 VAD_SAMPLE_RATE_16K = 16000
@@ -43,6 +44,74 @@ def resample_24k_to_16k(frame_24k_bytes):
     return frame_16k.tobytes()
 
 
+class StreamingResampler:
+    """Resamples a stream of 16-bit mono PCM audio, keeping the filter state between buffers.
+
+    Uses a polyphase FIR filter, designed like `scipy.signal.resample_poly`'s, so buffers of any
+    size can be processed one after another without artifacts at their boundaries. Create one
+    resampler per audio stream. Its output is delayed by half the filter length, under a
+    millisecond for 24kHz to 16kHz.
+    """
+
+    def __init__(self, from_rate: int = SAMPLE_RATE_24K, to_rate: int = VAD_SAMPLE_RATE_16K) -> None:
+        divisor = math.gcd(from_rate, to_rate)
+        self.up = to_rate // divisor
+        self.down = from_rate // divisor
+        max_rate = max(self.up, self.down)
+        self._taps = firwin(20 * max_rate + 1, 1 / max_rate, window=("kaiser", 5.0)) * self.up
+        # Position of the next output sample in the upsampled signal
+        self._next_position = 0
+        # The last input samples the next outputs need, starting with silence
+        self._history_start = self._history_start_for(self._next_position)
+        self._history = np.zeros(-self._history_start)
+        self._pending_byte = b""
+
+    def _history_start_for(self, position: int) -> int:
+        """The index of the first input sample to keep for the output at `position`.
+
+        The output at `position` needs the input samples its taps cover, and `upfirdn` only computes
+        the outputs at multiples of `down` from the first sample, so the start is moved back until
+        `position` is one of them.
+        """
+        start = -(-(position + 1 - len(self._taps)) // self.up)
+        while (position - self.up * start) % self.down:
+            start -= 1
+        return start
+
+    def process(self, audio: bytes) -> bytes:
+        """Resamples the next buffer of the stream and returns the audio that is ready."""
+        if self._pending_byte:
+            audio = self._pending_byte + audio
+        # A buffer can end in the middle of a sample
+        usable = len(audio) - len(audio) % BYTES_PER_SAMPLE
+        self._pending_byte = audio[usable:]
+        samples = np.concatenate((self._history, np.frombuffer(audio[:usable], dtype=np.int16)))
+
+        # The outputs are ready up to the position of the last input sample
+        end = self._history_start + len(samples)
+        count = max(0, (self.up * end - 1 - self._next_position) // self.down + 1)
+        if not count:
+            self._history = samples
+            return b""
+        first = (self._next_position - self.up * self._history_start) // self.down
+        output = upfirdn(self._taps, samples, self.up, self.down)[first : first + count]
+
+        self._next_position += self.down * count
+        history_start = self._history_start_for(self._next_position)
+        self._history = samples[history_start - self._history_start :]
+        self._history_start = history_start
+        return np.clip(np.rint(output), -32768, 32767).astype(np.int16).tobytes()
+
+
+def count_speech_frames(vad, audio_16k: bytes | bytearray) -> int:
+    """Runs `vad` on every complete 20ms frame of 16kHz audio and returns how many contain speech."""
+    view = memoryview(audio_16k)
+    return sum(
+        vad.is_speech(view[start : start + BYTES_PER_16K_FRAME], VAD_SAMPLE_RATE_16K)
+        for start in range(0, len(view) - BYTES_PER_16K_FRAME + 1, BYTES_PER_16K_FRAME)
+    )
+
+
 # def resample_24k_to_16k(frame_24k_bytes: bytes) -> bytes:
 #    """
 #    Convert one 20ms chunk (960 bytes @ 24kHz) to 20ms @ 16kHz (640 bytes).
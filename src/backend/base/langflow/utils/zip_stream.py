@@ -0,0 +1,115 @@
+"""Build ZIP archives as a stream of chunks, without holding the archive or its files in memory."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import zipfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_PREFETCH_CHUNKS = 8
+
+_END = object()
+
+
+@dataclass
+class ZipStreamEntry:
+    """A file to add to a streamed ZIP archive.
+
+    `open_stream` is called once, when the file starts being fetched, and must return an async
+    iterator over the file's content. `size` is only used to decide whether the entry needs ZIP64
+    extensions; when it is unknown, every entry gets them.
+    """
+
+    name: str
+    open_stream: Callable[[], AsyncIterator[bytes]]
+    size: int | None = None
+
+
+class _ChunkSink:
+    """Write-only, non-seekable file object collecting what `zipfile` writes until it is drained."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _fetch(entry: ZipStreamEntry, queue: asyncio.Queue) -> None:
+    try:
+        async for chunk in entry.open_stream():
+            await queue.put(chunk)
+    except Exception as exc:  # noqa: BLE001
+        # Raised again by the writer, in order
+        await queue.put(exc)
+    else:
+        await queue.put(_END)
+
+
+async def stream_zip(
+    entries: Iterable[ZipStreamEntry],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    prefetch_chunks: int = DEFAULT_PREFETCH_CHUNKS,
+) -> AsyncIterator[bytes]:
+    """Yields a ZIP archive of `entries`, in order, as it is written.
+
+    Files are stored uncompressed, with data descriptors, so nothing needs to be known about a file
+    before its content is streamed. While one file is written, the next `concurrency - 1` files are
+    fetched ahead, each buffering at most `prefetch_chunks` chunks, so memory use depends on the
+    chunk size and these two limits, not on the size of the files.
+
+    An error raised by a file's stream is raised when the writer reaches that file.
+    """
+    entries = list(entries)
+    concurrency = max(concurrency, 1)
+    queues: dict[int, asyncio.Queue] = {}
+    tasks: dict[int, asyncio.Task] = {}
+    sink = _ChunkSink()
+    date_time = datetime.now(tz=timezone.utc).timetuple()[:6]
+
+    def prefetch_until(last_index: int) -> None:
+        for index in range(len(tasks), min(last_index + 1, len(entries))):
+            queues[index] = asyncio.Queue(maxsize=max(prefetch_chunks, 1))
+            tasks[index] = asyncio.create_task(_fetch(entries[index], queues[index]))
+
+    try:
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as zip_file:
+            for index, entry in enumerate(entries):
+                prefetch_until(index + concurrency - 1)
+                queue = queues.pop(index)
+                zip_info = zipfile.ZipInfo(entry.name, date_time=date_time)
+                force_zip64 = entry.size is None or entry.size >= zipfile.ZIP64_LIMIT
+                with zip_file.open(zip_info, "w", force_zip64=force_zip64) as destination:
+                    while (chunk := await queue.get()) is not _END:
+                        if isinstance(chunk, Exception):
+                            raise chunk
+                        destination.write(chunk)
+                        if data := sink.drain():
+                            yield data
+                if data := sink.drain():
+                    yield data
+        if data := sink.drain():
+            yield data
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        for task in tasks.values():
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
@@ -0,0 +1,60 @@
+"""Benchmark the CPU cost of resampling voice mode audio for VAD, per concurrent voice session.
+
+Each voice session sends 24kHz audio that is resampled to 16kHz before voice activity detection.
+This compares resampling each 20ms frame on its own with `resample_24k_to_16k`, which is FFT based,
+with a `StreamingResampler` per session fed all the audio received since its last pass. The CPU
+milliseconds per second of audio of each path are recorded as test properties (`--junitxml` writes them out).
+"""
+
+import time
+
+import numpy as np
+import pytest
+from langflow.utils.voice_utils import (
+    BYTES_PER_24K_FRAME,
+    SAMPLE_RATE_24K,
+    StreamingResampler,
+    resample_24k_to_16k,
+)
+
+SESSIONS = [1, 10, 50]
+SECONDS = 10
+# How many 20ms frames are waiting on each pass of the VAD task
+FRAMES_PER_PASS = 5
+
+
+def session_audio(seconds: int) -> bytes:
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(SAMPLE_RATE_24K * seconds) * 3000).astype(np.int16).tobytes()
+
+
+def per_frame(audio: bytes, sessions: int) -> None:
+    for start in range(0, len(audio), BYTES_PER_24K_FRAME):
+        for _ in range(sessions):
+            resample_24k_to_16k(audio[start : start + BYTES_PER_24K_FRAME])
+
+
+def streaming(audio: bytes, sessions: int) -> None:
+    resamplers = [StreamingResampler() for _ in range(sessions)]
+    step = BYTES_PER_24K_FRAME * FRAMES_PER_PASS
+    for start in range(0, len(audio), step):
+        for resampler in resamplers:
+            resampler.process(audio[start : start + step])
+
+
+def cpu_ms_per_session_second(resample, audio: bytes, sessions: int) -> float:
+    start = time.process_time()
+    resample(audio, sessions)
+    return (time.process_time() - start) * 1000 / (sessions * SECONDS)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("sessions", SESSIONS)
+def test_streaming_resampler_cpu_per_session(sessions: int, record_property):
+    audio = session_audio(SECONDS)
+
+    per_frame_ms = cpu_ms_per_session_second(per_frame, audio, sessions)
+    streaming_ms = cpu_ms_per_session_second(streaming, audio, sessions)
+
+    record_property("per_frame_cpu_ms_per_session_second", round(per_frame_ms, 3))
+    record_property("streaming_cpu_ms_per_session_second", round(streaming_ms, 3))
@@ -673,3 +673,34 @@ async def test_mcp_longterm_token_fails_without_superuser():
     async with session_scope() as session:
         with pytest.raises(HTTPException, match="Auto login required to create a long-term token"):
             await create_user_longterm_token(session)
+
+
+async def test_list_tools_rebuilds_input_schemas_only_for_updated_flows(user_test_project, test_flow_for_update):
+    """The input schema of a flow is built again only once the flow's updated_at changed."""
+    from datetime import datetime, timezone
+
+    from langflow.api.v1 import mcp_utils
+
+    async with session_scope() as session:
+        flow = await session.get(Flow, test_flow_for_update.id)
+        flow.data = {"nodes": [], "edges": []}
+        session.add(flow)
+
+    mcp_utils.tool_manifest_cache.clear()
+    with patch.object(
+        mcp_utils, "json_schema_from_flow_data", wraps=mcp_utils.json_schema_from_flow_data
+    ) as json_schema_from_flow_data:
+        tools = await mcp_utils.handle_list_tools(project_id=user_test_project.id, mcp_enabled_only=True)
+        assert [tool.name for tool in tools] == ["original_action"]
+        assert await mcp_utils.handle_list_tools(project_id=user_test_project.id, mcp_enabled_only=True) == tools
+        assert json_schema_from_flow_data.call_count == 1
+
+        async with session_scope() as session:
+            flow = await session.get(Flow, test_flow_for_update.id)
+            flow.action_name = "renamed_action"
+            flow.updated_at = datetime.now(timezone.utc)
+            session.add(flow)
+
+        tools = await mcp_utils.handle_list_tools(project_id=user_test_project.id, mcp_enabled_only=True)
+        assert [tool.name for tool in tools] == ["renamed_action"]
+        assert json_schema_from_flow_data.call_count == 2
@@ -81,3 +81,30 @@ async def test_delete_messages_session_with_valid_auth(client: AsyncClient, logg
     response = await client.delete("api/v1/monitor/messages/session/test-session", headers=logged_in_headers)
     # Should return 204 No Content
     assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+async def test_get_cache_stats_requires_superuser(client: AsyncClient, logged_in_headers):
+    """Test that GET /monitor/cache is only available to superusers."""
+    response = await client.get("api/v1/monitor/cache")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    response = await client.get("api/v1/monitor/cache", headers=logged_in_headers)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+async def test_get_cache_stats_with_superuser(client: AsyncClient, logged_in_headers_super_user):
+    """Test that GET /monitor/cache returns the statistics of caches that report them."""
+    from unittest.mock import patch
+
+    from langflow.services.cache.service import ShardedMemoryCache
+
+    cache = ShardedMemoryCache(sweep_interval=0)
+    await cache.set("key", "value")
+    with patch("langflow.api.v1.monitor.get_cache_service", return_value=cache):
+        response = await client.get("api/v1/monitor/cache", headers=logged_in_headers_super_user)
+
+    assert response.status_code == status.HTTP_200_OK
+    stats = response.json()
+    assert stats["type"] == "ShardedMemoryCache"
+    assert stats["entries"] == 1
+    assert stats["bytes"] > 0
@@ -80,3 +80,14 @@ def test_vertex_response_truncation_behavior(size, expected):
 
     result = VertexBuildResponse(**data).model_dump()
     assert len(result["data"]["outputs"]["dataframe"]["message"]) == expected
+
+
+def test_vertex_response_truncation_marker_counts_all_dropped_items():
+    message = list(range(MAX_ITEMS_LENGTH + 50))
+    data = {"data": {"outputs": {"dataframe": {"message": message, "type": "bar"}}}, "valid": True}
+
+    result = VertexBuildResponse(**data).model_dump()
+
+    truncated = result["data"]["outputs"]["dataframe"]["message"]
+    assert truncated[:-1] == message[:MAX_ITEMS_LENGTH]
+    assert truncated[-1] == "... [truncated 50 items]"
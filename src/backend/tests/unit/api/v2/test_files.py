@@ -1,9 +1,11 @@
 import asyncio
 import contextlib
+import io
 import json
 import os
 import tempfile
 import uuid
+import zipfile
 from contextlib import suppress
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
@@ -181,6 +183,24 @@ async def test_download_file_not_found(files_client, files_created_api_key):
     assert "File not found" in error_response["detail"]
 
 
+async def test_download_files_batch(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+
+    file_ids = []
+    for name, content in [("first.txt", b"first content"), ("second.txt", b"second content")]:
+        response = await files_client.post("api/v2/files", files={"file": (name, content)}, headers=headers)
+        assert response.status_code == 201
+        file_ids.append(response.json()["id"])
+
+    response = await files_client.post("api/v2/files/batch/", json=file_ids, headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-zip-compressed"
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert archive.testzip() is None
+    assert sorted(archive.read(name) for name in archive.namelist()) == [b"first content", b"second content"]
+
+
 async def test_list_files(files_client, files_created_api_key):
     headers = {"x-api-key": files_created_api_key.api_key}
 
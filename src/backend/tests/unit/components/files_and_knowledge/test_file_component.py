@@ -1,5 +1,4 @@
-import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 from langflow.io import Output
@@ -115,13 +114,13 @@ class TestFileComponentDynamicOutputs:
         assert result["advanced_mode"]["show"] is False
         assert result["advanced_mode"]["value"] is False
 
-    @patch("subprocess.run")
-    def test_process_docling_subprocess_success(self, mock_subprocess):
-        """Test successful Docling subprocess execution."""
+    @patch("lfx.components.files_and_knowledge.file.run_docling_job")
+    def test_process_docling_subprocess_success(self, mock_run_docling_job):
+        """Test successful Docling worker execution."""
         component = FileComponent()
         component.markdown = False
 
-        # Mock successful subprocess response
+        # Mock successful worker response
         mock_result = {
             "ok": True,
             "mode": "structured",
@@ -131,16 +130,24 @@ class TestFileComponentDynamicOutputs:
             ],
             "meta": {"file_path": "test.pdf"},
         }
-        mock_subprocess.return_value = MagicMock(
-            stdout=json.dumps(mock_result).encode("utf-8"),
-            stderr=b"",
-        )
+        mock_run_docling_job.return_value = mock_result
 
         result = component._process_docling_in_subprocess("test.pdf")
 
         assert result is not None
         assert result.data["doc"] == mock_result["doc"]
         assert result.data["file_path"] == "test.pdf"
+        assert mock_run_docling_job.call_args.args[0]["file_path"] == "test.pdf"
+
+    @patch("lfx.components.files_and_knowledge.file.run_docling_job")
+    def test_process_docling_worker_error_keeps_file_path(self, mock_run_docling_job):
+        """Test that worker failures are reported with the original file path."""
+        component = FileComponent()
+        mock_run_docling_job.return_value = {"ok": False, "error": "Docling subprocess error: boom", "meta": {}}
+
+        result = component._process_docling_in_subprocess("test.pdf")
+
+        assert result.data == {"error": "Docling subprocess error: boom", "file_path": "test.pdf"}
 
     def test_dynamic_outputs_have_tool_mode_enabled(self):
         """Test that all dynamically created outputs have tool_mode=True."""
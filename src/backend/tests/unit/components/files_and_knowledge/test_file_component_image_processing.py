@@ -7,11 +7,11 @@ These tests cover scenarios where:
 - Edge cases in error handling
 """
 
-import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from lfx.base.data.docling_pool import DoclingWorkerPool
 from lfx.components.files_and_knowledge.file import FileComponent
 from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
@@ -20,8 +20,8 @@ from lfx.schema.dataframe import DataFrame
 class TestDoclingEmptyTextExtraction:
     """Tests for handling images/documents with no extractable text."""
 
-    @patch("subprocess.run")
-    def test_process_docling_empty_doc_rows_returns_placeholder(self, mock_subprocess, tmp_path):
+    @patch("lfx.components.files_and_knowledge.file.run_docling_job")
+    def test_process_docling_empty_doc_rows_returns_placeholder(self, mock_run_docling_job, tmp_path):
         """Test that empty doc_rows from Docling creates placeholder data instead of error."""
         # Use tmp_path for secure temporary file references
         test_file = tmp_path / "profile-pic.png"
@@ -41,10 +41,7 @@ class TestDoclingEmptyTextExtraction:
             "doc": [],  # Empty - no text extracted from image
             "meta": {"file_path": str(test_file)},
         }
-        mock_subprocess.return_value = MagicMock(
-            stdout=json.dumps(mock_result).encode("utf-8"),
-            stderr=b"",
-        )
+        mock_run_docling_job.return_value = mock_result
 
         result = component._process_docling_in_subprocess(str(test_file))
 
@@ -52,8 +49,8 @@ class TestDoclingEmptyTextExtraction:
         assert result.data["doc"] == []
         # The subprocess returns the raw result; processing happens in process_files
 
-    @patch("subprocess.run")
-    def test_process_files_handles_empty_doc_rows(self, mock_subprocess, tmp_path):
+    @patch("lfx.components.files_and_knowledge.file.run_docling_job")
+    def test_process_files_handles_empty_doc_rows(self, mock_run_docling_job, tmp_path):
         """Test that process_files correctly handles empty doc_rows from Docling."""
         # Create a test image file
         test_image = tmp_path / "test_image.png"
@@ -75,10 +72,7 @@ class TestDoclingEmptyTextExtraction:
             "doc": [],
             "meta": {"file_path": str(test_image)},
         }
-        mock_subprocess.return_value = MagicMock(
-            stdout=json.dumps(mock_result).encode("utf-8"),
-            stderr=b"",
-        )
+        mock_run_docling_job.return_value = mock_result
 
         # Create BaseFile mock
         from lfx.base.data.base_file import BaseFileComponent
@@ -101,8 +95,8 @@ class TestDoclingEmptyTextExtraction:
         data_item = result[0].data[0]
         assert "text" in data_item.data or "info" in data_item.data
 
-    @patch("subprocess.run")
-    def test_load_files_dataframe_with_empty_text_image(self, mock_subprocess, tmp_path):
+    @patch("lfx.components.files_and_knowledge.file.run_docling_job")
+    def test_load_files_dataframe_with_empty_text_image(self, mock_run_docling_job, tmp_path):
         """Test that load_files_dataframe doesn't error on images with no text."""
         test_image = tmp_path / "profile.png"
         test_image.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
@@ -130,10 +124,7 @@ class TestDoclingEmptyTextExtraction:
             "doc": [],
             "meta": {"file_path": str(test_image)},
         }
-        mock_subprocess.return_value = MagicMock(
-            stdout=json.dumps(mock_result).encode("utf-8"),
-            stderr=b"",
-        )
+        mock_run_docling_job.return_value = mock_result
 
         # This should NOT raise an error
         result = component.load_files_dataframe()
@@ -142,8 +133,8 @@ class TestDoclingEmptyTextExtraction:
         # DataFrame should not be empty - it should have placeholder data
         assert not result.empty, "DataFrame should contain placeholder data for image without text"
 
-    @patch("subprocess.run")
-    def test_load_files_markdown_with_empty_text_image(self, mock_subprocess, tmp_path):
+    @patch("lfx.components.files_and_knowledge.file.run_docling_job")
+    def test_load_files_markdown_with_empty_text_image(self, mock_run_docling_job, tmp_path):
         """Test that load_files_markdown returns placeholder message for images with no text."""
         test_image = tmp_path / "profile.png"
         test_image.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
@@ -171,10 +162,7 @@ class TestDoclingEmptyTextExtraction:
             "text": "",  # Empty markdown
             "meta": {"file_path": str(test_image)},
         }
-        mock_subprocess.return_value = MagicMock(
-            stdout=json.dumps(mock_result).encode("utf-8"),
-            stderr=b"",
-        )
+        mock_run_docling_job.return_value = mock_result
 
         # This should NOT raise an error
         result = component.load_files_markdown()
@@ -187,8 +175,8 @@ class TestDoclingEmptyTextExtraction:
 class TestDoclingSubprocessErrors:
     """Tests for error handling in Docling subprocess."""
 
-    @patch("subprocess.run")
-    def test_docling_conversion_failure(self, mock_subprocess, tmp_path):
+    @patch("lfx.components.files_and_knowledge.file.run_docling_job")
+    def test_docling_conversion_failure(self, mock_run_docling_job, tmp_path):
         """Test handling of Docling conversion failure."""
         test_file = tmp_path / "bad_file.xyz"
         test_file.write_bytes(b"invalid content")
@@ -205,10 +193,7 @@ class TestDoclingSubprocessErrors:
             "error": "Docling conversion failed: unsupported format",
             "meta": {"file_path": str(test_file)},
         }
-        mock_subprocess.return_value = MagicMock(
-            stdout=json.dumps(mock_result).encode("utf-8"),
-            stderr=b"",
-        )
+        mock_run_docling_job.return_value = mock_result
 
         result = component._process_docling_in_subprocess(str(test_file))
 
@@ -216,9 +201,8 @@ class TestDoclingSubprocessErrors:
         assert "error" in result.data
         assert "Docling conversion failed" in result.data["error"]
 
-    @patch("subprocess.run")
-    def test_docling_subprocess_crash(self, mock_subprocess, tmp_path):
-        """Test handling of Docling subprocess crash (no output)."""
+    def test_docling_subprocess_crash(self, tmp_path):
+        """Test handling of Docling worker crash (no output)."""
         test_file = tmp_path / "crash.pdf"
         test_file.write_bytes(b"%PDF-1.4 test")
 
@@ -229,20 +213,17 @@ class TestDoclingSubprocessErrors:
         component.pipeline = "standard"
         component.ocr_engine = "easyocr"
 
-        mock_subprocess.return_value = MagicMock(
-            stdout=b"",  # No output
-            stderr=b"Segmentation fault",
-        )
-
-        result = component._process_docling_in_subprocess(str(test_file))
+        pool = DoclingWorkerPool(size=1, script="import sys; sys.stderr.write('Segmentation fault'); sys.exit(139)")
+        with patch("lfx.base.data.docling_pool.get_docling_pool", return_value=pool):
+            result = component._process_docling_in_subprocess(str(test_file))
+        pool.shutdown()
 
         assert result is not None
         assert "error" in result.data
         assert "Segmentation fault" in result.data["error"] or "no output" in result.data["error"].lower()
 
-    @patch("subprocess.run")
-    def test_docling_invalid_json_output(self, mock_subprocess, tmp_path):
-        """Test handling of invalid JSON from Docling subprocess."""
+    def test_docling_invalid_json_output(self, tmp_path):
+        """Test handling of invalid JSON from a Docling worker."""
         test_file = tmp_path / "test.pdf"
         test_file.write_bytes(b"%PDF-1.4 test")
 
@@ -253,12 +234,10 @@ class TestDoclingSubprocessErrors:
         component.pipeline = "standard"
         component.ocr_engine = "easyocr"
 
-        mock_subprocess.return_value = MagicMock(
-            stdout=b"not valid json {{{",
-            stderr=b"",
-        )
-
-        result = component._process_docling_in_subprocess(str(test_file))
+        pool = DoclingWorkerPool(size=1, script="import sys; print('not valid json {{{', flush=True); sys.stdin.read()")
+        with patch("lfx.base.data.docling_pool.get_docling_pool", return_value=pool):
+            result = component._process_docling_in_subprocess(str(test_file))
+        pool.shutdown()
 
         assert result is not None
         assert "error" in result.data
@@ -631,8 +610,8 @@ class TestImageContentTypeValidation:
         with pytest.raises(ValueError, match=r"\.png.*JPEG"):
             component.process_files([base_file])
 
-    @patch("subprocess.run")
-    def test_process_files_silent_mode_skips_mismatched_image(self, mock_subprocess, tmp_path):
+    @patch("lfx.components.files_and_knowledge.file.run_docling_job")
+    def test_process_files_silent_mode_skips_mismatched_image(self, mock_run_docling_job, tmp_path):
         """Test that process_files in silent mode logs but doesn't raise for mismatched images."""
         # Create a JPEG file but with .png extension
         mismatched_file = tmp_path / "fake.png"
@@ -656,10 +635,7 @@ class TestImageContentTypeValidation:
             "doc": [],
             "meta": {"file_path": str(mismatched_file)},
         }
-        mock_subprocess.return_value = MagicMock(
-            stdout=json.dumps(mock_result).encode("utf-8"),
-            stderr=b"",
-        )
+        mock_run_docling_job.return_value = mock_result
 
         from lfx.base.data.base_file import BaseFileComponent
 
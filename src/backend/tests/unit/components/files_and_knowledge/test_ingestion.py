@@ -1,3 +1,4 @@
+import hashlib
 import json
 from unittest.mock import MagicMock, patch
 
@@ -263,6 +264,103 @@ class TestKnowledgeIngestionComponent(ComponentTestBaseWithClient):
         # Should only return one object (second row) since first is duplicate
         assert len(data_objects) == 1
 
+    async def test_convert_df_to_data_objects_queries_existing_hashes_once(self, component_class, default_kwargs):
+        """Test that existing hashes are looked up once and rows repeated within the input are all kept."""
+        component = component_class(**default_kwargs)
+        data_df = DataFrame(
+            {
+                "text": ["Sample text 1", None, "Sample text 3", "Sample text 4"],
+                "title": ["Title 1", "Title 2", None, "Title 4"],
+                "category": ["cat1", "cat2", "cat1", "cat4"],
+            }
+        )
+        config_list = default_kwargs["column_config"]
+
+        with patch("langflow.components.knowledge_bases.ingestion.Chroma") as mock_chroma:
+            mock_chroma_instance = MagicMock()
+            mock_chroma_instance.get.return_value = {"metadatas": []}
+            mock_chroma.return_value = mock_chroma_instance
+
+            data_objects = await component._convert_df_to_data_objects(data_df, config_list)
+
+        # Only the hashes being ingested are queried, without documents or embeddings
+        mock_chroma_instance.get.assert_called_once()
+        query = mock_chroma_instance.get.call_args.kwargs
+        assert query["include"] == ["metadatas"]
+        assert len(query["where"]["_id"]["$in"]) == 3
+
+        # The third row has the same identifier as the first one, but only rows already stored are skipped
+        assert [obj.data["category"] for obj in data_objects] == ["cat1", "cat2", "cat1", "cat4"]
+        assert data_objects[0].data["_id"] == data_objects[2].data["_id"]
+        assert data_objects[1].data["text"] == ""
+        assert data_objects[0].data["title"] == "Title 1"
+
+    async def test_convert_df_to_data_objects_keeps_row_text_of_numeric_frames(self, component_class, default_kwargs):
+        """Test that ints in frames that also hold floats keep the text and hashes iterating rows gave them."""
+        component = component_class(**default_kwargs)
+        data_df = DataFrame({"count": [1, 2], "score": [1.5, None], "rank": [3, 4]})
+        config_list = [
+            {"column_name": "count", "vectorize": True, "identifier": False},
+            {"column_name": "score", "vectorize": True, "identifier": False},
+            {"column_name": "rank", "vectorize": False, "identifier": True},
+        ]
+
+        with patch("langflow.components.knowledge_bases.ingestion.Chroma") as mock_chroma:
+            mock_chroma_instance = MagicMock()
+            mock_chroma_instance.get.return_value = {"metadatas": []}
+            mock_chroma.return_value = mock_chroma_instance
+
+            data_objects = await component._convert_df_to_data_objects(data_df, config_list)
+
+        rows = [row for _, row in data_df.iterrows()]
+        assert [obj.data["text"] for obj in data_objects] == ["1.0 1.5", "2.0"]
+        assert [obj.data["rank"] for obj in data_objects] == [str(row["rank"]) for row in rows] == ["3.0", "4.0"]
+        assert [obj.data["_id"] for obj in data_objects] == [
+            hashlib.sha256(str(row["rank"]).encode()).hexdigest() for row in rows
+        ]
+
+    async def test_create_vector_store_adds_documents_in_batches(self, component_class, default_kwargs):
+        """Test that documents are embedded and added to the vector store in chunk_size batches."""
+        default_kwargs["chunk_size"] = 1
+        default_kwargs["allow_duplicates"] = True
+        component = component_class(**default_kwargs)
+        data_df = default_kwargs["input_df"]
+        config_list = default_kwargs["column_config"]
+
+        embeddings = MagicMock()
+        embeddings.embed_documents.side_effect = lambda texts: [[float(len(text))] for text in texts]
+        written = []
+
+        with (
+            patch("langflow.components.knowledge_bases.ingestion.Chroma") as mock_chroma,
+            patch.object(component, "_build_embeddings", return_value=embeddings),
+        ):
+            mock_chroma_instance = MagicMock()
+            # Chroma embeds the documents it adds with the embedding function it was built with
+            embedding_function = None
+
+            def add_documents(batch):
+                written.append(embedding_function.embed_documents([doc.page_content for doc in batch]))
+
+            def build_chroma(**kwargs):
+                nonlocal embedding_function
+                embedding_function = kwargs["embedding_function"]
+                return mock_chroma_instance
+
+            mock_chroma.side_effect = build_chroma
+            mock_chroma_instance.add_documents.side_effect = add_documents
+
+            await component._create_vector_store(
+                data_df, config_list, embedding_model="sentence-transformers/all-MiniLM-L6-v2", api_key=None
+            )
+
+        assert mock_chroma_instance.add_documents.call_count == 2
+        added = [call.args[0] for call in mock_chroma_instance.add_documents.call_args_list]
+        assert all(len(batch) == 1 for batch in added)
+        # Each batch is embedded once, ahead of its write
+        assert embeddings.embed_documents.call_count == 2
+        assert written == [[[float(len(batch[0].page_content))]] for batch in added]
+
     def test_is_valid_collection_name(self, component_class, default_kwargs):
         """Test collection name validation."""
         component = component_class(**default_kwargs)
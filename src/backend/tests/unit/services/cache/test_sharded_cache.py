@@ -0,0 +1,109 @@
+import asyncio
+import sys
+from unittest.mock import patch
+
+import pytest
+from langflow.services.cache.service import ShardedMemoryCache
+from langflow.services.cache.utils import estimate_size
+from lfx.services.cache.utils import CACHE_MISS
+
+
+def test_estimate_size_follows_containers_and_attributes():
+    class Holder:
+        def __init__(self, value):
+            self.value = value
+
+    text = "x" * 10_000
+
+    assert estimate_size(text) >= 10_000
+    assert estimate_size({"a": [text]}) > estimate_size(text)
+    assert estimate_size(Holder(text)) > estimate_size(text)
+    # Shared objects are counted once
+    assert estimate_size([text, text]) < 2 * estimate_size(text)
+
+
+def test_estimate_size_reports_values_over_the_object_cap_as_too_large():
+    values = [str(index) for index in range(100)]
+
+    assert estimate_size(values, max_objects=10) == sys.maxsize
+    assert estimate_size(values) < sys.maxsize
+    # Sizing stops once the limit is exceeded
+    assert 100 < estimate_size(values, limit=100) < estimate_size(values)
+
+
+async def test_get_set_and_stats():
+    cache = ShardedMemoryCache(max_bytes=0, shards=4, sweep_interval=0)
+
+    await cache.set("a", {"value": 1})
+    await cache.upsert("a", {"other": 2})
+
+    assert await cache.get("a") == {"value": 1, "other": 2}
+    assert await cache.get("b") is CACHE_MISS
+    assert await cache.contains("a")
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["bytes"] > 0
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+    await cache.delete("a")
+    assert cache.stats()["bytes"] == 0
+    assert await cache.get("a") is CACHE_MISS
+
+
+async def test_evicts_least_recently_used_entries_over_the_byte_budget():
+    entry_size = estimate_size("x" * 10_000)
+    cache = ShardedMemoryCache(max_bytes=3 * entry_size, shards=1, sweep_interval=0)
+
+    for key in ("a", "b", "c"):
+        await cache.set(key, "x" * 10_000)
+    await cache.get("a")
+    await cache.set("d", "x" * 10_000)
+
+    assert await cache.get("b") is CACHE_MISS
+    assert await cache.get("a") is not CACHE_MISS
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= 3 * entry_size
+
+
+async def test_does_not_cache_entries_larger_than_a_shard():
+    cache = ShardedMemoryCache(max_bytes=1000, shards=1, sweep_interval=0)
+
+    await cache.set("big", "x" * 10_000)
+
+    assert await cache.get("big") is CACHE_MISS
+    assert cache.stats()["rejections"] == 1
+
+
+async def test_sweeps_expired_entries_in_the_background():
+    cache = ShardedMemoryCache(max_bytes=0, expiration_time=0.01, sweep_interval=0.02)
+    try:
+        await cache.set("a", 1)
+        await asyncio.sleep(0.1)
+
+        assert len(cache) == 0
+        assert cache.stats()["expirations"] == 1
+    finally:
+        await cache.teardown()
+
+
+@pytest.mark.parametrize("shards", [1, 8])
+async def test_concurrent_sets_keep_byte_accounting_consistent(shards):
+    cache = ShardedMemoryCache(max_bytes=10_000, shards=shards, sweep_interval=0)
+
+    await asyncio.gather(*(asyncio.to_thread(asyncio.run, cache.set(f"key-{i}", "x" * 500)) for i in range(50)))
+
+    stats = cache.stats()
+    assert stats["bytes"] == sum(item["size"] for shard in cache._shards for item in shard.entries.values())
+    assert stats["bytes"] <= 10_000
+
+
+async def test_does_not_cache_entries_with_too_many_objects_to_size():
+    cache = ShardedMemoryCache(max_bytes=1024 * 1024, shards=1, sweep_interval=0)
+
+    with patch("langflow.services.cache.service.estimate_size", return_value=sys.maxsize):
+        await cache.set("a", [object()])
+
+    assert await cache.get("a") is CACHE_MISS
+    assert cache.stats()["rejections"] == 1
@@ -0,0 +1,91 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from langflow.services.database.models.api_key.model import ApiKey
+from langflow.services.database.models.user.model import User
+from langflow.services.database.write_behind import WriteBehindLogger
+from lfx.services.settings.base import Settings
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.fixture
+def settings():
+    return Settings(db_write_behind_batch_size=2, db_write_behind_flush_interval=0.05)
+
+
+@pytest.fixture
+async def patched(async_session: AsyncSession, settings):
+    session_count = 0
+
+    @asynccontextmanager
+    async def session_scope():
+        nonlocal session_count
+        session_count += 1
+        yield async_session
+
+    settings_service = MagicMock()
+    settings_service.settings = settings
+    with (
+        patch("langflow.services.database.write_behind.session_scope", session_scope),
+        patch("langflow.services.database.write_behind.get_settings_service", return_value=settings_service),
+    ):
+        yield lambda: session_count
+
+
+@pytest.fixture
+async def api_keys(async_session: AsyncSession):
+    user = User(username=f"user-{uuid4()}", password="hashed", is_active=True)  # noqa: S106
+    async_session.add(user)
+    await async_session.flush()
+    keys = [ApiKey(name=f"key-{i}", api_key=f"sk-{uuid4()}", user_id=user.id, total_uses=2) for i in range(3)]
+    async_session.add_all(keys)
+    await async_session.commit()
+    yield keys
+    for api_key in keys:
+        await async_session.delete(api_key)
+    await async_session.delete(user)
+    await async_session.commit()
+
+
+async def test_api_key_uses_are_written_as_one_update_per_key(async_session: AsyncSession, patched, api_keys):
+    api_key = api_keys[0]
+    writer = WriteBehindLogger()
+    for _ in range(3):
+        writer.add_api_key_use(api_key.id)
+    assert writer.pending == 1
+
+    await writer.flush()
+
+    await async_session.refresh(api_key)
+    assert writer.pending == 0
+    assert patched() == 1
+    assert api_key.total_uses == 5
+    assert api_key.last_used_at is not None
+
+
+@pytest.mark.usefixtures("patched")
+async def test_batch_size_triggers_flush_and_stop_drains(async_session: AsyncSession, settings, api_keys):
+    settings.db_write_behind_flush_interval = 60
+    writer = WriteBehindLogger()
+    await writer.start()
+    try:
+        for api_key in api_keys[: settings.db_write_behind_batch_size]:
+            writer.add_api_key_use(api_key.id)
+        for _ in range(100):
+            if writer.pending == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert writer.pending == 0
+
+        writer.add_api_key_use(api_keys[-1].id)
+    finally:
+        await writer.stop()
+
+    assert not writer.is_running()
+    assert writer.pending == 0
+    for api_key in api_keys:
+        await async_session.refresh(api_key)
+    assert [api_key.total_uses for api_key in api_keys] == [3, 3, 3]
@@ -0,0 +1,44 @@
+import asyncio
+from unittest.mock import MagicMock
+
+from langflow.services.job_queue.service import JobQueueService
+from lfx.events.bounded_queue import BoundedEventQueue
+
+
+async def test_job_queues_are_bounded_as_configured():
+    service = JobQueueService(event_queue_max_size=2, event_queue_policy="drop")
+
+    queue, event_manager = service.create_queue("job")
+    for chunk in ("a", "b", "c"):
+        event_manager.on_token(data={"chunk": chunk, "id": "m"})
+    event_manager.on_end(data={})
+
+    assert isinstance(queue, BoundedEventQueue)
+    assert queue.max_size == 2
+    assert queue.qsize() == 3
+    assert queue.coalesced == 1
+
+
+async def test_overflow_and_depth_are_reported():
+    telemetry = MagicMock()
+    service = JobQueueService(event_queue_max_size=1, event_queue_policy="spill", telemetry=telemetry)
+    service.QUEUE_DEPTH_REPORT_INTERVAL = 0.01
+    service.start()
+    try:
+        queue, event_manager = service.create_queue("job")
+        run_queue = service.create_event_queue("run")
+        for chunk in ("a", "b", "c"):
+            event_manager.on_token(data={"chunk": chunk, "id": "m"})
+        run_queue.put_nowait(("token-1", b"{}", 0.0))
+        await asyncio.sleep(0.05)
+    finally:
+        await service.stop()
+
+    telemetry.increment_counter.assert_called_with(
+        "event_queue_overflow_events", {"queue": "build", "reason": "spilled"}
+    )
+    assert telemetry.increment_counter.call_count == 2
+    telemetry.update_gauge.assert_any_call("event_queue_depth", 3, {"queue": "build"})
+    telemetry.update_gauge.assert_any_call("event_queue_depth", 1, {"queue": "run"})
+    # Stopping the service cleaned the job's queue up
+    assert queue.empty()
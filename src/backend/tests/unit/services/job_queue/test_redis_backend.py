@@ -0,0 +1,220 @@
+import asyncio
+import json
+import time
+
+import pytest
+from langflow.api.build import get_stored_flow_events_response
+from langflow.api.utils import EventDeliveryType
+from langflow.services.job_queue.backends import RedisJobEventBackend, StoredEvent
+from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
+
+
+def _entry_number(entry_id) -> int:
+    if isinstance(entry_id, bytes):
+        entry_id = entry_id.decode()
+    return int(entry_id.split("-")[0])
+
+
+class FakeRedis:
+    """The commands of redis.asyncio.Redis used by RedisJobEventBackend, kept in memory."""
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.streams: dict[str, list[tuple[bytes, dict]]] = {}
+        self.expirations: dict[str, int] = {}
+        self._last_id = 0
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+        if ex is not None:
+            self.expirations[key] = ex
+        return True
+
+    async def exists(self, *keys):
+        return sum(key in self.values or key in self.streams for key in keys)
+
+    async def expire(self, key, seconds):
+        self.expirations[key] = seconds
+        return True
+
+    async def xadd(self, key, fields, maxlen=None, *, approximate=True):  # noqa: ARG002
+        self._last_id += 1
+        entry_id = f"{self._last_id}-0".encode()
+        stream = self.streams.setdefault(key, [])
+        stream.append((entry_id, dict(fields)))
+        if maxlen is not None:
+            del stream[:-maxlen]
+        return entry_id
+
+    async def xread(self, streams, count=None, block=None):  # noqa: ARG002
+        deadline = time.monotonic() + (block or 0) / 1000
+        while True:
+            response = []
+            for key, last_id in streams.items():
+                after = _entry_number(last_id)
+                entries = [entry for entry in self.streams.get(key, []) if _entry_number(entry[0]) > after]
+                if entries:
+                    response.append([key.encode(), entries])
+            if response or not block or time.monotonic() >= deadline:
+                return response
+            await asyncio.sleep(0.005)
+
+    def pipeline(self, *, transaction=True):  # noqa: ARG002
+        return FakePipeline(self)
+
+    async def aclose(self):
+        pass
+
+
+class FakePipeline:
+    def __init__(self, client: FakeRedis):
+        self._client = client
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._commands.clear()
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        def queue_command(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+
+        return queue_command
+
+    async def execute(self):
+        return [await method(*args, **kwargs) for method, args, kwargs in self._commands]
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def backend(redis_client):
+    return RedisJobEventBackend(redis_client, ttl=60, max_events=100)
+
+
+def event(name: str) -> bytes:
+    return (json.dumps({"event": name, "data": {}}) + "\n\n").encode()
+
+
+async def test_read_returns_events_after_the_last_event_id(backend):
+    await backend.register("job")
+    await backend.append("job", [event("a"), event("b")])
+    await backend.append("job", [event("c"), None])
+
+    events = await backend.read("job")
+    resumed = await backend.read("job", events[1].event_id)
+
+    assert [e.data for e in events] == [event("a"), event("b"), event("c"), None]
+    assert resumed == events[2:]
+    assert all(isinstance(e, StoredEvent) for e in events)
+
+
+async def test_read_waits_for_events(backend):
+    await backend.register("job")
+
+    async def append_later():
+        await asyncio.sleep(0.05)
+        await backend.append("job", [event("a")])
+
+    appender = asyncio.create_task(append_later())
+    events = await backend.read("job", timeout=2)
+    await appender
+
+    assert [e.data for e in events] == [event("a")]
+
+
+async def test_unknown_jobs_raise_not_found(backend):
+    with pytest.raises(JobQueueNotFoundError):
+        await backend.read("missing")
+    with pytest.raises(JobQueueNotFoundError):
+        await backend.request_cancel("missing")
+
+
+async def test_keys_expire_after_the_last_event(backend, redis_client):
+    await backend.register("job")
+    await backend.append("job", [event("a")])
+
+    assert redis_client.expirations == {"langflow:job:job": 60, "langflow:job:job:events": 60}
+
+
+async def test_events_of_a_job_can_be_read_and_resumed_from_another_worker(backend):
+    worker_a = JobQueueService(event_backend=backend, cancel_poll_interval=0.01)
+    worker_b = JobQueueService(event_backend=backend, cancel_poll_interval=0.01)
+    try:
+        _, event_manager = worker_a.create_queue("job")
+
+        async def build():
+            event_manager.on_build_start(data={"id": "vertex"})
+            event_manager.on_build_end(data={"id": "vertex"})
+            event_manager.on_end(data={})
+            await event_manager.queue.put((None, None, time.time()))
+
+        await worker_a.register_job("job")
+        worker_a.start_job("job", build())
+
+        events: list[StoredEvent] = []
+        while not events or events[-1].data is not None:
+            events.extend(await worker_b.read_events("job", events[-1].event_id if events else None, timeout=1))
+
+        names = [json.loads(e.data)["event"] for e in events[:-1]]
+        assert names == ["build_start", "build_end", "end"]
+        assert await worker_b.read_events("job", events[0].event_id) == events[1:]
+        assert not worker_b.is_local_job("job")
+    finally:
+        await worker_a.stop()
+        await worker_b.stop()
+
+
+async def test_polling_resumes_after_the_id_of_the_last_event_served(backend):
+    service = JobQueueService(event_backend=backend)
+    await backend.register("job")
+    await backend.append("job", [event("a"), event("b")])
+
+    async def poll(last_event_id: str | None) -> list[dict]:
+        response = await get_stored_flow_events_response(
+            job_id="job",
+            queue_service=service,
+            event_delivery=EventDeliveryType.POLLING,
+            last_event_id=last_event_id,
+        )
+        return [json.loads(line) for line in response.body.decode().splitlines() if line.strip()]
+
+    first = await poll(None)
+    await backend.append("job", [event("c"), None])
+    second = await poll(first[-1]["id"])
+
+    assert [e["event"] for e in first] == ["a", "b"]
+    assert [e["event"] for e in second] == ["c"]
+
+
+async def test_a_job_can_be_cancelled_from_another_worker(backend):
+    worker_a = JobQueueService(event_backend=backend, cancel_poll_interval=0.01)
+    worker_b = JobQueueService(event_backend=backend, cancel_poll_interval=0.01)
+    try:
+        worker_a.create_queue("job")
+        await worker_a.register_job("job")
+        worker_a.start_job("job", asyncio.sleep(60))
+        _, _, task, _ = worker_a.get_queue_data("job")
+
+        await worker_b.request_cancel("job")
+
+        events = await worker_b.read_events("job", timeout=2)
+        assert events[-1].data is None
+        assert task.cancelled()
+    finally:
+        await worker_a.stop()
+        await worker_b.stop()
+
+
+async def test_request_cancel_without_backend_requires_a_local_job():
+    service = JobQueueService()
+
+    with pytest.raises(JobQueueNotFoundError):
+        await service.request_cancel("missing")
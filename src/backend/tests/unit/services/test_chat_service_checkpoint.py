@@ -0,0 +1,163 @@
+import json
+from unittest.mock import patch
+
+import dill
+import pytest
+from langflow.services.cache.base import ExternalAsyncBaseCacheService
+from langflow.services.chat.service import ChatService
+from lfx.graph.graph.base import Graph
+from lfx.services.cache.utils import CACHE_MISS
+
+
+class PicklingCache(ExternalAsyncBaseCacheService):
+    """Stores dill-pickled values, like RedisCache, and records the size of every write."""
+
+    name = "cache_service"
+
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+        self.writes: list[tuple[str, int]] = []
+        self.expirations: list[tuple[str, ...]] = []
+
+    async def is_connected(self) -> bool:
+        return True
+
+    async def get(self, key, lock=None):  # noqa: ARG002
+        value = self.store.get(str(key))
+        return dill.loads(value) if value else CACHE_MISS  # noqa: S301
+
+    async def set(self, key, value, lock=None) -> None:  # noqa: ARG002
+        pickled = dill.dumps(value, recurse=True)
+        self.store[str(key)] = pickled
+        self.writes.append((str(key), len(pickled)))
+
+    async def upsert(self, key, value, lock=None) -> None:
+        await self.set(key, value, lock)
+
+    async def delete(self, key, lock=None) -> None:  # noqa: ARG002
+        self.store.pop(str(key), None)
+
+    async def clear(self, lock=None) -> None:  # noqa: ARG002
+        self.store.clear()
+
+    async def contains(self, key) -> bool:
+        return str(key) in self.store
+
+    async def expire(self, *keys, lock=None) -> int:  # noqa: ARG002
+        self.expirations.append(tuple(str(key) for key in keys))
+        return sum(str(key) in self.store for key in keys)
+
+
+CHAT_INPUT_ID = "ChatInput-vsgM1"
+
+
+@pytest.fixture
+def chat_service():
+    cache = PicklingCache()
+    with patch("langflow.services.chat.service.get_cache_service", return_value=cache):
+        return ChatService()
+
+
+@pytest.fixture
+def graph(json_memory_chatbot_no_llm):
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm)["data"], flow_id="flow-id")
+    graph.set_run_id("run-id")
+    graph.sort_vertices()
+    return graph
+
+
+async def test_graph_topology_is_written_once(chat_service, graph):
+    cache = chat_service.cache_service
+    await chat_service.set_cache("flow-id", graph)
+    topology_writes = [key for key, _ in cache.writes if key.endswith(":topology")]
+
+    vertex = graph.get_vertex(CHAT_INPUT_ID)
+    await graph.build_vertex(vertex.id, inputs_dict={"input_value": "hi"}, user_id="user-id")
+    await chat_service.set_cache("flow-id", graph)
+
+    assert [key for key, _ in cache.writes if key.endswith(":topology")] == topology_writes
+    vertex_writes = [key for key, _ in cache.writes if ":vertex:" in key]
+    assert len(vertex_writes) == 1
+    assert vertex_writes[0].endswith(f":vertex:{vertex.id}")
+
+
+async def test_later_writes_refresh_the_topology_and_earlier_deltas(chat_service, graph):
+    cache = chat_service.cache_service
+    await chat_service.set_cache("flow-id", graph)
+    vertex = graph.get_vertex(CHAT_INPUT_ID)
+    await graph.build_vertex(vertex.id, inputs_dict={"input_value": "hi"}, user_id="user-id")
+    await chat_service.set_cache("flow-id", graph)
+    assert len(cache.expirations) == 1
+    assert any(key.endswith(":topology") for key in cache.expirations[0])
+
+    cache.expirations.clear()
+    await chat_service.set_cache("flow-id", graph)
+
+    # The topology and every earlier delta are refreshed together
+    assert len(cache.expirations) == 1
+    assert any(key.endswith(":topology") for key in cache.expirations[0])
+    assert any(key.endswith(f":vertex:{vertex.id}") for key in cache.expirations[0])
+
+
+async def test_new_graph_deletes_the_checkpoint_it_replaces(chat_service, graph, json_memory_chatbot_no_llm):
+    cache = chat_service.cache_service
+    await chat_service.set_cache("flow-id", graph)
+    vertex = graph.get_vertex(CHAT_INPUT_ID)
+    await graph.build_vertex(vertex.id, inputs_dict={"input_value": "hi"}, user_id="user-id")
+    await chat_service.set_cache("flow-id", graph)
+    replaced_keys = set(cache.store) - {"flow-id"}
+
+    new_graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm)["data"], flow_id="flow-id")
+    await chat_service.set_cache("flow-id", new_graph)
+
+    checkpoint = (await cache.get("flow-id"))["result"]
+    assert replaced_keys.isdisjoint(cache.store)
+    assert set(cache.store) == {"flow-id", *checkpoint.part_keys()}
+
+
+async def test_clear_cache_deletes_the_checkpoint(chat_service, graph):
+    cache = chat_service.cache_service
+    await chat_service.set_cache("flow-id", graph)
+    vertex = graph.get_vertex(CHAT_INPUT_ID)
+    await graph.build_vertex(vertex.id, inputs_dict={"input_value": "hi"}, user_id="user-id")
+    await chat_service.set_cache("flow-id", graph)
+
+    await chat_service.clear_cache("flow-id")
+
+    assert cache.store == {}
+
+
+async def test_default_expire_rewrites_cached_values():
+    cache = PicklingCache()
+    await cache.set("key", {"value": 1})
+
+    refreshed = await ExternalAsyncBaseCacheService.expire(cache, "key", "missing")
+
+    assert refreshed == 1
+    assert [key for key, _ in cache.writes] == ["key", "key"]
+    assert await cache.get("key") == {"value": 1}
+
+
+async def test_graph_is_restored_from_checkpoint(chat_service, graph):
+    await chat_service.set_cache("flow-id", graph)
+    vertex = graph.get_vertex(CHAT_INPUT_ID)
+    await graph.build_vertex(vertex.id, inputs_dict={"input_value": "hi"}, user_id="user-id")
+    await chat_service.set_cache("flow-id", graph)
+
+    cached = await chat_service.get_cache("flow-id")
+
+    restored = cached["result"]
+    assert isinstance(restored, Graph)
+    assert restored is not graph
+    assert restored.run_id == "run-id"
+    assert restored.get_vertex(vertex.id).built
+    assert restored.get_vertex(vertex.id).results.keys() == vertex.results.keys()
+
+
+async def test_missing_checkpoint_part_is_a_cache_miss(chat_service, graph):
+    await chat_service.set_cache("flow-id", graph)
+    cache = chat_service.cache_service
+    topology_key = next(key for key in cache.store if key.endswith(":topology"))
+    await cache.delete(topology_key)
+
+    assert await chat_service.get_cache("flow-id") is CACHE_MISS
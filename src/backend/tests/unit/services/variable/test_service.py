@@ -240,3 +240,59 @@ async def test_create_variable(service, session: AsyncSession):
     assert result.type == CREDENTIAL_TYPE
     assert isinstance(result.created_at, datetime)
     assert isinstance(result.updated_at, datetime)
+
+
+async def test_get_variables(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "first", "value1", session=session)
+    await service.create_variable(user_id, "second", "value2", session=session)
+    await service.create_variable(uuid4(), "third", "other user", session=session)
+
+    with patch.object(session, "exec", wraps=session.exec) as exec_spy:
+        result = await service.get_variables(user_id, ["first", "second", "third", "missing"], session=session)
+        assert exec_spy.call_count == 1
+
+        # Values are cached, so reading them again doesn't query the database
+        assert await service.get_variable(user_id, "first", "", session=session) == "value1"
+        assert await service.get_variables(user_id, ["first", "second"], session=session) == result
+        assert exec_spy.call_count == 1
+
+    assert result == {"first": "value1", "second": "value2"}
+
+
+async def test_get_variable__cache_is_invalidated_on_update_and_delete(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", session=session)
+    assert await service.get_variable(user_id, "name", "", session=session) == "value"
+
+    await service.update_variable(user_id, "name", "new value", session=session)
+    assert await service.get_variable(user_id, "name", "", session=session) == "new value"
+
+    await service.delete_variable(user_id, "name", session=session)
+    with pytest.raises(ValueError, match="name variable not found"):
+        await service.get_variable(user_id, "name", "", session=session)
+
+
+async def test_get_variable__cached_credential_still_rejected_for_session_id(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", type_=CREDENTIAL_TYPE, session=session)
+    await service.get_variables(user_id, ["name"], session=session)
+
+    with pytest.raises(TypeError):
+        await service.get_variable(user_id, "name", "session_id", session=session)
+
+
+def test_expired_values_are_purged_when_other_users_use_the_cache(service):
+    ttl = service.settings_service.settings.variable_cache_ttl
+    idle_user, active_user = uuid4(), uuid4()
+
+    with patch("langflow.services.variable.service.time.monotonic", return_value=1000.0):
+        service._set_cached(idle_user, "secret", CREDENTIAL_TYPE, "plaintext")
+    assert str(idle_user) in service._cache
+
+    # The idle user never reads the secret again, but it is dropped once it has expired
+    with patch("langflow.services.variable.service.time.monotonic", return_value=1000.0 + 2 * ttl):
+        service._set_cached(active_user, "name", None, "value")
+
+    assert str(idle_user) not in service._cache
+    assert service._get_cached(active_user, "name") == (None, "value")
@@ -5,10 +5,12 @@ This module tests the check_key function behavior when:
 - API_KEY_SOURCE='env': Validates against LANGFLOW_API_KEY environment variable
 """
 
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from langflow.services.database.models.api_key.cache import ApiKeyCache, api_key_cache
 from langflow.services.database.models.api_key.crud import (
     _check_key_from_db,
     _check_key_from_env,
@@ -63,6 +65,7 @@ def mock_settings_service_db():
     settings_service.auth_settings.API_KEY_SOURCE = "db"
     settings_service.auth_settings.SUPERUSER = "langflow"
     settings_service.settings.disable_track_apikey_usage = False
+    settings_service.settings.api_key_cache_ttl = 0
     return settings_service
 
 
@@ -73,6 +76,7 @@ def mock_settings_service_env():
     settings_service.auth_settings.API_KEY_SOURCE = "env"
     settings_service.auth_settings.SUPERUSER = "langflow"
     settings_service.settings.disable_track_apikey_usage = False
+    settings_service.settings.api_key_cache_ttl = 0
     return settings_service
 
 
@@ -270,6 +274,92 @@ class TestCheckKeyFromDb:
         assert result is None
 
 
+class TestCheckKeyFromDbCache:
+    """Tests for the in-process cache of verified API keys."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        api_key_cache.clear()
+        yield
+        api_key_cache.clear()
+
+    @pytest.fixture
+    def user(self):
+        return User(id=uuid4(), username="cached", password="hashed", is_active=True)  # noqa: S106
+
+    @pytest.fixture
+    def cached_settings(self, mock_settings_service_db):
+        mock_settings_service_db.settings.api_key_cache_ttl = 60
+        return mock_settings_service_db
+
+    def mock_lookup(self, mock_session, user):
+        mock_api_key = MagicMock()
+        mock_api_key.id = uuid4()
+        mock_api_key.user = user
+        mock_api_key.total_uses = 0
+        mock_result = MagicMock()
+        mock_result.first.return_value = mock_api_key
+        mock_session.exec.return_value = mock_result
+        return mock_api_key
+
+    @pytest.mark.asyncio
+    async def test_cached_key_skips_lookup(self, mock_session, user, cached_settings):
+        cached_settings.settings.disable_track_apikey_usage = True
+        self.mock_lookup(mock_session, user)
+
+        first = await _check_key_from_db(mock_session, "sk-cached", cached_settings)
+        second = await _check_key_from_db(mock_session, "sk-cached", cached_settings)
+
+        assert mock_session.exec.call_count == 1
+        assert first.id == second.id == user.id
+        assert second is not user
+        assert isinstance(second, User)
+
+    @pytest.mark.asyncio
+    async def test_invalidation(self, mock_session, user, cached_settings):
+        cached_settings.settings.disable_track_apikey_usage = True
+        self.mock_lookup(mock_session, user)
+
+        await _check_key_from_db(mock_session, "sk-cached", cached_settings)
+        api_key_cache.invalidate_key("sk-cached")
+        await _check_key_from_db(mock_session, "sk-cached", cached_settings)
+        assert mock_session.exec.call_count == 2
+
+        api_key_cache.invalidate_user(user.id)
+        await _check_key_from_db(mock_session, "sk-cached", cached_settings)
+        assert mock_session.exec.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_uses_are_batched_while_write_behind_runs(self, mock_session, user, cached_settings):
+        mock_api_key = self.mock_lookup(mock_session, user)
+
+        with patch("langflow.services.database.write_behind.write_behind_logger") as mock_logger:
+            mock_logger.is_running.return_value = True
+            for _ in range(3):
+                await _check_key_from_db(mock_session, "sk-cached", cached_settings)
+
+        assert mock_logger.add_api_key_use.call_count == 3
+        mock_logger.add_api_key_use.assert_called_with(mock_api_key.id)
+        assert mock_api_key.total_uses == 0
+        mock_session.flush.assert_not_called()
+
+    def test_expiry_and_size_limit(self, user):
+        cache = ApiKeyCache(max_entries=2)
+        cache.set("sk-1", uuid4(), user, ttl=60)
+        cache.set("sk-2", uuid4(), user, ttl=60)
+        cache.set("sk-3", uuid4(), user, ttl=60)
+        assert len(cache) == 2
+        assert cache.get("sk-1") is None
+        assert cache.get("sk-3") is not None
+
+        cache.set("sk-disabled", uuid4(), user, ttl=0)
+        assert cache.get("sk-disabled") is None
+
+        later = time.monotonic() + 120
+        with patch("langflow.services.database.models.api_key.cache.time.monotonic", return_value=later):
+            assert cache.get("sk-3") is None
+
+
 # ============================================================================
 # _check_key_from_env tests
 # ============================================================================
@@ -490,6 +580,7 @@ class TestCheckKeyIntegration:
         mock_settings = MagicMock()
         mock_settings.auth_settings.API_KEY_SOURCE = "db"
         mock_settings.settings.disable_track_apikey_usage = False
+        mock_settings.settings.api_key_cache_ttl = 0
 
         with patch(
             "langflow.services.database.models.api_key.crud.get_settings_service",
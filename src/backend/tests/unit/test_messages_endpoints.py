@@ -1,3 +1,4 @@
+import json
 from datetime import datetime, timezone
 from urllib.parse import quote
 from uuid import UUID
@@ -235,3 +236,102 @@ async def test_get_messages_empty_result_with_encoded_nonexistent_session(client
     assert response.status_code == 200, response.text
     messages = response.json()
     assert len(messages) == 0
+
+
+@pytest.fixture
+async def many_messages(session):  # noqa: ARG001
+    """Create messages across several sessions, some sharing a timestamp."""
+    timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    async with session_scope() as _session:
+        messages = [
+            MessageTable.model_validate(
+                MessageCreate(
+                    text=f"Message {i}",
+                    sender="User",
+                    sender_name="User",
+                    session_id=f"paged_session_{i % 3}",
+                    timestamp=timestamp.replace(minute=i // 6),
+                ),
+                from_attributes=True,
+            )
+            for i in range(12)
+        ]
+        return await aadd_messagetables(messages, _session)
+
+
+@pytest.mark.api_key_required
+async def test_get_messages_keyset_pagination(client: AsyncClient, many_messages, logged_in_headers):
+    session_id = many_messages[0].session_id
+    # Messages sharing a timestamp are ordered by id
+    session_messages = [msg for msg in many_messages if msg.session_id == session_id]
+    expected = [msg.text for msg in sorted(session_messages, key=lambda msg: (msg.timestamp, msg.id))]
+
+    texts = []
+    cursor = None
+    for _ in range(len(expected)):
+        params = {"session_id": session_id, "limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("api/v1/monitor/messages", params=params, headers=logged_in_headers)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        assert len(page) <= 3
+        texts.extend(message["text"] for message in page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert texts == expected
+
+
+@pytest.mark.api_key_required
+async def test_get_messages_invalid_cursor(client: AsyncClient, logged_in_headers):
+    response = await client.get(
+        "api/v1/monitor/messages", params={"cursor": "not-a-cursor", "limit": 2}, headers=logged_in_headers
+    )
+    assert response.status_code == 400, response.text
+
+    response = await client.get(
+        "api/v1/monitor/messages", params={"order_by": "sender", "limit": 2}, headers=logged_in_headers
+    )
+    assert response.status_code == 400, response.text
+
+
+@pytest.mark.api_key_required
+@pytest.mark.usefixtures("many_messages")
+async def test_get_message_sessions_pagination(client: AsyncClient, logged_in_headers):
+    response = await client.get("api/v1/monitor/messages/sessions", headers=logged_in_headers)
+    assert response.status_code == 200, response.text
+    all_sessions = sorted(response.json())
+
+    sessions = []
+    cursor = None
+    for _ in range(len(all_sessions)):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("api/v1/monitor/messages/sessions", params=params, headers=logged_in_headers)
+        assert response.status_code == 200, response.text
+        sessions.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert sessions == all_sessions
+
+
+@pytest.mark.api_key_required
+async def test_export_messages_ndjson(client: AsyncClient, many_messages, logged_in_headers):
+    session_id = many_messages[1].session_id
+
+    response = await client.get(
+        "api/v1/monitor/messages/export", params={"session_id": session_id}, headers=logged_in_headers
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    session_messages = [msg for msg in many_messages if msg.session_id == session_id]
+    assert [line["text"] for line in lines] == [
+        msg.text for msg in sorted(session_messages, key=lambda msg: (msg.timestamp, msg.id))
+    ]
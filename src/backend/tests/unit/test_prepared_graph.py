@@ -0,0 +1,60 @@
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from langflow.processing.prepared_graph import PreparedGraphCache
+
+
+@pytest.fixture
+def flow(json_memory_chatbot_no_llm):
+    return SimpleNamespace(
+        id=uuid4(),
+        name="Memory Chatbot",
+        updated_at=datetime.now(timezone.utc),
+        data=json.loads(json_memory_chatbot_no_llm)["data"],
+    )
+
+
+def test_prepared_graph_is_reused_across_runs(flow):
+    cache = PreparedGraphCache(maxsize=4)
+
+    first = cache.get_run_graph(flow, {}, stream=False, user_id="user", context={"run": 1})
+    second = cache.get_run_graph(flow, {}, stream=False, user_id="user", context={"run": 2})
+
+    assert first is not second
+    assert first.context == {"run": 1}
+    assert second.context == {"run": 2}
+    assert first.raw_graph_data is second.raw_graph_data
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 4}
+
+
+def test_prepared_graph_key_includes_tweaks_and_flow_version(flow):
+    cache = PreparedGraphCache(maxsize=4)
+
+    cache.get_run_graph(flow, {}, stream=False, user_id="user")
+    tweaked = cache.get_run_graph(flow, {"ChatInput-vsgM1": {"input_value": "tweaked"}}, stream=False, user_id="user")
+    flow.updated_at += timedelta(seconds=1)
+    cache.get_run_graph(flow, {}, stream=False, user_id="user")
+
+    assert tweaked.get_vertex("ChatInput-vsgM1").params["input_value"] == "tweaked"
+    assert cache.stats()["misses"] == 3
+
+
+def test_prepared_graph_invalidate(flow):
+    cache = PreparedGraphCache(maxsize=4)
+    cache.get_run_graph(flow, {}, stream=False, user_id="user")
+
+    cache.invalidate(str(flow.id))
+    cache.get_run_graph(flow, {}, stream=False, user_id="user")
+
+    assert cache.stats()["misses"] == 2
+
+
+def test_prepared_graph_cache_disabled(flow):
+    cache = PreparedGraphCache(maxsize=0)
+    graph = cache.get_run_graph(flow, {}, stream=False, user_id="user")
+
+    assert graph.flow_id == str(flow.id)
+    assert cache.stats()["size"] == 0
@@ -0,0 +1,99 @@
+import gzip
+import json
+
+from langflow.utils.component_catalog import ComponentCatalog, EncodedCatalog
+
+ALL_TYPES = {
+    "inputs": {"ChatInput": {"display_name": "Chat Input"}, "TextInput": {"display_name": "Text Input"}},
+    "outputs": {"ChatOutput": {"display_name": "Chat Output"}},
+}
+
+
+class TestEncodedCatalog:
+    """Test cases for the encoded component catalog."""
+
+    def test_build_encodes_the_catalog(self):
+        catalog = EncodedCatalog.build(ALL_TYPES)
+
+        assert json.loads(catalog.body) == ALL_TYPES
+        assert gzip.decompress(catalog.gzip_body) == catalog.body
+        assert catalog.version == EncodedCatalog.build(json.loads(catalog.body)).version
+
+    def test_response_negotiates_the_encoding(self):
+        catalog = EncodedCatalog.build(ALL_TYPES)
+
+        response = catalog.response({"accept-encoding": "gzip, deflate"})
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["ETag"] == catalog.etag
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert gzip.decompress(response.body) == catalog.body
+
+        response = catalog.response({"accept-encoding": "gzip;q=0"})
+        assert "Content-Encoding" not in response.headers
+        assert response.body == catalog.body
+
+    def test_response_is_not_modified_for_a_matching_etag(self):
+        catalog = EncodedCatalog.build(ALL_TYPES)
+
+        response = catalog.response({"if-none-match": f'"other", {catalog.etag}'})
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["ETag"] == catalog.etag
+
+
+class TestComponentCatalog:
+    """Test cases for the component catalog and its deltas."""
+
+    async def test_get_rebuilds_only_when_the_source_changes(self):
+        component_catalog = ComponentCatalog()
+        all_types = json.loads(json.dumps(ALL_TYPES))
+
+        first = await component_catalog.get(all_types, 1)
+        assert await component_catalog.get(all_types, 1) is first
+
+        all_types["outputs"]["ChatOutput"]["display_name"] = "Output"
+        second = await component_catalog.get(all_types, 2)
+        assert second is not first
+        assert second.version != first.version
+
+    async def test_get_rebuilds_for_other_component_types_of_the_same_version(self):
+        component_catalog = ComponentCatalog()
+
+        first = await component_catalog.get(json.loads(json.dumps(ALL_TYPES)), 1)
+        # The first dict is no longer referenced by the caller, so a new one could reuse its id
+        second = await component_catalog.get({"inputs": ALL_TYPES["inputs"]}, 1)
+
+        assert second.version != first.version
+        assert json.loads(second.body) == {"inputs": ALL_TYPES["inputs"]}
+
+    async def test_delta_has_the_changed_and_removed_components(self):
+        component_catalog = ComponentCatalog()
+        all_types = json.loads(json.dumps(ALL_TYPES))
+        first = await component_catalog.get(all_types, 1)
+
+        all_types["inputs"]["ChatInput"]["display_name"] = "Chat"
+        del all_types["inputs"]["TextInput"]
+        all_types["tools"] = {"Calculator": {"display_name": "Calculator"}}
+        second = await component_catalog.get(all_types, 2)
+
+        delta = json.loads(component_catalog.delta(second, first.version))
+        assert delta == {
+            "version": second.version,
+            "since": first.version,
+            "full": False,
+            "changed": {"inputs": {"ChatInput": {"display_name": "Chat"}}, "tools": all_types["tools"]},
+            "removed": {"inputs": ["TextInput"]},
+        }
+
+    async def test_delta_since_an_unknown_version_is_the_full_catalog(self):
+        component_catalog = ComponentCatalog(history_size=1)
+        first = await component_catalog.get(ALL_TYPES, 1)
+        second = await component_catalog.get({"inputs": ALL_TYPES["inputs"]}, 2)
+
+        delta = json.loads(component_catalog.delta(second, first.version))
+
+        assert delta["full"] is True
+        assert delta["changed"] == {"inputs": ALL_TYPES["inputs"]}
+        assert delta["removed"] == {}
@@ -10,7 +10,9 @@ from langflow.utils.voice_utils import (
     FRAME_DURATION_MS,
     SAMPLE_RATE_24K,
     VAD_SAMPLE_RATE_16K,
+    StreamingResampler,
     _write_bytes_to_file,
+    count_speech_frames,
     resample_24k_to_16k,
     write_audio_to_file,
 )
@@ -172,6 +174,60 @@ class TestResample24kTo16k:
         assert target_samples == 320  # int(480 * 2 / 3)
 
 
+class TestStreamingResampler:
+    """Test the streaming resampler."""
+
+    @staticmethod
+    def _sine(seconds: float, frequency: float = 440.0, amplitude: float = 10000.0) -> bytes:
+        t = np.arange(int(SAMPLE_RATE_24K * seconds)) / SAMPLE_RATE_24K
+        return (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.int16).tobytes()
+
+    def test_frames_resample_to_16k_frames(self):
+        """Test that each 24kHz frame gives a 16kHz frame."""
+        resampler = StreamingResampler()
+        audio = self._sine(0.2)
+
+        for start in range(0, len(audio), BYTES_PER_24K_FRAME):
+            assert len(resampler.process(audio[start : start + BYTES_PER_24K_FRAME])) == BYTES_PER_16K_FRAME
+
+    def test_output_does_not_depend_on_buffer_sizes(self):
+        """Test that the stream resamples the same whatever the sizes of its buffers."""
+        audio = self._sine(0.5)
+        whole = StreamingResampler().process(audio)
+
+        resampler = StreamingResampler()
+        pieces = []
+        start = 0
+        for size in [1, 7, 960, 333, 2, 5000, 11]:
+            pieces.append(resampler.process(audio[start : start + size]))
+            start += size
+        pieces.append(resampler.process(audio[start:]))
+
+        assert b"".join(pieces) == whole
+        assert len(whole) == len(audio) * 2 // 3
+
+    def test_silence_stays_silent(self):
+        """Test that silence resamples to silence."""
+        output = StreamingResampler().process(bytes(BYTES_PER_24K_FRAME * 5))
+
+        assert output == bytes(BYTES_PER_16K_FRAME * 5)
+
+    def test_sine_wave_keeps_its_amplitude(self):
+        """Test that a tone keeps its amplitude once the filter has filled."""
+        output = np.frombuffer(StreamingResampler().process(self._sine(0.5)), dtype=np.int16)
+
+        assert np.abs(output[1000:]).max() == pytest.approx(10000, rel=0.02)
+
+    def test_count_speech_frames_checks_every_complete_frame(self):
+        """Test that every complete 16kHz frame goes through the VAD."""
+        vad = MagicMock()
+        vad.is_speech.side_effect = [True, False, True]
+
+        assert count_speech_frames(vad, bytes(BYTES_PER_16K_FRAME * 3 + 10)) == 2
+        assert vad.is_speech.call_count == 3
+        assert len(vad.is_speech.call_args.args[0]) == BYTES_PER_16K_FRAME
+
+
 class TestWriteAudioToFile:
     """Test cases for write_audio_to_file function."""
 
@@ -0,0 +1,64 @@
+import asyncio
+import io
+import tracemalloc
+import zipfile
+
+import pytest
+from langflow.utils.zip_stream import ZipStreamEntry, stream_zip
+
+
+def make_stream(content_byte: int, size: int, chunk_size: int = 4096):
+    async def open_stream():
+        sent = 0
+        while sent < size:
+            length = min(chunk_size, size - sent)
+            sent += length
+            await asyncio.sleep(0)
+            yield bytes([content_byte]) * length
+
+    return open_stream
+
+
+async def collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+async def test_stream_zip_writes_a_valid_archive():
+    entries = [ZipStreamEntry(f"file_{i}.txt", make_stream(i, 10_000 + i), size=10_000 + i) for i in range(5)]
+    entries.append(ZipStreamEntry("empty.txt", make_stream(0, 0)))
+
+    archive = zipfile.ZipFile(io.BytesIO(await collect(stream_zip(entries, concurrency=2, prefetch_chunks=2))))
+
+    assert archive.testzip() is None
+    assert archive.namelist() == [entry.name for entry in entries]
+    assert archive.read("file_3.txt") == bytes([3]) * 10_003
+    assert archive.read("empty.txt") == b""
+
+
+async def test_stream_zip_raises_errors_from_file_streams():
+    async def missing():
+        msg = "gone"
+        raise FileNotFoundError(msg)
+        yield b""  # pragma: no cover
+
+    entries = [ZipStreamEntry("ok.txt", make_stream(1, 10)), ZipStreamEntry("missing.txt", missing)]
+
+    with pytest.raises(FileNotFoundError, match="gone"):
+        await collect(stream_zip(entries))
+
+
+async def test_stream_zip_memory_does_not_grow_with_archive_size():
+    file_size = 5_000_000
+    entries = [ZipStreamEntry(f"file_{i}.bin", make_stream(i, file_size, 65536), size=file_size) for i in range(10)]
+
+    tracemalloc.start()
+    try:
+        total = 0
+        async for chunk in stream_zip(entries):
+            total += len(chunk)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert total > 10 * file_size
+    assert peak < 10 * file_size / 5
@@ -22,18 +22,23 @@ export async function customPollBuildEvents(
   onEvent,
 ): Promise<void> {
   let isDone = false;
+  // Id of the last event processed, so stored events are not served again
+  let lastEventId: string | undefined;
   while (!isDone) {
-    const response = await fetch(
-      `${url}?event_delivery=${EventDeliveryType.POLLING}`,
-      {
-        method: "GET",
-        headers: {
-          "Content-Type": "application/json",
-          Accept: "application/x-ndjson",
-        },
-        signal: abortController.signal, // Add abort signal to fetch
+    const params = new URLSearchParams({
+      event_delivery: EventDeliveryType.POLLING,
+    });
+    if (lastEventId) {
+      params.set("last_event_id", lastEventId);
+    }
+    const response = await fetch(`${url}?${params.toString()}`, {
+      method: "GET",
+      headers: {
+        "Content-Type": "application/json",
+        Accept: "application/x-ndjson",
       },
-    );
+      signal: abortController.signal, // Add abort signal to fetch
+    });
 
     if (!response.ok) {
       const errorData = await response.json().catch(() => ({}));
@@ -65,6 +70,9 @@ export async function customPollBuildEvents(
     for (const eventStr of eventLines) {
       // Process the event
       const event = JSON.parse(eventStr);
+      if (event.id) {
+        lastEventId = event.id;
+      }
       const result = await onEvent(
         event.event,
         event.data,
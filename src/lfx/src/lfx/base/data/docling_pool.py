@@ -0,0 +1,507 @@
+"""A pool of long-lived Docling worker processes, with an on-disk cache of their results.
+
+Docling still runs outside the Langflow process, but each worker imports it once and keeps one
+`DocumentConverter` per pipeline and OCR engine, so its models are loaded once per worker instead
+of once per file. Workers are replaced after a configurable number of jobs to bound the memory
+growth of native libraries.
+
+Workers are launched as `python -c "<script>"` and exchange one JSON object per line over
+stdin/stdout, which avoids pickling anything through `multiprocessing`.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from lfx.log.logger import logger
+from lfx.services.deps import get_settings_service
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_JOBS_PER_WORKER = 50
+DEFAULT_CACHE_MAX_ENTRIES = 1000
+
+# Options that change what Docling produces for a file; they are part of the cache key
+RESULT_OPTIONS = (
+    "markdown",
+    "image_mode",
+    "md_image_placeholder",
+    "md_page_break_placeholder",
+    "pipeline",
+    "ocr_engine",
+)
+
+_STDERR_TAIL_LINES = 200
+_WORKER_EXIT_TIMEOUT = 5
+
+DOCLING_WORKER_SCRIPT = textwrap.dedent(
+    r"""
+    import json, os, sys
+
+    def try_imports():
+        try:
+            from docling.datamodel.base_models import ConversionStatus, InputFormat  # type: ignore
+            from docling.document_converter import DocumentConverter  # type: ignore
+            from docling_core.types.doc import ImageRefMode  # type: ignore
+            return ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, "latest"
+        except Exception as e:
+            raise e
+
+    def create_converter(strategy, input_format, DocumentConverter, pipeline, ocr_engine):
+        # --- Standard PDF/IMAGE pipeline (your existing behavior), with optional OCR ---
+        if pipeline == "standard":
+            try:
+                from docling.datamodel.pipeline_options import PdfPipelineOptions  # type: ignore
+                from docling.document_converter import PdfFormatOption  # type: ignore
+
+                pipe = PdfPipelineOptions()
+                pipe.do_ocr = False
+
+                if ocr_engine:
+                    try:
+                        from docling.models.factories import get_ocr_factory  # type: ignore
+                        pipe.do_ocr = True
+                        fac = get_ocr_factory(allow_external_plugins=False)
+                        pipe.ocr_options = fac.create_options(kind=ocr_engine)
+                    except Exception:
+                        # If OCR setup fails, disable it
+                        pipe.do_ocr = False
+
+                fmt = {}
+                if hasattr(input_format, "PDF"):
+                    fmt[getattr(input_format, "PDF")] = PdfFormatOption(pipeline_options=pipe)
+                if hasattr(input_format, "IMAGE"):
+                    fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(pipeline_options=pipe)
+
+                return DocumentConverter(format_options=fmt)
+            except Exception:
+                return DocumentConverter()
+
+        # --- Vision-Language Model (VLM) pipeline ---
+        if pipeline == "vlm":
+            try:
+                from docling.datamodel.pipeline_options import VlmPipelineOptions
+                from docling.datamodel.vlm_model_specs import GRANITEDOCLING_MLX, GRANITEDOCLING_TRANSFORMERS
+                from docling.document_converter import PdfFormatOption
+                from docling.pipeline.vlm_pipeline import VlmPipeline
+
+                vl_pipe = VlmPipelineOptions(
+                    vlm_options=GRANITEDOCLING_TRANSFORMERS,
+                )
+
+                if sys.platform == "darwin":
+                    try:
+                        import mlx_vlm
+                        vl_pipe.vlm_options = GRANITEDOCLING_MLX
+                    except ImportError as e:
+                        raise e
+
+                # VLM paths generally don't need OCR; keep OCR off by default here.
+                fmt = {}
+                if hasattr(input_format, "PDF"):
+                    fmt[getattr(input_format, "PDF")] = PdfFormatOption(
+                    pipeline_cls=VlmPipeline,
+                    pipeline_options=vl_pipe
+                )
+                if hasattr(input_format, "IMAGE"):
+                    fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(
+                    pipeline_cls=VlmPipeline,
+                    pipeline_options=vl_pipe
+                )
+
+                return DocumentConverter(format_options=fmt)
+            except Exception as e:
+                raise e
+
+        # --- Fallback: default converter with no special options ---
+        return DocumentConverter()
+
+    def export_markdown(document, ImageRefMode, image_mode, img_ph, pg_ph):
+        try:
+            mode = getattr(ImageRefMode, image_mode.upper(), image_mode)
+            return document.export_to_markdown(
+                image_mode=mode,
+                image_placeholder=img_ph,
+                page_break_placeholder=pg_ph,
+            )
+        except Exception:
+            try:
+                return document.export_to_text()
+            except Exception:
+                return str(document)
+
+    def to_rows(doc_dict):
+        rows = []
+        for t in doc_dict.get("texts", []):
+            prov = t.get("prov") or []
+            page_no = None
+            if prov and isinstance(prov, list) and isinstance(prov[0], dict):
+                page_no = prov[0].get("page_no")
+            rows.append({
+                "page_no": page_no,
+                "label": t.get("label"),
+                "text": t.get("text"),
+                "level": t.get("level"),
+            })
+        return rows
+
+    # Converters are expensive to build (they load models), so each worker keeps one per options
+    converters = {}
+
+    def process(cfg):
+        file_path = cfg["file_path"]
+        markdown = cfg["markdown"]
+        image_mode = cfg["image_mode"]
+        img_ph = cfg["md_image_placeholder"]
+        pg_ph = cfg["md_page_break_placeholder"]
+        pipeline = cfg["pipeline"]
+        ocr_engine = cfg.get("ocr_engine")
+        meta = {"file_path": file_path}
+
+        try:
+            ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, strategy = try_imports()
+            key = (pipeline, ocr_engine)
+            if key not in converters:
+                converters[key] = create_converter(strategy, InputFormat, DocumentConverter, pipeline, ocr_engine)
+            converter = converters[key]
+            try:
+                res = converter.convert(file_path)
+            except Exception as e:
+                return {"ok": False, "error": f"Docling conversion error: {e}", "meta": meta}
+
+            ok = False
+            if hasattr(res, "status"):
+                try:
+                    ok = (res.status == ConversionStatus.SUCCESS) or (str(res.status).lower() == "success")
+                except Exception:
+                    ok = (str(res.status).lower() == "success")
+            if not ok and hasattr(res, "document"):
+                ok = getattr(res, "document", None) is not None
+            if not ok:
+                return {"ok": False, "error": "Docling conversion failed", "meta": meta}
+
+            doc = getattr(res, "document", None)
+            if doc is None:
+                return {"ok": False, "error": "Docling produced no document", "meta": meta}
+
+            if markdown:
+                text = export_markdown(doc, ImageRefMode, image_mode, img_ph, pg_ph)
+                return {"ok": True, "mode": "markdown", "text": text, "meta": meta}
+
+            # structured
+            try:
+                doc_dict = doc.export_to_dict()
+            except Exception as e:
+                return {"ok": False, "error": f"Docling export_to_dict failed: {e}", "meta": meta}
+
+            return {"ok": True, "mode": "structured", "doc": to_rows(doc_dict), "meta": meta}
+        except Exception as e:
+            return {"ok": False, "error": f"Docling processing error: {e}", "meta": meta}
+
+    def main():
+        # Keep the protocol stream to ourselves: anything printed by libraries goes to stderr
+        out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+        os.dup2(2, 1)
+        sys.stdout = sys.stderr
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            out.write(json.dumps(process(json.loads(line))) + "\n")
+            out.flush()
+
+    if __name__ == "__main__":
+        main()
+    """
+)
+
+
+class DoclingWorker:
+    """One worker process, handling one job at a time."""
+
+    def __init__(self, script: str = DOCLING_WORKER_SCRIPT) -> None:
+        self.jobs = 0
+        self._stderr: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+        self._process = subprocess.Popen(  # noqa: S603
+            [sys.executable, "-u", "-c", script],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        # Docling logs a lot to stderr; drain it so the worker never blocks on a full pipe
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_thread.start()
+
+    @property
+    def pid(self) -> int:
+        return self._process.pid
+
+    def is_alive(self) -> bool:
+        return self._process.poll() is None
+
+    def _drain_stderr(self) -> None:
+        stream = self._process.stderr
+        if stream is None:
+            return
+        for line in stream:
+            self._stderr.append(line.decode("utf-8", errors="replace"))
+
+    def stderr_tail(self) -> str:
+        return "".join(self._stderr)
+
+    def run(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Sends `job` to the worker and returns its JSON reply.
+
+        Raises:
+            RuntimeError: If the worker exits or replies with something that isn't JSON.
+        """
+        if self._process.stdin is None or self._process.stdout is None:
+            msg = "Docling worker has no pipes"
+            raise RuntimeError(msg)
+        self.jobs += 1
+        try:
+            self._process.stdin.write(json.dumps(job).encode("utf-8") + b"\n")
+            self._process.stdin.flush()
+            line = self._process.stdout.readline()
+        except OSError as e:
+            msg = f"Docling worker stopped: {e}"
+            raise RuntimeError(msg) from e
+        if not line:
+            self._process.wait()
+            self._stderr_thread.join(timeout=1)
+            msg = self.stderr_tail() or f"Docling worker exited with code {self._process.returncode}"
+            raise RuntimeError(msg)
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError as e:
+            msg = f"Invalid JSON from Docling worker: {e}. stderr={self.stderr_tail()}"
+            raise RuntimeError(msg) from e
+
+    def close(self) -> None:
+        if self._process.stdin is not None:
+            with contextlib.suppress(OSError):
+                self._process.stdin.close()
+        try:
+            self._process.wait(timeout=_WORKER_EXIT_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+
+
+class DoclingWorkerPool:
+    """Runs Docling jobs on at most `size` warm workers, from any number of threads.
+
+    Workers are started on demand and replaced after `max_jobs_per_worker` jobs (0 keeps them
+    forever) or when they die. A job that finds every worker busy waits for one to be free.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER,
+        script: str = DOCLING_WORKER_SCRIPT,
+    ) -> None:
+        self.size = max(size, 1)
+        self.max_jobs_per_worker = max(max_jobs_per_worker, 0)
+        self._script = script
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._idle: list[DoclingWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _acquire_worker(self) -> DoclingWorker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.is_alive():
+                    return worker
+                worker.close()
+        return DoclingWorker(self._script)
+
+    def _release_worker(self, worker: DoclingWorker) -> None:
+        spent = self.max_jobs_per_worker and worker.jobs >= self.max_jobs_per_worker
+        with self._lock:
+            if not self._closed and not spent and worker.is_alive():
+                self._idle.append(worker)
+                return
+        worker.close()
+
+    def run(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Runs `job` on a free worker and returns its result dict.
+
+        Failures of the worker itself are returned as `{"ok": False, "error": ...}`, like
+        conversion errors, and the worker is replaced.
+        """
+        with self._slots:
+            if self._closed:
+                return {"ok": False, "error": "Docling worker pool is shut down", "meta": {}}
+            worker = self._acquire_worker()
+            try:
+                return worker.run(job)
+            except RuntimeError as e:
+                worker.close()
+                return {
+                    "ok": False,
+                    "error": f"Docling subprocess error: {e}",
+                    "meta": {"file_path": job.get("file_path")},
+                }
+            finally:
+                self._release_worker(worker)
+
+    @property
+    def idle_workers(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+
+class DoclingResultCache:
+    """Docling results stored as JSON files, keyed by the content of the file and the result options.
+
+    Only successful results are stored. When there are more than `max_entries` files, the least
+    recently used ones are removed (0 means no limit).
+    """
+
+    def __init__(self, directory: str | Path, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES) -> None:
+        self.directory = Path(directory)
+        self.max_entries = max(max_entries, 0)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(file_path: str | Path, job: dict[str, Any]) -> str:
+        digest = hashlib.sha256()
+        with Path(file_path).open("rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        options = {name: job.get(name) for name in RESULT_OPTIONS}
+        digest.update(json.dumps(options, sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            result = json.loads(path.read_text(encoding="utf-8"))
+            path.touch()
+        except (OSError, json.JSONDecodeError):
+            return None
+        return result
+
+    def set(self, key: str, result: dict[str, Any]) -> None:
+        if not result.get("ok"):
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(result), encoding="utf-8")
+        tmp_path.replace(path)
+        self._evict()
+
+    def _evict(self) -> None:
+        if not self.max_entries:
+            return
+        with self._lock:
+            entries = list(self.directory.glob("*.json"))
+            excess = len(entries) - self.max_entries
+            if excess <= 0:
+                return
+            mtimes: dict[Path, float] = {}
+            for entry in entries:
+                with contextlib.suppress(OSError):
+                    mtimes[entry] = entry.stat().st_mtime
+            for entry in sorted(mtimes, key=mtimes.__getitem__)[:excess]:
+                with contextlib.suppress(OSError):
+                    entry.unlink()
+
+    def clear(self) -> None:
+        for entry in self.directory.glob("*.json"):
+            with contextlib.suppress(OSError):
+                entry.unlink()
+
+
+_pool: DoclingWorkerPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_settings():
+    settings_service = get_settings_service()
+    return settings_service.settings if settings_service else None
+
+
+def get_docling_pool() -> DoclingWorkerPool:
+    """Returns the process-wide worker pool, replacing it if its settings changed."""
+    global _pool  # noqa: PLW0603
+    settings = _get_settings()
+    size = getattr(settings, "docling_worker_pool_size", DEFAULT_POOL_SIZE)
+    max_jobs = getattr(settings, "docling_worker_max_jobs", DEFAULT_MAX_JOBS_PER_WORKER)
+    with _pool_lock:
+        if _pool is None or (_pool.size, _pool.max_jobs_per_worker) != (max(size, 1), max(max_jobs, 0)):
+            if _pool is not None:
+                _pool.shutdown()
+            _pool = DoclingWorkerPool(size=size, max_jobs_per_worker=max_jobs)
+        return _pool
+
+
+def shutdown_docling_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_docling_pool)
+
+
+def get_docling_cache() -> DoclingResultCache | None:
+    """Returns the result cache, or None when it is disabled or there is no config directory."""
+    settings = _get_settings()
+    if not getattr(settings, "docling_cache_enabled", True):
+        return None
+    config_dir = getattr(settings, "config_dir", None)
+    if not config_dir:
+        return None
+    max_entries = getattr(settings, "docling_cache_max_entries", DEFAULT_CACHE_MAX_ENTRIES)
+    return DoclingResultCache(Path(config_dir) / "docling_cache", max_entries=max_entries)
+
+
+def run_docling_job(job: dict[str, Any]) -> dict[str, Any]:
+    """Converts `job["file_path"]` on the worker pool, reusing a cached result for identical content and options."""
+    cache = get_docling_cache()
+    key = None
+    if cache is not None:
+        try:
+            key = cache.key(job["file_path"], job)
+        except OSError as e:
+            logger.debug(f"Could not hash {job['file_path']} for the Docling cache: {e}")
+        else:
+            if (cached := cache.get(key)) is not None:
+                # The same content may have been converted under another path
+                cached["meta"] = {**cached.get("meta", {}), "file_path": job["file_path"]}
+                return cached
+
+    result = get_docling_pool().run(job)
+
+    if cache is not None and key is not None:
+        try:
+            cache.set(key, result)
+        except OSError as e:
+            logger.debug(f"Could not write the Docling cache: {e}")
+    return result
@@ -0,0 +1,176 @@
+"""Runs the body of a loop once per item, concurrently.
+
+The body of a loop is the part of the graph between the loop's item output and the input that
+feeds results back into the loop. To map it over a list of items, the body is copied into its own
+graph, along with the vertices outside the loop that it depends on, and a run instance of that
+graph is built for each item with the item set in place of the loop's item output.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+from lfx.schema.data import Data
+
+if TYPE_CHECKING:
+    from lfx.graph.graph.base import Graph
+
+ErrorPolicy = Literal["fail_fast", "skip", "collect"]
+
+
+class LoopBody(NamedTuple):
+    vertex_ids: list[str]
+    """The vertices of the body, and the vertices outside the loop that they depend on."""
+    item_targets: list[tuple[str, str]]
+    """The vertex and parameter that each edge from the loop's item output targets."""
+    result_source: tuple[str, str] | None
+    """The vertex and output whose result is fed back into the loop."""
+
+
+def _reachable(
+    start: list[str], neighbors: dict[str, list[str]], *, exclude: str, within: set[str] | None = None
+) -> set[str]:
+    reached: set[str] = set()
+    to_visit = list(start)
+    while to_visit:
+        vertex_id = to_visit.pop()
+        if vertex_id == exclude or vertex_id in reached or (within is not None and vertex_id not in within):
+            continue
+        reached.add(vertex_id)
+        to_visit.extend(neighbors.get(vertex_id, []))
+    return reached
+
+
+def get_loop_body(graph: Graph, loop_id: str, output_name: str = "item") -> LoopBody:
+    """Finds the vertices that run for each item of the loop `loop_id`."""
+    item_targets = [
+        (edge.target_id, edge.target_param)
+        for edge in graph.edges
+        if edge.source_id == loop_id and edge.source_handle is not None and edge.source_handle.name == output_name
+    ]
+    result_source = next(
+        (
+            (edge.source_id, edge.source_handle.name)
+            for edge in graph.edges
+            if edge.target_id == loop_id and edge.target_param == output_name and edge.source_handle is not None
+        ),
+        None,
+    )
+
+    # The maps of the graph change while it runs, so follow its edges instead
+    successors: dict[str, list[str]] = {}
+    predecessors: dict[str, list[str]] = {}
+    for edge in graph.edges:
+        successors.setdefault(edge.source_id, []).append(edge.target_id)
+        predecessors.setdefault(edge.target_id, []).append(edge.source_id)
+
+    # The body is made of the vertices reachable from the item output that lead back to the loop
+    downstream = _reachable([target_id for target_id, _ in item_targets], successors, exclude=loop_id)
+    body = _reachable([result_source[0]] if result_source else [], predecessors, exclude=loop_id, within=downstream)
+
+    # Add what the body depends on outside of the loop, such as models or prompts
+    vertex_ids = body | _reachable(
+        [predecessor for vertex_id in body for predecessor in predecessors.get(vertex_id, [])],
+        predecessors,
+        exclude=loop_id,
+    )
+
+    return LoopBody(
+        vertex_ids=[vertex.id for vertex in graph.vertices if vertex.id in vertex_ids],
+        item_targets=[(target_id, param) for target_id, param in item_targets if target_id in body],
+        result_source=result_source if result_source and result_source[0] in body else None,
+    )
+
+
+def build_loop_body_graph(graph: Graph, body: LoopBody) -> Graph:
+    """Builds a graph of the body, without the loop, to create a run instance of for each item."""
+    from lfx.graph.graph.base import Graph
+
+    vertex_ids = set(body.vertex_ids)
+    nodes = [copy.deepcopy(graph.get_vertex(vertex_id).to_data()) for vertex_id in body.vertex_ids]
+    edges = [
+        copy.deepcopy(edge.to_data())
+        for edge in graph.edges
+        if edge.source_id in vertex_ids and edge.target_id in vertex_ids
+    ]
+    return Graph.from_payload(
+        {"nodes": nodes, "edges": edges},
+        flow_id=graph.flow_id,
+        flow_name=graph.flow_name,
+        user_id=graph.user_id,
+        context=dict(graph.context),
+    )
+
+
+async def run_loop_body(graph: Graph, template: Graph, body: LoopBody, item: Data) -> Any:
+    """Runs a run instance of `template` for `item` and returns the result fed back into the loop."""
+    run_graph = template.create_run_instance(context=dict(graph.context))
+    if graph.session_id:
+        run_graph.session_id = graph.session_id
+        for vertex_id in run_graph.has_session_id_vertices:
+            run_graph.get_vertex(vertex_id).update_raw_params({"session_id": graph.session_id})
+    for vertex_id, param in body.item_targets:
+        run_graph.get_vertex(vertex_id).update_raw_params({param: item}, overwrite=True)
+
+    await run_graph.process(fallback_to_env_vars=False)
+
+    if body.result_source is None:
+        return None
+    vertex_id, output_name = body.result_source
+    result = run_graph.get_vertex(vertex_id).results.get(output_name)
+    # Like the sequential loop, which only aggregates items it received
+    if isinstance(result, str):
+        return None
+    return result
+
+
+async def map_loop_body(
+    graph: Graph,
+    loop_id: str,
+    items: list[Data],
+    *,
+    max_concurrency: int,
+    error_policy: ErrorPolicy = "fail_fast",
+) -> list[Any]:
+    """Runs the body of the loop `loop_id` for each item, up to `max_concurrency` at a time.
+
+    Args:
+        graph: The graph the loop belongs to.
+        loop_id: The ID of the loop vertex.
+        items: The items to run the body for.
+        max_concurrency: How many items run at the same time. 0 means no limit.
+        error_policy: What to do when the body fails for an item. "fail_fast" cancels the other items
+            and raises the error, "skip" leaves the item out of the results, and "collect" puts a Data
+            with `error` set and the error as text in place of the item's result.
+
+    Returns:
+        The results fed back into the loop, in the order of the items.
+    """
+    body = get_loop_body(graph, loop_id)
+    if not items or not body.item_targets:
+        return []
+    template = build_loop_body_graph(graph, body)
+    semaphore = asyncio.Semaphore(max_concurrency if max_concurrency > 0 else len(items))
+
+    async def run_item(index: int, item: Data) -> Any:
+        async with semaphore:
+            try:
+                return await run_loop_body(graph, template, body, item)
+            except Exception as exc:
+                if error_policy == "fail_fast":
+                    raise
+                if error_policy == "collect":
+                    return Data(data={"index": index, "error": True, "text": f"{type(exc).__name__}: {exc}"})
+                return None
+
+    tasks = [asyncio.create_task(run_item(index, item)) for index, item in enumerate(items)]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return [result for result in results if result is not None]
@@ -19,7 +19,6 @@ from __future__ import annotations
 
 import asyncio
 import time
-from copy import deepcopy
 from typing import TYPE_CHECKING, Annotated, Any
 
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Security
@@ -419,7 +418,7 @@ def create_multi_serve_app(
             request: RunRequest,
         ) -> RunResponse:
             try:
-                graph_copy = deepcopy(graph)
+                graph_copy = graph.create_run_instance()
                 results, logs = await execute_graph_with_capture(graph_copy, request.input_value)
                 result_data = extract_result_data(results, logs)
 
@@ -2,8 +2,10 @@
 
 Notes:
 -----
-- ALL Docling parsing/export runs in a separate OS process to prevent memory
+- ALL Docling parsing/export runs in separate OS processes to prevent memory
   growth and native library state from impacting the main Langflow process.
+  Those processes are a pool of warm workers (see `lfx.base.data.docling_pool`),
+  and their results are cached on disk by file content and options.
 - Standard text/structured parsing continues to use existing BaseFileComponent
   utilities (and optional threading via `parallel_load_data`).
 """
@@ -11,16 +13,14 @@ Notes:
 from __future__ import annotations
 
 import contextlib
-import json
-import subprocess
-import sys
-import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Any
 
 from lfx.base.data.base_file import BaseFileComponent
+from lfx.base.data.docling_pool import get_docling_pool, run_docling_job
 from lfx.base.data.storage_utils import parse_storage_path, validate_image_content_type
 from lfx.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data
 from lfx.inputs.inputs import DropdownInput, MessageTextInput, StrInput
@@ -469,10 +469,10 @@ class FileComponent(BaseFileComponent):
         return temp_path, True
 
     def _process_docling_in_subprocess(self, file_path: str) -> Data | None:
-        """Run Docling in a separate OS process and map the result to a Data object.
+        """Run Docling in a pooled worker process and map the result to a Data object.
 
-        We avoid multiprocessing pickling by launching `python -c "<script>"` and
-        passing JSON config via stdin. The child prints a JSON result to stdout.
+        The workers are long-lived `python -c "<script>"` processes that receive a JSON
+        config per line on stdin and print a JSON result per line to stdout.
 
         For S3 storage, the file is downloaded to a temp file first.
         """
@@ -495,7 +495,7 @@ class FileComponent(BaseFileComponent):
                     Path(local_path).unlink()  # Ignore cleanup errors
 
     def _process_docling_subprocess_impl(self, local_file_path: str, original_file_path: str) -> Data | None:
-        """Implementation of Docling subprocess processing.
+        """Implementation of Docling worker processing.
 
         Args:
             local_file_path: Path to local file to process
@@ -515,215 +515,24 @@ class FileComponent(BaseFileComponent):
             ),
         }
 
-        self.log(f"Starting Docling subprocess for file: {local_file_path}")
+        self.log(f"Sending file to a Docling worker: {local_file_path}")
         self.log(args)
 
-        # Child script for isolating the docling processing
-        child_script = textwrap.dedent(
-            r"""
-            import json, sys
-
-            def try_imports():
-                try:
-                    from docling.datamodel.base_models import ConversionStatus, InputFormat  # type: ignore
-                    from docling.document_converter import DocumentConverter  # type: ignore
-                    from docling_core.types.doc import ImageRefMode  # type: ignore
-                    return ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, "latest"
-                except Exception as e:
-                    raise e
-
-            def create_converter(strategy, input_format, DocumentConverter, pipeline, ocr_engine):
-                # --- Standard PDF/IMAGE pipeline (your existing behavior), with optional OCR ---
-                if pipeline == "standard":
-                    try:
-                        from docling.datamodel.pipeline_options import PdfPipelineOptions  # type: ignore
-                        from docling.document_converter import PdfFormatOption  # type: ignore
-
-                        pipe = PdfPipelineOptions()
-                        pipe.do_ocr = False
-
-                        if ocr_engine:
-                            try:
-                                from docling.models.factories import get_ocr_factory  # type: ignore
-                                pipe.do_ocr = True
-                                fac = get_ocr_factory(allow_external_plugins=False)
-                                pipe.ocr_options = fac.create_options(kind=ocr_engine)
-                            except Exception:
-                                # If OCR setup fails, disable it
-                                pipe.do_ocr = False
-
-                        fmt = {}
-                        if hasattr(input_format, "PDF"):
-                            fmt[getattr(input_format, "PDF")] = PdfFormatOption(pipeline_options=pipe)
-                        if hasattr(input_format, "IMAGE"):
-                            fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(pipeline_options=pipe)
-
-                        return DocumentConverter(format_options=fmt)
-                    except Exception:
-                        return DocumentConverter()
-
-                # --- Vision-Language Model (VLM) pipeline ---
-                if pipeline == "vlm":
-                    try:
-                        from docling.datamodel.pipeline_options import VlmPipelineOptions
-                        from docling.datamodel.vlm_model_specs import GRANITEDOCLING_MLX, GRANITEDOCLING_TRANSFORMERS
-                        from docling.document_converter import PdfFormatOption
-                        from docling.pipeline.vlm_pipeline import VlmPipeline
-
-                        vl_pipe = VlmPipelineOptions(
-                            vlm_options=GRANITEDOCLING_TRANSFORMERS,
-                        )
-
-                        if sys.platform == "darwin":
-                            try:
-                                import mlx_vlm
-                                vl_pipe.vlm_options = GRANITEDOCLING_MLX
-                            except ImportError as e:
-                                raise e
-
-                        # VLM paths generally don't need OCR; keep OCR off by default here.
-                        fmt = {}
-                        if hasattr(input_format, "PDF"):
-                            fmt[getattr(input_format, "PDF")] = PdfFormatOption(
-                            pipeline_cls=VlmPipeline,
-                            pipeline_options=vl_pipe
-                        )
-                        if hasattr(input_format, "IMAGE"):
-                            fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(
-                            pipeline_cls=VlmPipeline,
-                            pipeline_options=vl_pipe
-                        )
-
-                        return DocumentConverter(format_options=fmt)
-                    except Exception as e:
-                        raise e
-
-                # --- Fallback: default converter with no special options ---
-                return DocumentConverter()
-
-            def export_markdown(document, ImageRefMode, image_mode, img_ph, pg_ph):
-                try:
-                    mode = getattr(ImageRefMode, image_mode.upper(), image_mode)
-                    return document.export_to_markdown(
-                        image_mode=mode,
-                        image_placeholder=img_ph,
-                        page_break_placeholder=pg_ph,
-                    )
-                except Exception:
-                    try:
-                        return document.export_to_text()
-                    except Exception:
-                        return str(document)
-
-            def to_rows(doc_dict):
-                rows = []
-                for t in doc_dict.get("texts", []):
-                    prov = t.get("prov") or []
-                    page_no = None
-                    if prov and isinstance(prov, list) and isinstance(prov[0], dict):
-                        page_no = prov[0].get("page_no")
-                    rows.append({
-                        "page_no": page_no,
-                        "label": t.get("label"),
-                        "text": t.get("text"),
-                        "level": t.get("level"),
-                    })
-                return rows
-
-            def main():
-                cfg = json.loads(sys.stdin.read())
-                file_path = cfg["file_path"]
-                markdown = cfg["markdown"]
-                image_mode = cfg["image_mode"]
-                img_ph = cfg["md_image_placeholder"]
-                pg_ph = cfg["md_page_break_placeholder"]
-                pipeline = cfg["pipeline"]
-                ocr_engine = cfg.get("ocr_engine")
-                meta = {"file_path": file_path}
-
-                try:
-                    ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, strategy = try_imports()
-                    converter = create_converter(strategy, InputFormat, DocumentConverter, pipeline, ocr_engine)
-                    try:
-                        res = converter.convert(file_path)
-                    except Exception as e:
-                        print(json.dumps({"ok": False, "error": f"Docling conversion error: {e}", "meta": meta}))
-                        return
-
-                    ok = False
-                    if hasattr(res, "status"):
-                        try:
-                            ok = (res.status == ConversionStatus.SUCCESS) or (str(res.status).lower() == "success")
-                        except Exception:
-                            ok = (str(res.status).lower() == "success")
-                    if not ok and hasattr(res, "document"):
-                        ok = getattr(res, "document", None) is not None
-                    if not ok:
-                        print(json.dumps({"ok": False, "error": "Docling conversion failed", "meta": meta}))
-                        return
-
-                    doc = getattr(res, "document", None)
-                    if doc is None:
-                        print(json.dumps({"ok": False, "error": "Docling produced no document", "meta": meta}))
-                        return
-
-                    if markdown:
-                        text = export_markdown(doc, ImageRefMode, image_mode, img_ph, pg_ph)
-                        print(json.dumps({"ok": True, "mode": "markdown", "text": text, "meta": meta}))
-                        return
-
-                    # structured
-                    try:
-                        doc_dict = doc.export_to_dict()
-                    except Exception as e:
-                        print(json.dumps({"ok": False, "error": f"Docling export_to_dict failed: {e}", "meta": meta}))
-                        return
-
-                    rows = to_rows(doc_dict)
-                    print(json.dumps({"ok": True, "mode": "structured", "doc": rows, "meta": meta}))
-                except Exception as e:
-                    print(
-                        json.dumps({
-                            "ok": False,
-                            "error": f"Docling processing error: {e}",
-                            "meta": {"file_path": file_path},
-                        })
-                    )
-
-            if __name__ == "__main__":
-                main()
-            """
-        )
-
         # Validate file_path to avoid command injection or unsafe input
         if not isinstance(args["file_path"], str) or any(c in args["file_path"] for c in [";", "|", "&", "$", "`"]):
             return Data(data={"error": "Unsafe file path detected.", "file_path": args["file_path"]})
 
-        proc = subprocess.run(  # noqa: S603
-            [sys.executable, "-u", "-c", child_script],
-            input=json.dumps(args).encode("utf-8"),
-            capture_output=True,
-            check=False,
-        )
-
-        if not proc.stdout:
-            err_msg = proc.stderr.decode("utf-8", errors="replace") or "no output from child process"
-            return Data(data={"error": f"Docling subprocess error: {err_msg}", "file_path": original_file_path})
+        result = run_docling_job(args)
 
-        try:
-            result = json.loads(proc.stdout.decode("utf-8"))
-        except Exception as e:  # noqa: BLE001
-            err_msg = proc.stderr.decode("utf-8", errors="replace")
+        if not result.get("ok"):
             return Data(
                 data={
-                    "error": f"Invalid JSON from Docling subprocess: {e}. stderr={err_msg}",
+                    "error": result.get("error", "Unknown Docling error"),
                     "file_path": original_file_path,
+                    **result.get("meta", {}),
                 },
             )
 
-        if not result.get("ok"):
-            return Data(data={"error": result.get("error", "Unknown Docling error"), **result.get("meta", {})})
-
         meta = result.get("meta", {})
         if result.get("mode") == "markdown":
             exported_content = str(result.get("text", ""))
@@ -741,7 +550,7 @@ class FileComponent(BaseFileComponent):
     ) -> list[BaseFileComponent.BaseFile]:
         """Process input files.
 
-        - advanced_mode => Docling in a separate process.
+        - advanced_mode => Docling in pooled worker processes, several files at a time.
         - Otherwise => standard parsing in current process (optionally threaded).
         """
         if not file_list:
@@ -800,10 +609,12 @@ class FileComponent(BaseFileComponent):
         # Advanced path: Check if ALL files are compatible with Docling
         if self.advanced_mode and docling_compatible:
             final_return: list[BaseFileComponent.BaseFile] = []
-            for file in file_list:
-                file_path = str(file.path)
-                advanced_data: Data | None = self._process_docling_in_subprocess(file_path)
-
+            file_paths = [str(f.path) for f in file_list]
+            # Keep every worker of the pool busy; results come back in input order
+            max_workers = min(get_docling_pool().size, len(file_paths))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self._process_docling_in_subprocess, file_paths))
+            for file, file_path, advanced_data in zip(file_list, file_paths, results, strict=True):
                 # --- UNNEST: expand each element in `doc` to its own Data row
                 payload = getattr(advanced_data, "data", {}) or {}
                 doc_rows = payload.get("doc")
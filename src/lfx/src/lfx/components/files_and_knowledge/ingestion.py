@@ -11,9 +11,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
 from cryptography.fernet import InvalidToken
 from langchain_chroma import Chroma
+from langchain_core.embeddings import Embeddings
 from langflow.services.auth.utils import decrypt_api_key, encrypt_api_key
 from langflow.services.database.models.user.crud import get_user_by_id
 
@@ -51,6 +53,27 @@ COHERE_MODEL_NAMES = ["embed-english-v3.0", "embed-multilingual-v3.0"]
 _KNOWLEDGE_BASES_ROOT_PATH: Path | None = None
 
 
+class _PrecomputedEmbeddings(Embeddings):
+    """Embeddings that returns the vectors computed ahead of time for a text, and embeds the others.
+
+    Lets batches be embedded concurrently while Chroma, which embeds the documents it is given,
+    writes them one batch at a time.
+    """
+
+    def __init__(self, embeddings: Embeddings) -> None:
+        self.embeddings = embeddings
+        self.vectors: dict[str, list[float]] = {}
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        missing = [text for text in texts if text not in self.vectors]
+        if missing:
+            self.vectors.update(zip(missing, self.embeddings.embed_documents(missing), strict=True))
+        return [self.vectors[text] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embeddings.embed_query(text)
+
+
 def _get_knowledge_bases_root_path() -> Path:
     """Lazy load the knowledge bases root path from settings."""
     global _KNOWLEDGE_BASES_ROOT_PATH  # noqa: PLW0603
@@ -189,6 +212,13 @@ class KnowledgeIngestionComponent(Component):
             advanced=True,
             value=1000,
         ),
+        IntInput(
+            name="embedding_concurrency",
+            display_name="Embedding Concurrency",
+            info="Number of batches to embed and add to the knowledge base at the same time",
+            advanced=True,
+            value=4,
+        ),
         SecretStrInput(
             name="api_key",
             display_name="Embedding Provider API Key",
@@ -389,48 +419,93 @@ class KnowledgeIngestionComponent(Component):
             # Convert DataFrame to Data objects (following Local DB pattern)
             data_objects = await self._convert_df_to_data_objects(df_source, config_list)
 
-            # Create vector store
+            # Create vector store, with the embeddings computed before each batch is written
+            precomputed = _PrecomputedEmbeddings(embedding_function)
             chroma = Chroma(
                 persist_directory=str(vector_store_dir),
-                embedding_function=embedding_function,
+                embedding_function=precomputed,
                 collection_name=self.knowledge_base,
             )
 
             # Convert Data objects to LangChain Documents
-            documents = []
-            for data_obj in data_objects:
-                doc = data_obj.to_lc_document()
-                documents.append(doc)
+            documents = [data_obj.to_lc_document() for data_obj in data_objects]
 
-            # Add documents to vector store
+            # Embed documents in concurrent batches and add them one batch at a time
             if documents:
-                chroma.add_documents(documents)
+                await self._add_documents_in_batches(chroma, precomputed, documents)
                 self.log(f"Added {len(documents)} documents to vector store '{self.knowledge_base}'")
 
         except (OSError, ValueError, RuntimeError) as e:
             self.log(f"Error creating vector store: {e}")
 
-    async def _convert_df_to_data_objects(
-        self, df_source: pd.DataFrame, config_list: list[dict[str, Any]]
-    ) -> list[Data]:
-        """Convert DataFrame to Data objects for vector store."""
-        data_objects: list[Data] = []
+    async def _add_documents_in_batches(
+        self, chroma: Chroma, precomputed: _PrecomputedEmbeddings, documents: list
+    ) -> None:
+        """Add documents in batches of `chunk_size`, embedding up to `embedding_concurrency` batches at once.
 
-        # Set up vector store directory
-        kb_path = await self._kb_path()
+        Writes go through one persistent Chroma client, so only the embedding runs concurrently and
+        the batches are written one at a time.
+        """
+        batch_size = max(self.chunk_size or len(documents), 1)
+        semaphore = asyncio.Semaphore(max(self.embedding_concurrency or 1, 1))
+        write_lock = asyncio.Lock()
+
+        async def add_batch(batch: list) -> None:
+            texts = [document.page_content for document in batch]
+            async with semaphore:
+                vectors = await asyncio.to_thread(precomputed.embeddings.embed_documents, texts)
+            async with write_lock:
+                precomputed.vectors.update(zip(texts, vectors, strict=True))
+                try:
+                    await asyncio.to_thread(chroma.add_documents, batch)
+                finally:
+                    precomputed.vectors.clear()
 
-        # If we don't allow duplicates, we need to get the existing hashes
-        chroma = Chroma(
-            persist_directory=str(kb_path),
-            collection_name=self.knowledge_base,
+        await asyncio.gather(
+            *(add_batch(documents[start : start + batch_size]) for start in range(0, len(documents), batch_size))
         )
 
-        # Get all documents and their metadata
-        all_docs = chroma.get()
+    @staticmethod
+    def _with_row_dtype(df_source: pd.DataFrame) -> pd.DataFrame:
+        """Cast the columns the way rows are when iterated, so values keep the text and hashes `iterrows` gave them.
 
-        # Extract all _id values from metadata
-        id_list = [metadata.get("_id") for metadata in all_docs["metadatas"] if metadata.get("_id")]
+        Rows of a frame whose columns are all numeric share one dtype, so ints come out as floats ("1.0") when
+        any column holds floats.
+        """
+        dtypes = set(df_source.dtypes)
+        if len(dtypes) > 1 and all(isinstance(dtype, np.dtype) and dtype.kind in "iuf" for dtype in dtypes):
+            return df_source.astype(np.result_type(*dtypes))
+        return df_source
+
+    @staticmethod
+    def _join_columns(df_source: pd.DataFrame, columns: list[str]) -> pd.Series:
+        """Join the non-null values of `columns` with spaces, column by column instead of row by row."""
+        joined = pd.Series("", index=df_source.index, dtype=object)
+        any_present = pd.Series(data=False, index=df_source.index)
+        for col in columns:
+            if col not in df_source.columns:
+                continue
+            values = df_source[col]
+            present = values.notna()
+            text = values.astype(str).where(present, "")
+            separator = pd.Series(np.where(any_present & present, " ", ""), index=df_source.index)
+            joined = joined + separator + text
+            any_present |= present
+        return joined
+
+    async def _get_existing_hashes(self, chroma: Chroma, hashes: list[str], batch_size: int = 1000) -> set[str]:
+        """Return which of `hashes` are already stored, fetching only the matching metadatas."""
+        existing: set[str] = set()
+        for start in range(0, len(hashes), batch_size):
+            batch = hashes[start : start + batch_size]
+            result = await asyncio.to_thread(chroma.get, where={"_id": {"$in": batch}}, include=["metadatas"])
+            existing.update(metadata["_id"] for metadata in result["metadatas"] if metadata and metadata.get("_id"))
+        return existing
 
+    async def _convert_df_to_data_objects(
+        self, df_source: pd.DataFrame, config_list: list[dict[str, Any]]
+    ) -> list[Data]:
+        """Convert DataFrame to Data objects for vector store."""
         # Get column roles
         content_cols = []
         identifier_cols = []
@@ -445,43 +520,42 @@ class KnowledgeIngestionComponent(Component):
             elif identifier:
                 identifier_cols.append(col_name)
 
-        # Convert each row to a Data object
-        for _, row in df_source.iterrows():
-            # Build content text from identifier columns using list comprehension
-            identifier_parts = [str(row[col]) for col in content_cols if col in row and pd.notna(row[col])]
-
-            # Join all parts into a single string
-            page_content = " ".join(identifier_parts)
-
-            # Build metadata from NON-vectorized columns only (simple key-value pairs)
-            data_dict = {
-                "text": page_content,  # Main content for vectorization
-            }
+        # Build content text from the vectorized columns
+        df_source = self._with_row_dtype(df_source)
+        page_contents = self._join_columns(df_source, content_cols)
 
-            # Add identifier columns if they exist
-            if identifier_cols:
-                identifier_parts = [str(row[col]) for col in identifier_cols if col in row and pd.notna(row[col])]
-                page_content = " ".join(identifier_parts)
+        # Hash the identifier columns if there are any, otherwise the content
+        hash_sources = self._join_columns(df_source, identifier_cols) if identifier_cols else page_contents
+        hashes = [hashlib.sha256(text.encode()).hexdigest() for text in hash_sources]
 
-            # Add metadata columns as simple key-value pairs
-            for col in df_source.columns:
-                if col not in content_cols and col in row and pd.notna(row[col]):
-                    # Convert to simple types for Chroma metadata
-                    value = row[col]
-                    data_dict[col] = str(value)  # Convert complex types to string
+        # Metadata is every NON-vectorized column, converted to a string (skipping nulls)
+        metadata_cols = [col for col in df_source.columns if col not in content_cols]
+        metadata_frame = df_source[metadata_cols]
+        metadata_records = metadata_frame.astype(str).where(metadata_frame.notna(), None).to_dict("records")
 
-            # Hash the page_content for unique ID
-            page_content_hash = hashlib.sha256(page_content.encode()).hexdigest()
-            data_dict["_id"] = page_content_hash
+        existing_hashes: set[str] = set()
+        if not self.allow_duplicates:
+            # Only look up the hashes being ingested instead of pulling the whole collection
+            kb_path = await self._kb_path()
+            chroma = Chroma(
+                persist_directory=str(kb_path),
+                collection_name=self.knowledge_base,
+            )
+            existing_hashes = await self._get_existing_hashes(chroma, list(dict.fromkeys(hashes)))
 
+        data_objects: list[Data] = []
+        for page_content, page_content_hash, record in zip(page_contents, hashes, metadata_records, strict=True):
             # If duplicates are disallowed, and hash exists, prevent adding this row
-            if not self.allow_duplicates and page_content_hash in id_list:
+            if not self.allow_duplicates and page_content_hash in existing_hashes:
                 self.log(f"Skipping duplicate row with hash {page_content_hash}")
                 continue
 
+            data_dict = {"text": page_content}
+            data_dict.update((col, value) for col, value in record.items() if value is not None)
+            data_dict["_id"] = page_content_hash
+
             # Create Data object - everything except "text" becomes metadata
-            data_obj = Data(data=data_dict)
-            data_objects.append(data_obj)
+            data_objects.append(Data(data=data_dict))
 
         return data_objects
 
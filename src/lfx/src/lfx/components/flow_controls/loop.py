@@ -1,11 +1,14 @@
+from lfx.base.flow_controls.loop_map import map_loop_body
 from lfx.components.processing.converter import convert_to_data
 from lfx.custom.custom_component.component import Component
-from lfx.inputs.inputs import HandleInput
+from lfx.inputs.inputs import DropdownInput, HandleInput, IntInput
 from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
 from lfx.schema.message import Message
 from lfx.template.field.base import Output
 
+ERROR_POLICIES = {"Fail fast": "fail_fast", "Skip": "skip", "Collect": "collect"}
+
 
 class LoopComponent(Component):
     display_name = "Loop"
@@ -24,6 +27,36 @@ class LoopComponent(Component):
             info="The initial DataFrame to iterate over.",
             input_types=["DataFrame"],
         ),
+        DropdownInput(
+            name="mode",
+            display_name="Mode",
+            options=["Sequential", "Map"],
+            value="Sequential",
+            info=(
+                "Sequential runs the loop body for one item at a time. "
+                "Map runs a copy of the loop body for each item, several at a time, "
+                "and outputs the results in the order of the items."
+            ),
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            value=4,
+            info="In Map mode, how many items are processed at the same time. 0 means no limit.",
+            advanced=True,
+        ),
+        DropdownInput(
+            name="error_policy",
+            display_name="Error Policy",
+            options=list(ERROR_POLICIES),
+            value="Fail fast",
+            info=(
+                "In Map mode, what to do when an item fails. Fail fast stops the loop with the error, "
+                "Skip leaves the item out of the results, and Collect outputs the error in place of its result."
+            ),
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -61,9 +94,12 @@ class LoopComponent(Component):
         return convert_to_data(message, auto_parse=False)
 
     def _validate_data(self, data):
-        """Validate and return a list of Data objects. Message objects are auto-converted to Data."""
+        """Validate and return a list of Data objects. Message objects are auto-converted to Data.
+
+        DataFrames are returned as a view, so each row becomes a Data object only when its iteration starts.
+        """
         if isinstance(data, DataFrame):
-            return data.to_data_list()
+            return data.to_data_view()
         if isinstance(data, Data):
             return [data]
         if isinstance(data, Message):
@@ -93,6 +129,11 @@ class LoopComponent(Component):
         self.initialize_data()
         current_item = Data(text="")
 
+        if self.mode == "Map":
+            # The loop body runs from done_output, once per item
+            self.stop("item")
+            return current_item
+
         if self.evaluate_stop_loop():
             self.stop("item")
         else:
@@ -120,10 +161,15 @@ class LoopComponent(Component):
             if self._id not in self.graph.run_manager.run_map[item_dependency_id]:
                 self.graph.run_manager.run_map[item_dependency_id].append(self._id)
 
-    def done_output(self) -> DataFrame:
+    async def done_output(self) -> DataFrame:
         """Trigger the done output when iteration is complete."""
         self.initialize_data()
 
+        if self.mode == "Map":
+            self.stop("item")
+            self.start("done")
+            return DataFrame(await self.map_output())
+
         if self.evaluate_stop_loop():
             self.stop("item")
             self.start("done")
@@ -134,6 +180,17 @@ class LoopComponent(Component):
         self.stop("done")
         return DataFrame([])
 
+    async def map_output(self) -> list[Data]:
+        """Run the loop body for every item concurrently and return the results in the order of the items."""
+        results = await map_loop_body(
+            self.graph,
+            self._id,
+            self.ctx.get(f"{self._id}_data", []),
+            max_concurrency=self.max_concurrency,
+            error_policy=ERROR_POLICIES.get(self.error_policy, "fail_fast"),
+        )
+        return [self._convert_message_to_data(result) if isinstance(result, Message) else result for result in results]
+
     def loop_variables(self):
         """Retrieve loop variables from context."""
         return (
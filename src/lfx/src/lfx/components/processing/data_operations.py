@@ -41,6 +41,7 @@ class DataOperationsComponent(Component):
     description = "Perform various operations on a Data object."
     icon = "file-json"
     name = "DataOperations"
+    run_outputs_in_process = True
     default_keys = ["operations", "data"]
     metadata = {
         "keywords": [
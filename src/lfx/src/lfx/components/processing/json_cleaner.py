@@ -16,6 +16,7 @@ class JSONCleaner(Component):
     )
     legacy = True
     replacement = ["processing.ParserComponent"]
+    run_outputs_in_process = True
     inputs = [
         MessageTextInput(
             name="json_str", display_name="JSON String", info="The JSON string to be cleaned.", required=True
@@ -1,5 +1,5 @@
 from lfx.custom.custom_component.component import Component
-from lfx.helpers.data import safe_convert
+from lfx.helpers.data import format_dataframe_rows, safe_convert
 from lfx.inputs.inputs import BoolInput, HandleInput, MessageTextInput, MultilineInput, TabInput
 from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
@@ -118,9 +118,7 @@ class ParserComponent(Component):
 
         lines = []
         if df is not None:
-            for _, row in df.iterrows():
-                formatted_text = self.pattern.format(**row.to_dict())
-                lines.append(formatted_text)
+            lines = format_dataframe_rows(self.pattern, df)
         elif data is not None:
             # Use format_map with a dict that returns default_value for missing keys
             class DefaultDict(dict):
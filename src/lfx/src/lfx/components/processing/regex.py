@@ -12,6 +12,7 @@ class RegexExtractorComponent(Component):
     icon = "regex"
     legacy = True
     replacement = ["processing.ParserComponent"]
+    run_outputs_in_process = True
 
     inputs = [
         MessageTextInput(
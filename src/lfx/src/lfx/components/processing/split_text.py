@@ -14,6 +14,7 @@ class SplitTextComponent(Component):
     documentation: str = "https://docs.langflow.org/split-text"
     icon = "scissors-line-dashed"
     name = "SplitText"
+    run_outputs_in_process = True
 
     inputs = [
         HandleInput(
@@ -22,6 +22,7 @@ from lfx.base.tools.constants import (
     TOOLS_METADATA_INPUT_NAME,
 )
 from lfx.custom.tree_visitor import RequiredInputsVisitor
+from lfx.events.token_coalescer import TokenCoalescer
 from lfx.exceptions.component import StreamingError
 from lfx.field_typing import Tool  # noqa: TC001
 
@@ -30,6 +31,7 @@ from lfx.field_typing import Tool  # noqa: TC001
 # Lazy import to avoid circular dependency
 # from lfx.graph.utils import has_chat_output
 from lfx.helpers.custom import format_type
+from lfx.log.logger import logger
 from lfx.memory import astore_message, aupdate_messages, delete_message
 from lfx.schema.artifact import get_artifact_type, post_process_raw
 from lfx.schema.data import Data
@@ -114,6 +116,10 @@ class Component(CustomComponent):
     outputs: list[Output] = []
     selected_output: str | None = None
     code_class_base_inheritance: ClassVar[str] = "Component"
+    run_outputs_in_process: ClassVar[bool | frozenset[str]] = False
+    """Whether synchronous output methods run in the component process pool instead of a thread: True for all
+    outputs, or the names of the outputs to run there. Only for methods that compute from input values alone,
+    without the graph, the database or other services. The pool must be enabled with component_process_pool_size."""
 
     def __init__(self, **kwargs) -> None:
         # Initialize instance-specific attributes first
@@ -1235,7 +1241,10 @@ class Component(CustomComponent):
 
         method = getattr(self, output.method)
         try:
-            result = await method() if inspect.iscoroutinefunction(method) else await asyncio.to_thread(method)
+            if inspect.iscoroutinefunction(method):
+                result = await method()
+            else:
+                result = await self._run_sync_output_method(output, method)
         except TypeError as e:
             msg = f'Error running method "{output.method}": {e}'
             raise TypeError(msg) from e
@@ -1252,6 +1261,29 @@ class Component(CustomComponent):
 
         return result
 
+    async def _run_sync_output_method(self, output: Output, method: Callable[[], Any]) -> Any:
+        """Runs a synchronous output method in the component process pool if it opted in, else in a thread."""
+        run_in_process = self.run_outputs_in_process
+        if run_in_process is True or (run_in_process and output.name in run_in_process):
+            from lfx.custom.process_pool import (
+                ComponentNotPicklableError,
+                get_component_process_pool,
+                run_output_method_in_pool,
+            )
+
+            if pool := get_component_process_pool():
+                try:
+                    method_result = await run_output_method_in_pool(pool, self, output.method)
+                except ComponentNotPicklableError as e:
+                    await logger.adebug(f"Running {self.__class__.__name__}.{output.method} in a thread: {e}")
+                else:
+                    if method_result.status is not None:
+                        self.status = method_result.status
+                    for log in method_result.logs:
+                        self.log(log.message, name=log.name)
+                    return method_result.result
+        return await asyncio.to_thread(method)
+
     async def resolve_output(self, output_name: str) -> Any:
         """Resolves and returns the value for a specified output by name.
 
@@ -1728,47 +1760,86 @@ class Component(CustomComponent):
 
         if isinstance(iterator, AsyncIterator):
             return await self._handle_async_iterator(iterator, message.id, message)
+        parts: list[str] = []
+        coalescer = self._create_token_coalescer(message.id)
         try:
-            complete_message = ""
-            first_chunk = True
             for chunk in iterator:
-                complete_message = await self._process_chunk(
-                    chunk.content, complete_message, message.id, message, first_chunk=first_chunk
+                await self._process_chunk(
+                    chunk.content, parts, message.id, message, first_chunk=not parts, coalescer=coalescer
                 )
-                first_chunk = False
         except Exception as e:
             raise StreamingError(cause=e, source=message.properties.source) from e
-        else:
-            return complete_message
+        finally:
+            if coalescer is not None:
+                coalescer.flush()
+        return "".join(parts)
 
     async def _handle_async_iterator(self, iterator: AsyncIterator, message_id: str, message: Message) -> str:
-        complete_message = ""
-        first_chunk = True
-        async for chunk in iterator:
-            complete_message = await self._process_chunk(
-                chunk.content, complete_message, message_id, message, first_chunk=first_chunk
-            )
-            first_chunk = False
-        return complete_message
+        parts: list[str] = []
+        coalescer = self._create_token_coalescer(message_id)
+        try:
+            async for chunk in iterator:
+                await self._process_chunk(
+                    chunk.content, parts, message_id, message, first_chunk=not parts, coalescer=coalescer
+                )
+        finally:
+            if coalescer is not None:
+                coalescer.flush()
+        return "".join(parts)
+
+    def _create_token_coalescer(self, message_id: str) -> TokenCoalescer | None:
+        """Returns a coalescer sending tokens in batches, or None to send every token as its own event.
+
+        Tokens are only coalesced when `on_token` is the event manager's own `send_event`, which is
+        cheap enough to call on the event loop. Custom callbacks keep getting every token in a thread.
+        """
+        event_manager = getattr(self, "_event_manager", None)
+        if not event_manager or not event_manager.is_direct_event("on_token"):
+            return None
+        from lfx.services.deps import get_settings_service
+
+        settings_service = get_settings_service()
+        settings = settings_service.settings if settings_service else None
+        max_chars = getattr(settings, "token_coalesce_max_chars", 64)
+        interval = getattr(settings, "token_coalesce_interval", 0.02)
+        if max_chars <= 0 or interval <= 0:
+            return None
+        id_ = str(message_id)
+
+        def emit(text: str) -> None:
+            event_manager.on_token(data={"chunk": text, "id": id_})
+
+        return TokenCoalescer(emit, max_chars=max_chars, interval=interval)
 
     async def _process_chunk(
-        self, chunk: str, complete_message: str, message_id: str, message: Message, *, first_chunk: bool = False
-    ) -> str:
-        complete_message += chunk
+        self,
+        chunk: str,
+        parts: list[str],
+        message_id: str,
+        message: Message,
+        *,
+        first_chunk: bool = False,
+        coalescer: TokenCoalescer | None = None,
+    ) -> None:
+        parts.append(chunk)
         if self._event_manager:
             if first_chunk:
                 # Send the initial message only on the first chunk
                 msg_copy = message.model_copy()
-                msg_copy.text = complete_message
+                msg_copy.text = chunk
                 await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
-                data={
-                    "chunk": chunk,
-                    "id": str(message_id),
-                },
-            )
-        return complete_message
+            if coalescer is not None:
+                coalescer.add(chunk)
+                # Slow the stream down to the pace of a client that can't keep up
+                await self._event_manager.wait_for_capacity()
+            else:
+                await asyncio.to_thread(
+                    self._event_manager.on_token,
+                    data={
+                        "chunk": chunk,
+                        "id": str(message_id),
+                    },
+                )
 
     async def send_error(
         self,
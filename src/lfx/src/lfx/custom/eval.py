@@ -1,12 +1,109 @@
+import hashlib
+import sys
+import threading
 from typing import TYPE_CHECKING
 
+from cachetools import LRUCache
+
 from lfx.custom import validate
+from lfx.field_typing.constants import DEFAULT_IMPORT_STRING
 
 if TYPE_CHECKING:
     from lfx.custom.custom_component.custom_component import CustomComponent
 
+DEFAULT_COMPONENT_CLASS_CACHE_SIZE = 512
+
+
+class ComponentClassCache:
+    """Process-wide LRU cache of component classes built from source code.
+
+    Keys are a hash of the component code plus the import environment the class was built in,
+    so the same code always maps to the same class object until it is evicted or invalidated.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_COMPONENT_CLASS_CACHE_SIZE) -> None:
+        self.enabled = maxsize > 0
+        self._cache: LRUCache[str, type] = LRUCache(maxsize=max(maxsize, 1))
+        self._lock = threading.Lock()
+        self._environment: str | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def environment(self) -> str:
+        """Fingerprint of what, besides the code itself, determines the built class."""
+        if self._environment is None:
+            self._environment = "|".join(
+                [sys.version, DEFAULT_IMPORT_STRING, str(validate._LANGFLOW_IS_INSTALLED)]  # noqa: SLF001
+            )
+        return self._environment
+
+    def make_key(self, code: str) -> str:
+        return hashlib.sha256(f"{self.environment}\n{code}".encode()).hexdigest()
+
+    def get(self, code: str) -> type | None:
+        key = self.make_key(code)
+        with self._lock:
+            class_object = self._cache.get(key) if self.enabled else None
+            if class_object is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return class_object
+
+    def set(self, code: str, class_object: type) -> None:
+        if not self.enabled:
+            return
+        key = self.make_key(code)
+        with self._lock:
+            self._cache[key] = class_object
+
+    def invalidate(self, code: str | None = None) -> None:
+        """Removes the class built from `code`, or every cached class if no code is given."""
+        with self._lock:
+            if code is None:
+                self._cache.clear()
+                self._environment = None
+            else:
+                self._cache.pop(self.make_key(code), None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._cache),
+                "maxsize": int(self._cache.maxsize) if self.enabled else 0,
+            }
+
+
+_component_class_cache: ComponentClassCache | None = None
+
+
+def get_component_class_cache() -> ComponentClassCache:
+    """Returns the process-wide component class cache, creating it on first use."""
+    global _component_class_cache  # noqa: PLW0603
+    if _component_class_cache is None:
+        from lfx.services.deps import get_settings_service
+
+        maxsize = DEFAULT_COMPONENT_CLASS_CACHE_SIZE
+        settings_service = get_settings_service()
+        if settings_service is not None:
+            maxsize = getattr(settings_service.settings, "component_class_cache_size", maxsize)
+        _component_class_cache = ComponentClassCache(maxsize=maxsize)
+    return _component_class_cache
+
 
 def eval_custom_component_code(code: str) -> type["CustomComponent"]:
-    """Evaluate custom component code."""
-    class_name = validate.extract_class_name(code)
-    return validate.create_class(code, class_name)
+    """Evaluate custom component code.
+
+    Classes are cached by code hash, so running the same component again does not
+    re-parse and re-execute its source. Set `component_class_cache_size` to 0 to disable.
+    """
+    cache = get_component_class_cache()
+    class_object = cache.get(code)
+    if class_object is None:
+        class_name = validate.extract_class_name(code)
+        class_object = validate.create_class(code, class_name)
+        cache.set(code, class_object)
+    return class_object
@@ -0,0 +1,154 @@
+"""A process pool for the synchronous output methods of CPU-bound components.
+
+Output methods run in threads hold the GIL while they compute, which slows down the event loop
+and every other flow served by the same worker. Components opt into running their output methods
+in this pool instead with `Component.run_outputs_in_process`, and the pool is enabled by setting
+`component_process_pool_size`.
+
+The component is not sent to the pool. Its code and input values are, and the worker process
+rebuilds the component from them, runs the method, and sends back the result along with the
+component's status and logs. Everything travels pickled with the highest protocol, so pandas and
+numpy data is copied as raw buffers. When the inputs or the result can't be pickled,
+`ComponentNotPicklableError` is raised so the caller can run the method in a thread instead.
+
+Workers are started with "spawn", so they don't inherit the threads and connections of the
+server, and stay alive for later jobs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from lfx.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from lfx.custom.custom_component.component import Component
+    from lfx.schema.log import Log
+
+
+class ComponentNotPicklableError(Exception):
+    """The inputs or the result of an output method can't be sent between processes."""
+
+
+class OutputMethodResult(NamedTuple):
+    result: Any
+    status: Any
+    logs: list[Log]
+
+
+# A result that couldn't be pickled in the worker
+_NOT_PICKLABLE = b""
+
+
+def _load_component_class(code: str, class_name: str) -> type[Component]:
+    from lfx.custom import validate
+    from lfx.custom.eval import eval_custom_component_code
+
+    class_object = eval_custom_component_code(code)
+    if class_object.__name__ != class_name:
+        # The code defines several components, and not the first one was used
+        class_object = validate.create_class(code, class_name)
+    return class_object
+
+
+def _run_output_method(payload: bytes) -> bytes:
+    """Runs in a worker process: rebuilds the component and returns its pickled `OutputMethodResult`."""
+    code, class_name, component_id, attributes, method_name = pickle.loads(payload)  # noqa: S301
+    component = _load_component_class(code, class_name)(_id=component_id)
+    component._attributes.update(attributes)  # noqa: SLF001
+    try:
+        result = getattr(component, method_name)()
+    except Exception as exc:
+        try:
+            pickle.dumps(exc)
+        except Exception:  # noqa: BLE001
+            # Exceptions defined by the component's code can't be unpickled in the parent
+            msg = f"{type(exc).__name__}: {exc}"
+            raise RuntimeError(msg) from None
+        raise
+    try:
+        return pickle.dumps(
+            OutputMethodResult(result, component.status, component._logs),  # noqa: SLF001
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    except Exception:  # noqa: BLE001
+        return _NOT_PICKLABLE
+
+
+_pool: ProcessPoolExecutor | None = None
+_pool_size = 0
+_pool_lock = threading.Lock()
+
+
+def get_component_process_pool() -> ProcessPoolExecutor | None:
+    """Returns the process-wide pool, or None when `component_process_pool_size` is 0."""
+    global _pool, _pool_size  # noqa: PLW0603
+    settings_service = get_settings_service()
+    settings = settings_service.settings if settings_service else None
+    size = getattr(settings, "component_process_pool_size", 0)
+    with _pool_lock:
+        if _pool is not None and _pool_size != size:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+        if _pool is None and size > 0:
+            _pool = ProcessPoolExecutor(max_workers=size, mp_context=multiprocessing.get_context("spawn"))
+            _pool_size = size
+        return _pool
+
+
+def shutdown_component_process_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_component_process_pool)
+
+
+async def run_output_method_in_pool(
+    pool: ProcessPoolExecutor, component: Component, method_name: str
+) -> OutputMethodResult:
+    """Runs `component.<method_name>()` in `pool`.
+
+    Raises:
+        ComponentNotPicklableError: If the component's input values or the method's result can't be pickled.
+    """
+    global _pool  # noqa: PLW0603
+    try:
+        payload = pickle.dumps(
+            (
+                component._code,  # noqa: SLF001
+                type(component).__name__,
+                component._id,  # noqa: SLF001
+                component._attributes,  # noqa: SLF001
+                method_name,
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    except Exception as exc:
+        msg = f"The inputs of {type(component).__name__} can't be pickled: {exc}"
+        raise ComponentNotPicklableError(msg) from exc
+
+    try:
+        response = await asyncio.get_running_loop().run_in_executor(pool, _run_output_method, payload)
+    except BrokenProcessPool as exc:
+        # A worker died, maybe killed for using too much memory. Later calls start a new pool.
+        with _pool_lock:
+            if _pool is pool:
+                _pool = None
+        msg = f"The process running {type(component).__name__}.{method_name} exited unexpectedly"
+        raise RuntimeError(msg) from exc
+
+    if response == _NOT_PICKLABLE:
+        msg = f"The result of {type(component).__name__}.{method_name} can't be pickled"
+        raise ComponentNotPicklableError(msg)
+    return pickle.loads(response)  # noqa: S301
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+import tempfile
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+OverflowPolicy = Literal["block", "drop", "spill"]
+
+# Spilled events are stored as (put_time, len(event_id), len(data)) followed by event_id and data
+_SPILL_HEADER = struct.Struct("<dII")
+# Length stored for None, the event id and data of the end marker of a job's events
+_NONE_LENGTH = 0xFFFFFFFF
+
+
+class BoundedEventQueue(asyncio.Queue):
+    """A queue of `(event_id, data, put_time)` events holding at most `max_size` events in memory.
+
+    `put_nowait` never raises `QueueFull`, so `EventManager.send_event` can keep using it. What
+    happens to events put once the queue is full depends on `policy`:
+
+    - "block": the event is accepted, but `put` and `wait_for_capacity` wait until the consumer has
+      caught up, so producers that await them are slowed down to the consumer's pace.
+    - "drop": a `token` event is merged into the token event at the end of the queue when both
+      belong to the same message, and dropped otherwise. Other events are always accepted.
+    - "spill": events are written to a temporary file and read back, in order, as the consumer
+      makes room in memory.
+
+    `on_overflow` is called with "coalesced", "dropped" or "spilled" for each such event.
+    A `max_size` of 0 means the queue is unbounded.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 0,
+        policy: OverflowPolicy = "block",
+        *,
+        spill_dir: str | None = None,
+        on_overflow: Callable[[str], None] | None = None,
+    ) -> None:
+        if policy not in {"block", "drop", "spill"}:
+            msg = f"Unknown overflow policy: {policy}"
+            raise ValueError(msg)
+        # The base queue stays unbounded, so that `put_nowait` never raises QueueFull
+        super().__init__()
+        self.max_size = max_size
+        self.policy = policy
+        self.spill_dir = spill_dir
+        self.on_overflow = on_overflow
+        self.coalesced = 0
+        self.dropped = 0
+        self.spilled = 0
+        self._spill_file = None
+        self._spill_read_pos = 0
+        self._spill_count = 0
+        self._has_capacity = asyncio.Event()
+        self._has_capacity.set()
+
+    def _is_over_limit(self) -> bool:
+        return self.max_size > 0 and len(self._queue) >= self.max_size
+
+    def _record_overflow(self, reason: str) -> None:
+        if self.on_overflow is not None:
+            self.on_overflow(reason)
+
+    def put_nowait(self, item) -> None:
+        if self.policy == "drop" and self._is_over_limit() and self._drop_or_coalesce(item):
+            return
+        super().put_nowait(item)
+
+    async def put(self, item) -> None:
+        if self.policy == "block":
+            await self.wait_for_capacity()
+        self.put_nowait(item)
+
+    async def wait_for_capacity(self) -> None:
+        """Wait until the queue holds fewer than `max_size` events. Returns at once for other policies."""
+        if self.policy != "block":
+            return
+        while self._is_over_limit():
+            self._has_capacity.clear()
+            await self._has_capacity.wait()
+
+    def _drop_or_coalesce(self, item) -> bool:
+        """Whether the token event `item` was merged into the last queued event or dropped."""
+        event_id, data, _put_time = item
+        if data is None or not event_id.startswith("token-"):
+            return False
+        last_id, last_data, last_put_time = self._queue[-1]
+        if last_data is not None and last_id.startswith("token-"):
+            last_event = json.loads(last_data)
+            event = json.loads(data)
+            if last_event["data"].get("id") == event["data"].get("id"):
+                last_event["data"]["chunk"] = last_event["data"].get("chunk", "") + event["data"].get("chunk", "")
+                merged = (json.dumps(last_event) + "\n\n").encode("utf-8")
+                self._queue[-1] = (last_id, merged, last_put_time)
+                self.coalesced += 1
+                self._record_overflow("coalesced")
+                return True
+        self.dropped += 1
+        self._record_overflow("dropped")
+        return True
+
+    def _put(self, item) -> None:
+        if self.policy == "spill" and (self._spill_count or self._is_over_limit()):
+            self._spill(item)
+        else:
+            self._queue.append(item)
+
+    def _get(self):
+        item = self._queue.popleft()
+        if self._spill_count:
+            self._unspill()
+        if not self._is_over_limit():
+            self._has_capacity.set()
+        return item
+
+    def qsize(self) -> int:
+        """The number of events waiting, in memory and spilled to disk."""
+        return len(self._queue) + self._spill_count
+
+    def empty(self) -> bool:
+        return not self._queue and not self._spill_count
+
+    def _spill(self, item) -> None:
+        event_id, data, put_time = item
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(dir=self.spill_dir)  # noqa: SIM115
+        encoded_id = b"" if event_id is None else event_id.encode("utf-8")
+        header = _SPILL_HEADER.pack(
+            put_time,
+            _NONE_LENGTH if event_id is None else len(encoded_id),
+            _NONE_LENGTH if data is None else len(data),
+        )
+        self._spill_file.seek(0, 2)
+        self._spill_file.write(header + encoded_id + (data or b""))
+        self._spill_count += 1
+        self.spilled += 1
+        self._record_overflow("spilled")
+
+    def _unspill(self) -> None:
+        """Move spilled events back to memory until it is full again or there are none left."""
+        spill_file = self._spill_file
+        spill_file.seek(self._spill_read_pos)
+        while self._spill_count and not self._is_over_limit():
+            put_time, id_length, data_length = _SPILL_HEADER.unpack(spill_file.read(_SPILL_HEADER.size))
+            event_id = None if id_length == _NONE_LENGTH else spill_file.read(id_length).decode("utf-8")
+            data = None if data_length == _NONE_LENGTH else spill_file.read(data_length)
+            self._queue.append((event_id, data, put_time))
+            self._spill_count -= 1
+        self._spill_read_pos = spill_file.tell()
+        if not self._spill_count:
+            spill_file.seek(0)
+            spill_file.truncate()
+            self._spill_read_pos = 0
+
+    def close(self) -> None:
+        """Delete the spill file, if any. Spilled events are lost."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        self._spill_count = 0
+        self._spill_read_pos = 0
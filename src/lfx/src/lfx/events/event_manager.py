@@ -16,6 +16,8 @@ if TYPE_CHECKING:
     # Lightweight type stub for log types
     LoggableType = dict | str | int | float | bool | list | None
 
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 class EventCallback(Protocol):
     def __call__(self, *, manager: EventManager, event_type: str, data: LoggableType): ...
@@ -29,6 +31,8 @@ class EventManager:
     def __init__(self, queue):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        # Event types of the events sent by `send_event` itself, which only encodes and enqueues and so never blocks
+        self._direct_events: dict[str, str] = {}
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -59,10 +63,16 @@ class EventManager:
             raise ValueError(msg)
         if callback is None:
             callback_ = partial(self.send_event, event_type=event_type)
+            self._direct_events[name] = event_type
         else:
             callback_ = partial(callback, manager=self, event_type=event_type)
+            self._direct_events.pop(name, None)
         self.events[name] = callback_
 
+    def is_direct_event(self, name: str) -> bool:
+        """Whether `name` is sent by `send_event` without a custom callback, so it is safe to call on the event loop."""
+        return name in self._direct_events
+
     def send_event(self, *, event_type: str, data: LoggableType):
         try:
             # Simple event creation without heavy dependencies
@@ -71,16 +81,41 @@ class EventManager:
                 pass
         except Exception:  # noqa: BLE001
             logger.debug(f"Error processing event: {event_type}")
-        jsonable_data = jsonable_encoder(data)
+        # Flat dicts of JSON scalars (such as token events) don't need the generic encoder
+        if isinstance(data, dict) and all(type(value) in _JSON_SCALAR_TYPES for value in data.values()):
+            jsonable_data = data
+        else:
+            jsonable_data = jsonable_encoder(data)
         json_data = {"event": event_type, "data": jsonable_data}
-        event_id = f"{event_type}-{uuid.uuid4()}"
         str_data = json.dumps(json_data) + "\n\n"
+        self._put_event(event_type, str_data.encode("utf-8"))
+
+    def send_encoded_event(self, name: str, data: bytes) -> None:
+        """Sends the event registered as `name` with `data`, a JSON object that is already encoded.
+
+        For large payloads that are serialized once, such as vertex build responses, instead of being
+        encoded to a dict, re-encoded by `send_event` and dumped again. Events with a custom callback
+        get the decoded object as usual.
+        """
+        event_type = self._direct_events.get(name)
+        if event_type is None:
+            self.events.get(name, self.noop)(data=json.loads(data))
+            return
+        self._put_event(event_type, b'{"event": ' + json.dumps(event_type).encode() + b', "data": ' + data + b"}\n\n")
+
+    def _put_event(self, event_type: str, encoded_event: bytes) -> None:
         if self.queue:
             try:
-                self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+                self.queue.put_nowait((f"{event_type}-{uuid.uuid4()}", encoded_event, time.time()))
             except Exception:  # noqa: BLE001
                 logger.debug("Queue not available for event")
 
+    async def wait_for_capacity(self) -> None:
+        """Wait until the queue has room for more events, when it is bounded and slows down producers."""
+        wait_for_capacity = getattr(self.queue, "wait_for_capacity", None)
+        if wait_for_capacity is not None:
+            await wait_for_capacity()
+
     def noop(self, *, data: LoggableType) -> None:
         pass
 
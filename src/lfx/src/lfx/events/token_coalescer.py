@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class TokenCoalescer:
+    """Buffers streamed tokens and emits them as fewer, larger chunks.
+
+    Buffered text is emitted once it reaches `max_chars` characters, or `interval` seconds after
+    the first buffered token, whichever comes first. The interval is enforced by a timer on the
+    event loop and, for producers that don't yield to the loop, when the next token is added.
+    `emit` is called on the event loop, so it must not block.
+    """
+
+    def __init__(self, emit: Callable[[str], None], *, max_chars: int, interval: float) -> None:
+        self._emit = emit
+        self.max_chars = max_chars
+        self.interval = interval
+        self._parts: list[str] = []
+        self._size = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._first_added_at = 0.0
+
+    @property
+    def buffered(self) -> int:
+        """The number of characters waiting to be emitted."""
+        return self._size
+
+    def add(self, chunk: str) -> None:
+        if not chunk:
+            return
+        now = time.monotonic()
+        if not self._parts:
+            self._first_added_at = now
+        self._parts.append(chunk)
+        self._size += len(chunk)
+        if self._size >= self.max_chars or now - self._first_added_at >= self.interval:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.interval, self.flush)
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._parts:
+            return
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        self._emit(text)
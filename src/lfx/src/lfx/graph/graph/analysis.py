@@ -0,0 +1,142 @@
+"""Reachability and cycle structure of a graph's topology.
+
+`GraphAnalysis` is computed once per topology change and shared by everything that needs to know
+which vertices reach which: sorting, stop/start filtering and state activation. All traversals are
+iterative and visit each vertex and edge once, so deep or heavily connected flows neither recurse
+nor re-walk shared sub-graphs.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+
+def strongly_connected_components(
+    vertex_ids: Iterable[str],
+    successor_map: Mapping[str, Iterable[str]],
+) -> list[list[str]]:
+    """Returns the strongly connected components of a graph in reverse topological order.
+
+    Iterative Tarjan: a component is emitted only after every component reachable from it.
+    """
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    components: list[list[str]] = []
+
+    for root in vertex_ids:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successor_map.get(root, ())))]
+        while work:
+            vertex_id, successors = work[-1]
+            for successor_id in successors:
+                if successor_id not in index:
+                    index[successor_id] = lowlink[successor_id] = len(index)
+                    stack.append(successor_id)
+                    on_stack.add(successor_id)
+                    work.append((successor_id, iter(successor_map.get(successor_id, ()))))
+                    break
+                if successor_id in on_stack:
+                    lowlink[vertex_id] = min(lowlink[vertex_id], index[successor_id])
+            else:
+                work.pop()
+                if work:
+                    parent_id = work[-1][0]
+                    lowlink[parent_id] = min(lowlink[parent_id], lowlink[vertex_id])
+                if lowlink[vertex_id] == index[vertex_id]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == vertex_id:
+                            break
+                    components.append(component)
+    return components
+
+
+class GraphAnalysis:
+    """Transitive closure, topological order and cycle membership of a graph.
+
+    Built from the vertex ids and the successor map of a graph. Edges to vertices that are not in
+    `vertex_ids` are ignored. The closure is computed on first use, one set per strongly connected
+    component, by walking the components in topological order.
+    """
+
+    def __init__(self, vertex_ids: Iterable[str], successor_map: Mapping[str, Iterable[str]]) -> None:
+        self.vertex_ids: list[str] = list(dict.fromkeys(vertex_ids))
+        known = set(self.vertex_ids)
+        self.successor_map: dict[str, list[str]] = {}
+        self.predecessor_map: dict[str, list[str]] = {vertex_id: [] for vertex_id in self.vertex_ids}
+        for vertex_id in self.vertex_ids:
+            successors = [
+                successor_id
+                for successor_id in dict.fromkeys(successor_map.get(vertex_id, ()))
+                if successor_id in known
+            ]
+            self.successor_map[vertex_id] = successors
+            for successor_id in successors:
+                self.predecessor_map[successor_id].append(vertex_id)
+
+        # Components in topological order: sources first
+        self.components: list[list[str]] = strongly_connected_components(self.vertex_ids, self.successor_map)[::-1]
+        self.component_of: dict[str, int] = {}
+        for component_index, component in enumerate(self.components):
+            for vertex_id in component:
+                self.component_of[vertex_id] = component_index
+
+        self.cycle_vertices: set[str] = set()
+        for component in self.components:
+            if len(component) > 1 or component[0] in self.successor_map[component[0]]:
+                self.cycle_vertices.update(component)
+
+        self._descendants: list[frozenset[str]] | None = None
+        self._ancestors: list[frozenset[str]] | None = None
+
+    def __contains__(self, vertex_id: object) -> bool:
+        return vertex_id in self.component_of
+
+    def spans(self, vertex_ids: Iterable[str]) -> bool:
+        """Whether `vertex_ids` are exactly the vertices this analysis was built from."""
+        vertex_ids = set(vertex_ids)
+        return len(vertex_ids) == len(self.component_of) and all(vertex_id in self for vertex_id in vertex_ids)
+
+    def _closure(self, neighbor_map: dict[str, list[str]], order: range) -> list[frozenset[str]]:
+        closure: list[frozenset[str]] = [frozenset()] * len(self.components)
+        for component_index in order:
+            component = self.components[component_index]
+            reached: set[str] = set()
+            for vertex_id in component:
+                for neighbor_id in neighbor_map[vertex_id]:
+                    neighbor_component = self.component_of[neighbor_id]
+                    if neighbor_component != component_index:
+                        reached.update(self.components[neighbor_component])
+                        reached.update(closure[neighbor_component])
+            if component[0] in self.cycle_vertices:
+                reached.update(component)
+            closure[component_index] = frozenset(reached)
+        return closure
+
+    def descendants(self, vertex_id: str) -> frozenset[str]:
+        """Every vertex reachable from `vertex_id`. Includes `vertex_id` only if it is in a cycle."""
+        if vertex_id not in self:
+            return frozenset()
+        if self._descendants is None:
+            self._descendants = self._closure(self.successor_map, range(len(self.components) - 1, -1, -1))
+        return self._descendants[self.component_of[vertex_id]]
+
+    def ancestors(self, vertex_id: str) -> frozenset[str]:
+        """Every vertex that reaches `vertex_id`. Includes `vertex_id` only if it is in a cycle."""
+        if vertex_id not in self:
+            return frozenset()
+        if self._ancestors is None:
+            self._ancestors = self._closure(self.predecessor_map, range(len(self.components)))
+        return self._ancestors[self.component_of[vertex_id]]
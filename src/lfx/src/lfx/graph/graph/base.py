@@ -13,10 +13,11 @@ from collections import defaultdict, deque
 from datetime import datetime, timezone
 from functools import partial
 from itertools import chain
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from lfx.exceptions.component import ComponentBuildError
 from lfx.graph.edge.base import CycleEdge, Edge
+from lfx.graph.graph.analysis import GraphAnalysis
 from lfx.graph.graph.constants import Finish, lazy_load_vertex_dict
 from lfx.graph.graph.runnable_vertices_manager import RunnableVerticesManager
 from lfx.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
@@ -105,7 +106,9 @@ class Graph:
         # Conditional routing system (separate from ACTIVE/INACTIVE cycle management)
         self.conditionally_excluded_vertices: set = set()  # Vertices excluded by conditional routing
         self.conditional_exclusion_sources: dict[str, set[str]] = {}  # Maps source vertex -> excluded vertices
-        self.edges: list[CycleEdge] = []
+        # Edges touching each vertex, in the order they appear in self.edges
+        self._vertex_edges: dict[str, list[CycleEdge]] = {}
+        self.edges = []
         self.vertices: list[Vertex] = []
         self.run_manager = RunnableVerticesManager()
         self._vertices: list[NodeData] = []
@@ -124,9 +127,11 @@ class Graph:
         self._is_cyclic: bool | None = None
         self._cycles: list[tuple[str, str]] | None = None
         self._cycle_vertices: set[str] | None = None
+        self._analysis: GraphAnalysis | None = None
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        self._changed_vertices: set[str] = set()
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -495,6 +500,7 @@ class Graph:
         self.successor_map[source_id].append(target_id)
         self.in_degree_map[target_id] += 1
         self.parent_child_map[source_id].append(target_id)
+        self._analysis = None
 
     def add_node(self, node: NodeData) -> None:
         self._vertices.append(node)
@@ -642,6 +648,10 @@ class Graph:
     async def initialize_run(self) -> None:
         if not self._run_id:
             self.set_run_id()
+        # Resolve every global variable the run needs with one query instead of one per field
+        from lfx.interface.initialize.loading import prefetch_load_from_db_variables
+
+        await prefetch_load_from_db_variables(self.vertices, self.user_id, self.context)
         if self.tracing_service:
             run_name = f"{self.flow_name} - {self.flow_id}"
             await self.tracing_service.start_tracers(
@@ -912,6 +922,19 @@ class Graph:
 
         self.in_degree_map = self.build_in_degree(edges)
         self.parent_child_map = self.build_parent_child_map(vertices)
+        self._analysis = None
+
+    @property
+    def analysis(self) -> GraphAnalysis:
+        """Reachability and cycle membership of the graph, computed once per topology change."""
+        if self._analysis is None:
+            self._analysis = GraphAnalysis([vertex.id for vertex in self.vertices], self.successor_map)
+        return self._analysis
+
+    def consume_changed_vertices(self) -> set[str]:
+        """Returns the IDs of the vertices built since the last call and starts tracking anew."""
+        changed_vertices, self._changed_vertices = self._changed_vertices, set()
+        return changed_vertices
 
     def reset_inactivated_vertices(self) -> None:
         """Resets the inactivated vertices in the graph."""
@@ -1022,9 +1045,27 @@ class Graph:
             # After the first level, exclude all descendants
             self._exclude_branch_conditionally(child_id, visited, excluded, output_name=None, skip_first=False)
 
+    @property
+    def edges(self) -> list[CycleEdge]:
+        """The edges of the graph. Assigning a new list re-indexes the edges by vertex."""
+        return self._graph_edges
+
+    @edges.setter
+    def edges(self, edges: list[CycleEdge]) -> None:
+        self._graph_edges = edges
+        self._vertex_edges = {}
+        self._analysis = None
+        for edge in edges:
+            self._index_edge(edge)
+
+    def _index_edge(self, edge: CycleEdge) -> None:
+        self._vertex_edges.setdefault(edge.source_id, []).append(edge)
+        if edge.target_id != edge.source_id:
+            self._vertex_edges.setdefault(edge.target_id, []).append(edge)
+
     def get_edge(self, source_id: str, target_id: str) -> CycleEdge | None:
         """Returns the edge between two vertices."""
-        for edge in self.edges:
+        for edge in self._vertex_edges.get(source_id, []):
             if edge.source_id == source_id and edge.target_id == target_id:
                 return edge
         return None
@@ -1108,14 +1149,86 @@ class Graph:
 
         return new_graph
 
+    def create_run_instance(self, context: dict[str, Any] | None = None) -> Graph:
+        """Creates a graph for a single run that shares this graph's topology.
+
+        Unlike `copy.deepcopy`, the node and edge data, the parsed edges and the cycle analysis
+        are shared with this graph and treated as read-only. Each instance gets its own vertices,
+        component instances, adjacency maps and run state, so instances can run concurrently.
+
+        Args:
+            context: Optional context for the run. Defaults to a copy of this graph's context.
+
+        Returns:
+            Graph: A graph that can be prepared and run independently of this one.
+        """
+        new_graph = type(self)(
+            flow_id=self.flow_id,
+            flow_name=self.flow_name,
+            description=self.description,
+            user_id=self.user_id,
+            context=dict(self.context) if context is None else context,
+        )
+        new_graph.__dict__.update(
+            raw_graph_data=self.raw_graph_data,
+            _vertices=self._vertices,
+            _edges=self._edges,
+            _cycle_vertices=self.cycle_vertices,
+            _is_cyclic=self.is_cyclic,
+            _cycles=self.cycles,
+        )
+        new_graph.top_level_vertices = list(self.top_level_vertices)
+
+        new_graph.vertices = [vertex.create_run_instance(new_graph) for vertex in self.vertices]
+        new_graph.vertex_map = {vertex.id: vertex for vertex in new_graph.vertices}
+        for vertex in new_graph.vertices:
+            vertex.params = new_graph.remap_vertex_references(vertex.params)
+            if hasattr(vertex, "raw_params"):
+                vertex.raw_params = new_graph.remap_vertex_references(vertex.raw_params)
+        # Cycle edges hold the result of the last iteration, every other edge is immutable
+        new_graph.edges = [copy.copy(edge) if isinstance(edge, CycleEdge) else edge for edge in self.edges]
+        new_graph.build_graph_maps(new_graph.edges)
+        new_graph.define_vertices_lists()
+
+        new_graph.prepare_run_instance()
+        return new_graph
+
+    def prepare_run_instance(self) -> None:
+        """Instantiates the components of a graph created by `create_run_instance`."""
+        self._instantiate_components_in_vertices()
+        if self.cycle_vertices:
+            for vertex in self.vertices:
+                if vertex.id in self.cycle_vertices:
+                    vertex.apply_on_outputs(lambda output_object: setattr(output_object, "cache", False))
+                    self.run_manager.add_to_cycle_vertices(vertex.id)
+        self._set_cache_if_listen_notify_components()
+
+    def remap_vertex_references(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Returns a copy of `params` where references to vertices point to this graph's vertices."""
+
+        def remap(value: Any) -> Any:
+            if isinstance(value, Vertex):
+                return self.vertex_map.get(value.id, value)
+            if isinstance(value, list) and any(isinstance(item, Vertex) for item in value):
+                return [remap(item) for item in value]
+            if isinstance(value, dict) and any(isinstance(item, Vertex) for item in value.values()):
+                return {key: remap(item) for key, item in value.items()}
+            return value
+
+        return {key: remap(value) for key, value in params.items()}
+
     def __setstate__(self, state):
         run_manager = state["run_manager"]
         if isinstance(run_manager, RunnableVerticesManager):
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
+        edges = state.pop("edges")
         self.__dict__.update(state)
+        self.edges = edges
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
+        self._changed_vertices = set()
+        self._analysis = None
         # Tracing service will be lazily initialized via property when needed
         self.set_run_id(self._run_id)
 
@@ -1276,6 +1389,7 @@ class Graph:
         """Adds a vertex to the graph."""
         self.vertices.append(vertex)
         self.vertex_map[vertex.id] = vertex
+        self._analysis = None
 
     def add_vertex(self, vertex: Vertex) -> None:
         """Adds a new vertex to the graph."""
@@ -1286,8 +1400,14 @@ class Graph:
         """Updates the edges of a vertex."""
         # Vertex has edges, so we need to update the edges
         for edge in vertex.edges:
-            if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
+            if (
+                edge.source_id in self.vertex_map
+                and edge.target_id in self.vertex_map
+                and edge not in self._vertex_edges.get(edge.source_id, [])
+            ):
                 self.edges.append(edge)
+                self._index_edge(edge)
+                self._analysis = None
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
@@ -1349,7 +1469,19 @@ class Graph:
             return
         self.vertices.remove(vertex)
         self.vertex_map.pop(vertex_id)
-        self.edges = [edge for edge in self.edges if vertex_id not in {edge.source_id, edge.target_id}]
+        self._analysis = None
+        removed_edges = self._vertex_edges.pop(vertex_id, [])
+        if not removed_edges:
+            return
+        for edge in removed_edges:
+            neighbor_id = edge.target_id if edge.source_id == vertex_id else edge.source_id
+            if neighbor_id in self._vertex_edges:
+                self._vertex_edges[neighbor_id] = [
+                    neighbor_edge
+                    for neighbor_edge in self._vertex_edges[neighbor_id]
+                    if vertex_id not in {neighbor_edge.source_id, neighbor_edge.target_id}
+                ]
+        self._graph_edges = [edge for edge in self.edges if vertex_id not in {edge.source_id, edge.target_id}]
 
     def _build_vertex_params(self) -> None:
         """Identifies and handles the LLM vertex within the graph."""
@@ -1516,6 +1648,7 @@ class Graph:
         """
         vertex = self.get_vertex(vertex_id)
         self.run_manager.add_to_vertices_being_run(vertex_id)
+        self._changed_vertices.add(vertex_id)
         try:
             params = ""
             should_build = False
@@ -1603,7 +1736,7 @@ class Graph:
         # or both
         return [
             edge
-            for edge in self.edges
+            for edge in self._vertex_edges.get(vertex_id, [])
             if (edge.source_id == vertex_id and is_source is not False)
             or (edge.target_id == vertex_id and is_target is not False)
         ]
@@ -1611,7 +1744,7 @@ class Graph:
     def get_vertices_with_target(self, vertex_id: str) -> list[Vertex]:
         """Returns the vertices connected to a vertex."""
         vertices: list[Vertex] = []
-        for edge in self.edges:
+        for edge in self._vertex_edges.get(vertex_id, []):
             if edge.target_id == vertex_id:
                 vertex = self.get_vertex(edge.source_id)
                 if vertex is None:
@@ -1625,10 +1758,24 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        scheduler: Literal["layered", "dataflow"] | None = None,
+        max_concurrency: int | None = None,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph, running independent vertices in parallel.
+
+        Args:
+            fallback_to_env_vars: Whether to fallback to environment variables.
+            start_component_id: The ID of the component to start from.
+            event_manager: The event manager for the graph.
+            scheduler: "layered" builds the graph layer by layer, waiting for every vertex of a layer
+                before starting the next one. "dataflow" starts each vertex as soon as its last
+                predecessor finishes. Defaults to the `graph_scheduler` setting.
+            max_concurrency: Maximum number of vertices built at the same time by the "dataflow"
+                scheduler. Defaults to the `graph_max_concurrency` setting; 0 means no limit.
+        """
         has_webhook_component = "webhook" in start_component_id.lower() if start_component_id else False
         first_layer = self.sort_vertices(start_component_id=start_component_id)
+        scheduler, max_concurrency = self._get_scheduler_config(scheduler, max_concurrency)
         vertex_task_run_count: dict[str, int] = {}
         to_process = deque(first_layer)
         layer_index = 0
@@ -1648,6 +1795,20 @@ class Graph:
 
         await self.initialize_run()
         lock = asyncio.Lock()
+        if scheduler == "dataflow":
+            await self._process_dataflow(
+                first_layer,
+                lock=lock,
+                fallback_to_env_vars=fallback_to_env_vars,
+                get_cache=get_cache_func,
+                set_cache=set_cache_func,
+                event_manager=event_manager,
+                has_webhook_component=has_webhook_component,
+                max_concurrency=max_concurrency,
+            )
+            await logger.adebug("Graph processing complete")
+            return self
+
         while to_process:
             current_batch = list(to_process)  # Copy current deque items to a list
             to_process.clear()  # Clear the deque for new items
@@ -1685,6 +1846,128 @@ class Graph:
         await logger.adebug("Graph processing complete")
         return self
 
+    def _get_scheduler_config(
+        self, scheduler: Literal["layered", "dataflow"] | None, max_concurrency: int | None
+    ) -> tuple[str, int]:
+        """Resolves the scheduler and concurrency limit, falling back to the settings service."""
+        if scheduler is None or max_concurrency is None:
+            from lfx.services.deps import get_settings_service
+
+            settings_service = get_settings_service()
+            settings = settings_service.settings if settings_service else None
+            if scheduler is None:
+                scheduler = getattr(settings, "graph_scheduler", "layered")
+            if max_concurrency is None:
+                max_concurrency = getattr(settings, "graph_max_concurrency", 0)
+        if scheduler not in {"layered", "dataflow"}:
+            msg = f"Invalid scheduler: {scheduler}. Expected 'layered' or 'dataflow'"
+            raise ValueError(msg)
+        if scheduler == "dataflow" and self.is_cyclic:
+            # Loop components re-arm their dependencies between iterations and rely on
+            # the layer barrier to do so, so cyclic graphs always run layer by layer.
+            logger.debug("Graph is cyclic, falling back to the layered scheduler")
+            scheduler = "layered"
+        return scheduler, max_concurrency or 0
+
+    async def _process_dataflow(
+        self,
+        first_layer: list[str],
+        *,
+        lock: asyncio.Lock,
+        fallback_to_env_vars: bool,
+        get_cache: GetCache | None,
+        set_cache: SetCache | None,
+        event_manager: EventManager | None,
+        has_webhook_component: bool,
+        max_concurrency: int = 0,
+    ) -> None:
+        """Builds vertices as soon as their predecessors are done instead of layer by layer.
+
+        The `RunnableVerticesManager` keeps, for every vertex, the predecessors that still have to
+        run (seeded from `predecessor_map`). Each time a vertex finishes it is removed from those
+        lists and every successor whose list became empty (and that is active and not conditionally
+        excluded) is started right away, without waiting for the rest of its layer.
+
+        Args:
+            first_layer: The IDs of the vertices to start with.
+            lock: Async lock for synchronization.
+            fallback_to_env_vars: Whether to fallback to environment variables.
+            get_cache: A coroutine to get the cache.
+            set_cache: A coroutine to set the cache.
+            event_manager: The event manager for the graph.
+            has_webhook_component: Whether the graph has a webhook component.
+            max_concurrency: Maximum number of vertices built at the same time. 0 means no limit.
+        """
+        vertex_task_run_count: dict[str, int] = {}
+        ready: deque[str] = deque(dict.fromkeys(first_layer))
+        running: dict[asyncio.Task, str] = {}
+
+        for vertex_id in first_layer:
+            self.run_manager.add_to_vertices_being_run(vertex_id)
+
+        try:
+            while ready or running:
+                while ready and (not max_concurrency or len(running) < max_concurrency):
+                    vertex_id = ready.popleft()
+                    run_count = vertex_task_run_count.get(vertex_id, 0)
+                    task = asyncio.create_task(
+                        self.build_vertex(
+                            vertex_id=vertex_id,
+                            user_id=self.user_id,
+                            inputs_dict={},
+                            fallback_to_env_vars=fallback_to_env_vars,
+                            get_cache=get_cache,
+                            set_cache=set_cache,
+                            event_manager=event_manager,
+                        ),
+                        name=f"{vertex_id} Run {run_count}",
+                    )
+                    running[task] = vertex_id
+                    vertex_task_run_count[vertex_id] = run_count + 1
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    vertex_id = running.pop(task)
+                    result = await self._get_dataflow_task_result(
+                        task, vertex_id, has_webhook_component=has_webhook_component
+                    )
+                    self.run_manager.remove_vertex_from_runnables(vertex_id)
+                    vertex = result.vertex
+                    await logger.adebug(
+                        f"Vertex {vertex.id}, result: {vertex.built_result}, object: {vertex.built_object}"
+                    )
+                    next_runnable_vertices = await self.get_next_runnable_vertices(lock, vertex=vertex, cache=False)
+                    ready.extend(v_id for v_id in dict.fromkeys(next_runnable_vertices) if v_id not in ready)
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def _get_dataflow_task_result(
+        self, task: asyncio.Task, vertex_id: str, *, has_webhook_component: bool
+    ) -> VertexBuildResult:
+        """Returns the result of a finished dataflow task, logging the vertex build."""
+        task_name = task.get_name()
+        try:
+            result = task.result()
+        except Exception as exc:
+            await logger.aerror(f"Task {task_name} failed with exception: {exc}")
+            if has_webhook_component:
+                await self._log_vertex_build_from_exception(vertex_id, exc)
+            raise
+        if not isinstance(result, VertexBuildResult):
+            msg = f"Invalid result from task {task_name}: {result}"
+            raise TypeError(msg)
+        if self.flow_id is not None:
+            await log_vertex_build(
+                flow_id=self.flow_id,
+                vertex_id=result.vertex.id,
+                valid=result.valid,
+                params=result.params,
+                data=result.result_dict,
+                artifacts=result.artifacts,
+            )
+        return result
+
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         """Determines the next set of runnable vertices from a list of successor vertex IDs.
 
@@ -1842,23 +2125,30 @@ class Graph:
         state = dict.fromkeys(self.vertices, 0)
         sorted_vertices = []
 
-        def dfs(vertex) -> None:
-            if state[vertex] == 1:
-                # We have a cycle
-                msg = "Graph contains a cycle, cannot perform topological sort"
-                raise ValueError(msg)
-            if state[vertex] == 0:
-                state[vertex] = 1
-                for edge in vertex.edges:
-                    if edge.source_id == vertex.id:
-                        dfs(self.get_vertex(edge.target_id))
-                state[vertex] = 2
-                sorted_vertices.append(vertex)
-
-        # Visit each vertex
-        for vertex in self.vertices:
-            if state[vertex] == 0:
-                dfs(vertex)
+        def targets(vertex):
+            return (self.get_vertex(edge.target_id) for edge in vertex.edges if edge.source_id == vertex.id)
+
+        # Iterative depth-first search, so long chains don't hit the recursion limit
+        for root in self.vertices:
+            if state[root] != 0:
+                continue
+            state[root] = 1
+            stack = [(root, targets(root))]
+            while stack:
+                vertex, children = stack[-1]
+                for child in children:
+                    if state[child] == 1:
+                        # We have a cycle
+                        msg = "Graph contains a cycle, cannot perform topological sort"
+                        raise ValueError(msg)
+                    if state[child] == 0:
+                        state[child] = 1
+                        stack.append((child, targets(child)))
+                        break
+                else:
+                    stack.pop()
+                    state[vertex] = 2
+                    sorted_vertices.append(vertex)
 
         return list(reversed(sorted_vertices))
 
@@ -1884,6 +2174,9 @@ class Graph:
         Returns:
             A list of successor vertices, either flat or nested depending on the `flat` parameter.
         """
+        if recursive and flat and visited is None:
+            return [self.get_vertex(vertex_id) for vertex_id in self._sorted_ids(self.analysis.descendants(vertex.id))]
+
         if visited is None:
             visited = set()
 
@@ -1930,17 +2223,16 @@ class Graph:
     def get_all_predecessors(self, vertex: Vertex, *, recursive: bool = True) -> list[Vertex]:
         """Retrieves all predecessor vertices of a given vertex.
 
-        If `recursive` is True, returns both direct and indirect predecessors by
-        traversing the graph recursively. If False, returns only the immediate predecessors.
+        If `recursive` is True, returns both direct and indirect predecessors, each once, read
+        from the graph's transitive closure. If False, returns only the immediate predecessors.
         """
-        _predecessors = self.predecessor_map.get(vertex.id, [])
-        predecessors = [self.get_vertex(v_id) for v_id in _predecessors]
         if recursive:
-            for predecessor in _predecessors:
-                predecessors.extend(self.get_all_predecessors(self.get_vertex(predecessor), recursive=recursive))
-        else:
-            predecessors.extend([self.get_vertex(predecessor) for predecessor in _predecessors])
-        return predecessors
+            return [self.get_vertex(vertex_id) for vertex_id in self._sorted_ids(self.analysis.ancestors(vertex.id))]
+        return [self.get_vertex(v_id) for v_id in self.predecessor_map.get(vertex.id, [])]
+
+    def _sorted_ids(self, vertex_ids: frozenset[str]) -> list[str]:
+        """Returns `vertex_ids` in the order of `self.vertices`."""
+        return [vertex.id for vertex in self.vertices if vertex.id in vertex_ids]
 
     def get_vertex_neighbors(self, vertex: Vertex) -> dict[Vertex, int]:
         """Returns a dictionary mapping each direct neighbor of a vertex to the count of connecting edges.
@@ -1949,7 +2241,7 @@ class Graph:
         The count reflects the number of edges between the input vertex and each neighbor.
         """
         neighbors: dict[Vertex, int] = {}
-        for edge in self.edges:
+        for edge in self._vertex_edges.get(vertex.id, []):
             if edge.source_id == vertex.id:
                 neighbor = self.get_vertex(edge.target_id)
                 if neighbor is None:
@@ -2145,7 +2437,6 @@ class Graph:
             cycle_vertices=self.cycle_vertices,
             stop_component_id=stop_component_id,
             start_component_id=start_component_id,
-            graph_dict=self.__to_dict(),
             in_degree_map=self.in_degree_map,
             successor_map=self.successor_map,
             predecessor_map=self.predecessor_map,
@@ -2153,6 +2444,7 @@ class Graph:
             get_vertex_predecessors=self.get_vertex_predecessors_ids,
             get_vertex_successors=self.get_vertex_successors_ids,
             is_cyclic=self.is_cyclic,
+            analysis=self.analysis,
         )
 
         self.increment_run_count()
@@ -2286,13 +2578,3 @@ class Graph:
             predecessor_map[edge.target_id].append(edge.source_id)
             successor_map[edge.source_id].append(edge.target_id)
         return predecessor_map, successor_map
-
-    def __to_dict(self) -> dict[str, dict[str, list[str]]]:
-        """Converts the graph to a dictionary."""
-        result: dict = {}
-        for vertex in self.vertices:
-            vertex_id = vertex.id
-            sucessors = [i.id for i in self.get_all_successors(vertex)]
-            predecessors = [i.id for i in self.get_predecessors(vertex)]
-            result |= {vertex_id: {"successors": sucessors, "predecessors": predecessors}}
-        return result
@@ -0,0 +1,176 @@
+"""Incremental checkpoints of a graph's run state.
+
+Pickling a whole `Graph` on every cache write re-serializes every vertex, even the ones that did
+not change. A checkpoint instead stores the graph once (its topology), and then, on each write,
+only the run state of the graph and the build outputs of the vertices built since the last write.
+`restore_graph` puts the pieces back together.
+
+This module only produces and consumes plain objects; serializing them is up to the cache backend.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from lfx.graph.edge.base import CycleEdge
+from lfx.graph.vertex.base import Vertex, VertexStates
+
+if TYPE_CHECKING:
+    from lfx.graph.graph.base import Graph
+
+CHECKPOINT_VERSION = 1
+
+VERTEX_DELTA_FIELDS = (
+    "built",
+    "results",
+    "artifacts",
+    "artifacts_raw",
+    "artifacts_type",
+    "built_object",
+    "built_result",
+    "result",
+    "outputs_logs",
+    "logs",
+    "use_result",
+    "will_stream",
+    "build_times",
+)
+
+
+@dataclass
+class GraphCheckpoint:
+    """Manifest stored under the graph's cache key in place of the pickled graph.
+
+    The topology, the run state and each vertex delta are stored under the keys returned by
+    `topology_key`, `state_key` and `vertex_key`.
+    """
+
+    key: str
+    checkpoint_id: str
+    vertex_ids: set[str] = field(default_factory=set)
+    version: int = CHECKPOINT_VERSION
+
+    def topology_key(self) -> str:
+        return f"{self.key}:checkpoint:{self.checkpoint_id}:topology"
+
+    def state_key(self) -> str:
+        return f"{self.key}:checkpoint:{self.checkpoint_id}:state"
+
+    def vertex_key(self, vertex_id: str) -> str:
+        return f"{self.key}:checkpoint:{self.checkpoint_id}:vertex:{vertex_id}"
+
+    def part_keys(self) -> list[str]:
+        """The keys of every part stored for this checkpoint."""
+        return [self.topology_key(), self.state_key(), *(self.vertex_key(vertex_id) for vertex_id in self.vertex_ids)]
+
+
+@dataclass(frozen=True)
+class VertexRef:
+    """Stands in for a `Vertex` inside a vertex delta, so deltas never pull in other vertices."""
+
+    vertex_id: str
+
+
+def _to_refs(value: Any) -> Any:
+    if isinstance(value, Vertex):
+        return VertexRef(value.id)
+    if isinstance(value, list):
+        return [_to_refs(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_refs(item) for key, item in value.items()}
+    return value
+
+
+def _from_refs(graph: Graph, value: Any) -> Any:
+    if isinstance(value, VertexRef):
+        return graph.get_vertex(value.vertex_id)
+    if isinstance(value, list):
+        return [_from_refs(graph, item) for item in value]
+    if isinstance(value, dict):
+        return {key: _from_refs(graph, item) for key, item in value.items()}
+    return value
+
+
+def get_vertex_delta(vertex: Vertex) -> dict[str, Any]:
+    """Returns what a build changed on `vertex`."""
+    delta = {name: getattr(vertex, name) for name in VERTEX_DELTA_FIELDS}
+    delta["state"] = vertex.state.value
+    delta["steps_ran"] = [step.__name__ for step in vertex.steps_ran]
+    delta["params"] = _to_refs(vertex.params)
+    if hasattr(vertex, "raw_params"):
+        delta["raw_params"] = _to_refs(vertex.raw_params)
+    return delta
+
+
+def apply_vertex_delta(graph: Graph, vertex: Vertex, delta: dict[str, Any]) -> None:
+    for name in VERTEX_DELTA_FIELDS:
+        setattr(vertex, name, delta[name])
+    vertex.state = VertexStates(delta["state"])
+    vertex.steps_ran = [getattr(vertex, name) for name in delta["steps_ran"]]
+    vertex.params = _from_refs(graph, delta["params"])
+    if "raw_params" in delta:
+        vertex.raw_params = _from_refs(graph, delta["raw_params"])
+
+
+def get_run_state(graph: Graph) -> dict[str, Any]:
+    """Returns the graph-level run state: which vertices ran, are running, excluded, and so on."""
+    return {
+        "run_id": graph._run_id,  # noqa: SLF001
+        "run_manager": graph.run_manager.to_dict(),
+        "inactivated_vertices": graph.inactivated_vertices,
+        "activated_vertices": graph.activated_vertices,
+        "conditionally_excluded_vertices": graph.conditionally_excluded_vertices,
+        "conditional_exclusion_sources": graph.conditional_exclusion_sources,
+        "vertices_layers": graph.vertices_layers,
+        "vertices_to_run": graph.vertices_to_run,
+        "stop_vertex": graph.stop_vertex,
+        "vertex_states": {vertex.id: vertex.state.value for vertex in graph.vertices},
+        "cycle_edges": [
+            (edge.source_id, edge.target_id, getattr(edge, "is_fulfilled", False), getattr(edge, "result", None))
+            for edge in graph.edges
+            if isinstance(edge, CycleEdge)
+        ],
+    }
+
+
+def apply_run_state(graph: Graph, state: dict[str, Any]) -> None:
+    from lfx.graph.graph.runnable_vertices_manager import RunnableVerticesManager
+
+    graph.set_run_id(state["run_id"])
+    graph.run_manager = RunnableVerticesManager.from_dict(state["run_manager"])
+    graph.inactivated_vertices = state["inactivated_vertices"]
+    graph.activated_vertices = state["activated_vertices"]
+    graph.conditionally_excluded_vertices = state["conditionally_excluded_vertices"]
+    graph.conditional_exclusion_sources = state["conditional_exclusion_sources"]
+    graph.vertices_layers = state["vertices_layers"]
+    graph.vertices_to_run = state["vertices_to_run"]
+    graph.stop_vertex = state["stop_vertex"]
+    for vertex_id, vertex_state in state["vertex_states"].items():
+        if vertex := graph.vertex_map.get(vertex_id):
+            vertex.state = VertexStates(vertex_state)
+    # Unpickled edges lose `is_cycle`, but keep their class
+    cycle_edges = {(edge.source_id, edge.target_id): edge for edge in graph.edges if isinstance(edge, CycleEdge)}
+    for source_id, target_id, is_fulfilled, result in state["cycle_edges"]:
+        if edge := cycle_edges.get((source_id, target_id)):
+            edge.is_fulfilled = is_fulfilled
+            edge.result = result
+
+
+def restore_graph(
+    topology: Graph,
+    state: dict[str, Any] | None,
+    vertex_deltas: dict[str, dict[str, Any]],
+) -> Graph:
+    """Rebuilds a graph from its checkpointed topology, run state and vertex deltas.
+
+    Deltas are applied first, so the vertex states in the run state win.
+    """
+    graph = topology
+    for vertex_id, delta in vertex_deltas.items():
+        if vertex := graph.vertex_map.get(vertex_id):
+            apply_vertex_delta(graph, vertex, delta)
+    if state is not None:
+        apply_run_state(graph, state)
+    graph.consume_changed_vertices()
+    return graph
@@ -1,10 +1,12 @@
 import copy
-from collections import defaultdict, deque
-from collections.abc import Callable
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterable
 from typing import Any
 
 import networkx as nx
 
+from lfx.graph.graph.analysis import GraphAnalysis
+
 PRIORITY_LIST_OF_INPUTS = ["webhook", "chat"]
 MAX_CYCLE_APPEARANCES = 2
 
@@ -516,6 +518,8 @@ def layered_topological_sort(
             # or (is_input_vertex and is_input_vertex(vertex_id))
         )
 
+    # How many times each vertex is waiting in the queue, so membership checks don't scan it
+    queued = Counter(queue)
     layers: list[list[str]] = []
     visited = set()
     cycle_counts = dict.fromkeys(vertices_ids, 0)
@@ -528,6 +532,7 @@ def layered_topological_sort(
         layer_size = len(queue)
         for _ in range(layer_size):
             vertex_id = queue.popleft()
+            queued[vertex_id] -= 1
             if vertex_id not in first_layer_vertices:
                 first_layer_vertices.add(vertex_id)
                 visited.add(vertex_id)
@@ -545,17 +550,19 @@ def layered_topological_sort(
                 in_degree_map[neighbor] -= 1  # 'remove' edge
                 if in_degree_map[neighbor] == 0:
                     queue.append(neighbor)
+                    queued[neighbor] += 1
 
                 # if > 0 it might mean not all predecessors have added to the queue
                 # so we should process the neighbors predecessors
                 elif in_degree_map[neighbor] > 0:
                     for predecessor in predecessor_map[neighbor]:
                         if (
-                            predecessor not in queue
+                            not queued[predecessor]
                             and predecessor not in first_layer_vertices
                             and (in_degree_map[predecessor] == 0 or predecessor in cycle_vertices)
                         ):
                             queue.append(predecessor)
+                            queued[predecessor] += 1
 
         current_layer += 1  # Next layer
 
@@ -565,6 +572,7 @@ def layered_topological_sort(
         layer_size = len(queue)
         for _ in range(layer_size):
             vertex_id = queue.popleft()
+            queued[vertex_id] -= 1
             if vertex_id not in visited or (is_cyclic and cycle_counts[vertex_id] < MAX_CYCLE_APPEARANCES):
                 if vertex_id not in visited:
                     visited.add(vertex_id)
@@ -582,6 +590,7 @@ def layered_topological_sort(
                 in_degree_map[neighbor] -= 1  # 'remove' edge
                 if in_degree_map[neighbor] == 0 and neighbor not in visited:
                     queue.append(neighbor)
+                    queued[neighbor] += 1
                     # # If this is a cycle vertex, reset its in_degree to allow it to appear again
                     # if neighbor in cycle_vertices and neighbor in visited:
                     #     in_degree_map[neighbor] = len(predecessor_map[neighbor])
@@ -590,11 +599,12 @@ def layered_topological_sort(
                 # so we should process the neighbors predecessors
                 elif in_degree_map[neighbor] > 0:
                     for predecessor in predecessor_map[neighbor]:
-                        if predecessor not in queue and (
+                        if not queued[predecessor] and (
                             predecessor not in visited
                             or (is_cyclic and cycle_counts[predecessor] < MAX_CYCLE_APPEARANCES)
                         ):
                             queue.append(predecessor)
+                            queued[predecessor] += 1
 
         current_layer += 1  # Next layer
 
@@ -787,6 +797,7 @@ def get_sorted_vertices(
     get_vertex_successors: Callable[[str], list[str]] | None = None,
     *,
     is_cyclic: bool = False,
+    analysis: GraphAnalysis | None = None,
 ) -> tuple[list[str], list[list[str]]]:
     """Get sorted vertices in a graph.
 
@@ -803,6 +814,8 @@ def get_sorted_vertices(
         get_vertex_predecessors: Function to get predecessors of a vertex
         get_vertex_successors: Function to get successors of a vertex
         is_cyclic: Whether the graph is cyclic
+        analysis: Precomputed reachability of the graph. When it spans `vertices_ids`, the stop and
+            start filters read the transitive closure instead of traversing the graph.
 
     Returns:
         Tuple of (first layer vertices, remaining layer vertices)
@@ -842,38 +855,42 @@ def get_sorted_vertices(
     # If we have a stop component, we need to filter out all vertices
     # that are not predecessors of the stop component
     if stop_component_id is not None:
-        filtered_vertices = filter_vertices_up_to_vertex(
-            vertices_ids,
-            stop_component_id,
-            get_vertex_predecessors=get_vertex_predecessors,
-            get_vertex_successors=get_vertex_successors,
-            graph_dict=graph_dict,
-        )
+        if analysis is not None and analysis.spans(vertices_ids):
+            filtered_vertices = {stop_component_id, *analysis.ancestors(stop_component_id)} & set(vertices_ids)
+        else:
+            filtered_vertices = filter_vertices_up_to_vertex(
+                vertices_ids,
+                stop_component_id,
+                get_vertex_predecessors=get_vertex_predecessors,
+                get_vertex_successors=get_vertex_successors,
+                graph_dict=graph_dict,
+            )
         vertices_ids = list(filtered_vertices)
 
     # If we have a start component, we need to filter out unconnected vertices
     # but keep vertices that are connected to the graph even if not reachable from start
     if start_component_id is not None:
         # First get all vertices reachable from start
-        reachable_vertices = filter_vertices_from_vertex(
-            vertices_ids,
-            start_component_id,
-            get_vertex_predecessors=get_vertex_predecessors,
-            get_vertex_successors=get_vertex_successors,
-            graph_dict=graph_dict,
-        )
-        # Then get all vertices that can reach any reachable vertex
-        connected_vertices = set()
-        for vertex in reachable_vertices:
-            connected_vertices.update(
-                filter_vertices_up_to_vertex(
-                    vertices_ids,
-                    vertex,
-                    get_vertex_predecessors=get_vertex_predecessors,
-                    get_vertex_successors=get_vertex_successors,
-                    graph_dict=graph_dict,
-                )
+        if analysis is not None and analysis.spans(vertices_ids):
+            reachable_vertices = {start_component_id, *analysis.descendants(start_component_id)} & set(vertices_ids)
+        else:
+            reachable_vertices = filter_vertices_from_vertex(
+                vertices_ids,
+                start_component_id,
+                get_vertex_predecessors=get_vertex_predecessors,
+                get_vertex_successors=get_vertex_successors,
+                graph_dict=graph_dict,
             )
+        # Then get all vertices that can reach any reachable vertex, in a single traversal
+        if reachable_vertices and get_vertex_predecessors is None:
+            if graph_dict is None:
+                msg = "Either get_vertex_predecessors or graph_dict must be provided"
+                raise ValueError(msg)
+
+            def get_vertex_predecessors(v):
+                return graph_dict[v]["predecessors"]
+
+        connected_vertices = _traverse(vertices_ids, reachable_vertices, get_vertex_predecessors)
         vertices_ids = list(connected_vertices)
 
     # Get the layers
@@ -913,6 +930,24 @@ def get_sorted_vertices(
     return all_layers[0], all_layers[1:]
 
 
+def _traverse(
+    vertices_ids: Iterable[str],
+    sources: Iterable[str],
+    get_neighbors: Callable[[str], list[str]],
+) -> set[str]:
+    """Returns `sources` and every vertex reached from them through `get_neighbors`, within `vertices_ids`."""
+    vertices_set = set(vertices_ids)
+    reached = {source for source in sources if source in vertices_set}
+    queue = deque(reached)
+    while queue:
+        current_vertex = queue.popleft()
+        for neighbor in get_neighbors(current_vertex):
+            if neighbor in vertices_set and neighbor not in reached:
+                reached.add(neighbor)
+                queue.append(neighbor)
+    return reached
+
+
 def filter_vertices_up_to_vertex(
     vertices_ids: list[str],
     vertex_id: str,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import inspect
 import traceback
 import types
@@ -35,6 +36,21 @@ if TYPE_CHECKING:
     Log = dict
 
 
+def _copy_node_data(node_data: NodeData) -> NodeData:
+    """Copies the parts of a node's data that a run can change, sharing everything else."""
+    full_data = node_data.copy()
+    data = full_data["data"] = full_data["data"].copy()
+    node = data["node"] = data["node"].copy()
+    template = node["template"] = node["template"].copy()
+    for field_name, field in template.items():
+        if isinstance(field, dict):
+            field_copy = field.copy()
+            if isinstance(field_copy.get("value"), list | dict):
+                field_copy["value"] = copy.deepcopy(field_copy["value"])
+            template[field_name] = field_copy
+    return full_data
+
+
 class VertexStates(str, Enum):
     """Vertex are related to it being active, inactive, or in an error state."""
 
@@ -234,6 +250,51 @@ class Vertex:
         self.built_object = state.get("built_object") or UnbuiltObject()
         self.built_result = state.get("built_result") or UnbuiltResult()
 
+    def create_run_instance(self, graph: Graph) -> Vertex:
+        """Returns a copy of this vertex for a single run of `graph`.
+
+        Parsed metadata (outputs, types, flags) is shared with this vertex, while results,
+        state, locks and the component instance start fresh. Template field values are copied
+        so changes made during a run cannot leak into other runs.
+        """
+        state = self.__dict__.copy()
+        full_data = _copy_node_data(self.full_data)
+        state.update(
+            graph=graph,
+            full_data=full_data,
+            data=full_data["data"],
+            params=self.params.copy(),
+            load_from_db_fields=list(self.load_from_db_fields),
+            custom_component=None,
+            built_object=UnbuiltObject(),
+            built_result=None,
+            built=False,
+            result=None,
+            results={},
+            artifacts={},
+            artifacts_raw={},
+            artifacts_type={},
+            outputs_logs={},
+            logs={},
+            steps_ran=[],
+            build_times=list(self.build_times),
+            state=VertexStates.ACTIVE,
+            log_transaction_tasks=set(),
+            use_result=False,
+            will_stream=False,
+            task_id=None,
+            _lock=None,
+            _successors_ids=None,
+            _incoming_edges=None,
+            _outgoing_edges=None,
+        )
+        if "raw_params" in state:
+            state["raw_params"] = self.raw_params.copy()
+        vertex = object.__new__(type(self))
+        vertex.__dict__.update(state)
+        vertex.steps = [types.MethodType(step.__func__, vertex) for step in self.steps]
+        return vertex
+
     def set_top_level(self, top_level_vertices: list[str]) -> None:
         self.parent_is_top_level = self.parent_node_id in top_level_vertices
 
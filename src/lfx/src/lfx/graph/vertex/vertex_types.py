@@ -211,6 +211,11 @@ class InterfaceVertex(ComponentVertex):
         self.steps = [self._build, self._run]
         self.is_interface_component = True
 
+    def create_run_instance(self, graph) -> InterfaceVertex:
+        vertex = super().create_run_instance(graph)
+        vertex.added_message = None
+        return vertex
+
     def build_stream_url(self) -> str:
         return f"/api/v1/build/{self.graph.flow_id}/{self.id}/stream"
 
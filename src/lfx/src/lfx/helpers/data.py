@@ -1,8 +1,11 @@
 import re
 from collections import defaultdict
-from typing import Any
+from itertools import repeat
+from string import Formatter
+from typing import TYPE_CHECKING, Any
 
 import orjson
+import pandas as pd
 from fastapi.encoders import jsonable_encoder
 from langchain_core.documents import Document
 
@@ -10,6 +13,9 @@ from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
 from lfx.schema.message import Message
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 def docs_to_data(documents: list[Document]) -> list[Data]:
     """Converts a list of Documents to a list of Data.
@@ -69,6 +75,57 @@ def safe_convert(data: Any, *, clean_data: bool = False) -> str:
         raise ValueError(msg) from e
 
 
+def _plain_template_fields(template: str) -> list[tuple[str, str | None]] | None:
+    """Splits `template` into (literal, field) pairs when every field is a bare key.
+
+    Returns None for templates with attribute or index lookups, positional fields,
+    conversions or format specs, which need `str.format` itself.
+    """
+    try:
+        parsed = list(Formatter().parse(template))
+    except ValueError:
+        return None
+    pairs: list[tuple[str, str | None]] = []
+    for literal, field, format_spec, conversion in parsed:
+        if field is not None and (
+            not field or field.isdigit() or "." in field or "[" in field or format_spec or conversion
+        ):
+            return None
+        pairs.append((literal, field))
+    return pairs
+
+
+def format_dataframe_rows(template: str, dataframe: pd.DataFrame) -> list[str]:
+    """Formats each row of `dataframe` with `template`, like `template.format(**row)` for every row.
+
+    Templates that only reference columns by name (e.g. "{name}: {text}") are formatted a
+    column at a time, without building a dict or a Series per row. Other templates are
+    formatted row by row.
+
+    Raises:
+        KeyError: If the template references a column the DataFrame doesn't have.
+    """
+    if dataframe.empty:
+        return []
+    pairs = _plain_template_fields(template)
+    if pairs is None or not dataframe.columns.is_unique:
+        return [template.format(**row) for row in dataframe.to_dict(orient="records")]
+
+    if all(field is None for _, field in pairs):
+        return ["".join(literal for literal, _ in pairs)] * len(dataframe)
+    parts: list[Iterable[str]] = []
+    for literal, field in pairs:
+        if literal:
+            parts.append(repeat(literal))
+        if field is not None:
+            if field not in dataframe.columns:
+                raise KeyError(field)
+            # format(value, "") is str(value)
+            parts.append(map(str, dataframe[field].tolist()))
+    # The literals repeat forever; the columns end the rows
+    return list(map("".join, zip(*parts, strict=False)))
+
+
 def data_to_text_list(template: str, data: Data | list[Data]) -> tuple[list[str], list[Data]]:
     """Format text from Data objects using a template string.
 
@@ -29,8 +29,19 @@ class ComponentCache:
 
         Creates empty storage for all component types and tracking of fully loaded components.
         """
-        self.all_types_dict: dict[str, Any] | None = None
+        self._all_types_dict: dict[str, Any] | None = None
         self.fully_loaded_components: dict[str, bool] = {}
+        self.version = 0
+        """Incremented whenever the component types change, so that what is derived from them can be rebuilt."""
+
+    @property
+    def all_types_dict(self) -> dict[str, Any] | None:
+        return self._all_types_dict
+
+    @all_types_dict.setter
+    def all_types_dict(self, value: dict[str, Any] | None) -> None:
+        self._all_types_dict = value
+        self.version += 1
 
 
 # Singleton instance
@@ -787,6 +798,7 @@ async def ensure_component_loaded(component_type: str, component_name: str, sett
 
             # Mark as fully loaded
             component_cache.fully_loaded_components[component_key] = True
+            component_cache.version += 1
             await logger.adebug(f"Component {component_type}:{component_name} fully loaded")
         else:
             await logger.awarning(f"Failed to fully load component {component_type}:{component_name}")
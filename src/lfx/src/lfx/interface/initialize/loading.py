@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import os
+import uuid
 import warnings
 from typing import TYPE_CHECKING, Any
 
@@ -12,10 +13,12 @@ from lfx.custom.eval import eval_custom_component_code
 from lfx.log.logger import logger
 from lfx.schema.artifact import get_artifact_type, post_process_raw
 from lfx.schema.data import Data
-from lfx.services.deps import get_settings_service, session_scope
+from lfx.services.deps import get_settings_service, get_variable_service, session_scope
 from lfx.services.session import NoopSession
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from lfx.custom.custom_component.component import Component
     from lfx.custom.custom_component.custom_component import CustomComponent
     from lfx.graph.vertex.base import Vertex
@@ -208,6 +211,52 @@ async def update_table_params_with_load_from_db_fields(
         return params
 
 
+def collect_load_from_db_variable_names(vertices: Iterable[Vertex]) -> set[str]:
+    """Returns the names of the global variables that the `load_from_db` fields of `vertices` refer to."""
+    names: set[str] = set()
+    for vertex in vertices:
+        params = vertex.params
+        for field in vertex.load_from_db_fields:
+            if field.startswith("table:"):
+                table_field_name = field[6:]
+                columns = params.get(f"{table_field_name}_load_from_db_columns") or []
+                for row in params.get(table_field_name) or []:
+                    if isinstance(row, dict):
+                        names.update(row[column] for column in columns if isinstance(row.get(column), str))
+            elif isinstance(params.get(field), str):
+                names.add(params[field])
+    names.discard("")
+    return names
+
+
+async def prefetch_load_from_db_variables(vertices: Iterable[Vertex], user_id, context: dict | None = None) -> None:
+    """Loads every global variable the vertices need with a single query, ahead of their builds.
+
+    This only warms the variable service's cache: builds still resolve each field through
+    `get_variable`, which reports missing variables as before. Variables overridden by the request
+    are skipped.
+    """
+    if not user_id:
+        return
+    names = collect_load_from_db_variable_names(vertices)
+    if context and "request_variables" in context:
+        names.difference_update(context["request_variables"])
+    if not names:
+        return
+    variable_service = get_variable_service()
+    if not hasattr(variable_service, "get_variables"):
+        return
+    try:
+        async with session_scope() as session:
+            settings_service = get_settings_service()
+            if isinstance(session, NoopSession) or (settings_service and settings_service.settings.use_noop_database):
+                return
+            user_id = user_id if isinstance(user_id, uuid.UUID) else uuid.UUID(str(user_id))
+            await variable_service.get_variables(user_id=user_id, names=names, session=session)
+    except Exception as e:  # noqa: BLE001
+        logger.debug(f"Could not prefetch global variables: {e}")
+
+
 async def update_params_with_load_from_db_fields(
     custom_component: CustomComponent,
     params,
@@ -215,6 +264,8 @@ async def update_params_with_load_from_db_fields(
     *,
     fallback_to_env_vars=False,
 ):
+    if not load_from_db_fields:
+        return params
     async with session_scope() as session:
         settings_service = get_settings_service()
         is_noop_session = isinstance(session, NoopSession) or (
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, cast
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any, cast, overload
 
 import pandas as pd
 from langchain_core.documents import Document
@@ -90,9 +91,14 @@ class DataFrame(pandas_DataFrame):
 
     def to_data_list(self) -> list[Data]:
         """Converts the DataFrame back to a list of Data objects."""
-        list_of_dicts = self.to_dict(orient="records")
-        # suggested change: [Data(**row) for row in list_of_dicts]
-        return [Data(data=row) for row in list_of_dicts]
+        return list(self.to_data_view())
+
+    def to_data_view(self) -> "DataView":
+        """Returns a read-only sequence of Data objects that are only created when accessed.
+
+        Prefer this over `to_data_list` when only some rows are used, or one at a time.
+        """
+        return DataView(self)
 
     def add_row(self, data: dict | Data) -> "DataFrame":
         """Adds a single row to the dataset.
@@ -103,6 +109,8 @@ class DataFrame(pandas_DataFrame):
         Returns:
             DataFrame: A new DataFrame with the added row
 
+        Each call copies the whole DataFrame; use `DataFrameBuilder` to add rows one at a time.
+
         Example:
             >>> dataset = DataFrame([{"name": "John"}])
             >>> dataset = dataset.add_row({"name": "Jane"})
@@ -208,3 +216,93 @@ class DataFrame(pandas_DataFrame):
         processed_df = processed_df.map(lambda x: str(x).replace("\n", "<br/>") if isinstance(x, str) else x)
         # Convert to markdown and wrap in a Message
         return Message(text=processed_df.to_markdown(index=False))
+
+
+class DataView(Sequence[Data]):
+    """A read-only sequence of the rows of a DataFrame as Data objects.
+
+    The values are copied out of the DataFrame column by column when the view is created, so
+    later changes to the DataFrame don't show. Data objects are created on access, and a new one
+    is returned on every access.
+    """
+
+    def __init__(self, dataframe: pd.DataFrame):
+        self._keys = list(dataframe.columns)
+        self._columns = [dataframe.iloc[:, i].tolist() for i in range(len(self._keys))]
+        self._length = len(dataframe)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _row(self, index: int) -> dict:
+        return dict(zip(self._keys, [column[index] for column in self._columns], strict=True))
+
+    @overload
+    def __getitem__(self, index: int) -> Data: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Data]: ...
+
+    def __getitem__(self, index: int | slice) -> Data | list[Data]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            msg = "DataView index out of range"
+            raise IndexError(msg)
+        return Data(data=self._row(index))
+
+    def __iter__(self) -> Iterator[Data]:
+        for values in zip(*self._columns, strict=True):
+            yield Data(data=dict(zip(self._keys, values, strict=True)))
+
+    def __repr__(self) -> str:
+        return f"DataView(rows={self._length}, columns={self._keys!r})"
+
+
+class DataFrameBuilder:
+    """Collects rows column by column and builds a DataFrame once.
+
+    Adding a row only appends to lists, so building a DataFrame of n rows takes O(n) time,
+    where calling `DataFrame.add_row` n times copies the DataFrame every time.
+
+    Example:
+        >>> builder = DataFrameBuilder()
+        >>> for name in ["John", "Jane"]:
+        ...     builder.add_row({"name": name})
+        >>> dataset = builder.build()
+    """
+
+    def __init__(self, text_key: str = "text", default_value: str = ""):
+        self._text_key = text_key
+        self._default_value = default_value
+        self._columns: dict[Any, list] = {}
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def add_row(self, data: dict | Data) -> "DataFrameBuilder":
+        """Adds a row. Columns missing from the row are filled with None, like `pd.concat` does with NaN."""
+        if isinstance(data, Data):
+            data = data.data
+        for key, value in data.items():
+            column = self._columns.get(key)
+            if column is None:
+                column = self._columns[key] = [None] * self._length
+            column.append(value)
+        self._length += 1
+        if len(data) < len(self._columns):
+            for column in self._columns.values():
+                if len(column) < self._length:
+                    column.append(None)
+        return self
+
+    def add_rows(self, data: list[dict | Data]) -> "DataFrameBuilder":
+        for item in data:
+            self.add_row(item)
+        return self
+
+    def build(self) -> DataFrame:
+        return DataFrame(self._columns, text_key=self._text_key, default_value=self._default_value)
@@ -147,10 +147,18 @@ class Settings(BaseSettings):
     Controlled by LANGFLOW_USE_NOOP_DATABASE env variable."""
 
     # cache configuration
-    cache_type: Literal["async", "redis", "memory", "disk"] = "async"
-    """The cache type can be 'async' or 'redis'."""
+    cache_type: Literal["async", "redis", "memory", "disk", "sharded"] = "async"
+    """The cache type can be 'async', 'redis', 'memory', 'disk' or 'sharded'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    cache_max_bytes: int = Field(default=512 * 1024 * 1024, ge=0)
+    """Approximate memory, in bytes, the 'sharded' cache may use before evicting the least recently used entries.
+    Set to 0 for no limit."""
+    cache_shards: int = Field(default=16, ge=1)
+    """Number of shards of the 'sharded' cache. Each shard has its own lock and an equal part of cache_max_bytes."""
+    cache_sweep_interval: float = Field(default=60.0, ge=0)
+    """Seconds between two sweeps of expired entries in the 'sharded' cache. Set to 0 to only drop expired entries
+    when they are read."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
 
@@ -160,6 +168,9 @@ class Settings(BaseSettings):
     """The port on which Langflow will expose Prometheus metrics. 9090 is the default port."""
 
     disable_track_apikey_usage: bool = False
+    api_key_cache_ttl: float = Field(default=30.0, ge=0)
+    """Seconds a verified API key and its user are cached in memory. Deleting the key or updating the user clears it
+    in the same process; other processes see the change once the entry expires. Set to 0 to disable the cache."""
     remove_api_keys: bool = False
     components_path: list[str] = []
     components_index_path: str | None = None
@@ -180,6 +191,25 @@ class Settings(BaseSettings):
     redis_url: str | None = None
     redis_cache_expire: int = 3600
 
+    # Job queue
+    job_queue_backend: Literal["memory", "redis"] = "memory"
+    """Where the events of playground builds are kept. With 'memory', they can only be read from the worker that
+    started the build, so several workers need sticky sessions. With 'redis', they are stored in Redis streams
+    (using the redis_* settings) and any worker can serve them, resume them from an event id, or cancel the build."""
+    job_queue_event_ttl: int = Field(default=3600, ge=1)
+    """Seconds the events of a build are kept in the 'redis' job queue backend after its last event."""
+    job_queue_max_events: int = Field(default=10_000, ge=1)
+    """Approximate number of events kept per build in the 'redis' job queue backend. Older events are dropped."""
+    event_queue_max_size: int = Field(default=10_000, ge=0)
+    """Number of events a build or streamed run keeps in memory for a client that hasn't read them yet.
+    What happens beyond that is set by event_queue_overflow_policy. Set to 0 for no limit."""
+    event_queue_overflow_policy: Literal["block", "drop", "spill"] = "block"
+    """What to do with events once a client falls event_queue_max_size events behind. With 'block', the flow waits
+    for the client to catch up. With 'drop', streamed tokens are merged into the last queued token or dropped, while
+    other events are kept. With 'spill', events are written to a temporary file until the client catches up."""
+    event_queue_spill_dir: str | None = None
+    """Directory of the temporary files of the 'spill' event queue policy. Defaults to the system's temp directory."""
+
     # Sentry
     sentry_dsn: str | None = None
     sentry_traces_sample_rate: float | None = 1.0
@@ -207,6 +237,9 @@ class Settings(BaseSettings):
 
     store_environment_variables: bool = True
     """Whether to store environment variables as Global Variables in the database."""
+    variable_cache_ttl: float = Field(default=10.0, ge=0)
+    """Seconds decrypted global variables are cached per user. Changing or deleting a variable clears the cache of
+    its user in the same process; other processes see the change once the entry expires. Set to 0 to disable."""
     variables_to_get_from_environment: list[str] = VARIABLES_TO_GET_FROM_ENVIRONMENT
     """List of environment variables to get from the environment and store in the database."""
     worker_timeout: int = 300
@@ -278,6 +311,12 @@ class Settings(BaseSettings):
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    db_write_behind_enabled: bool = True
+    """If set to True, API key usage counters are buffered and written to the database in batches."""
+    db_write_behind_batch_size: int = Field(default=200, ge=1)
+    """The number of API keys with buffered uses that triggers a write to the database."""
+    db_write_behind_flush_interval: float = Field(default=1.0, gt=0)
+    """The maximum time in seconds buffered API key uses wait before being written."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
@@ -292,6 +331,17 @@ class Settings(BaseSettings):
     max_items_length: int = MAX_ITEMS_LENGTH
     """Maximum number of items to store and display in the UI. Lists longer than this
     will be truncated when displayed in the UI. Does not affect data passed between components nor outputs."""
+    docling_worker_pool_size: int = Field(default=2, ge=1)
+    """Number of Docling worker processes the File component's advanced parser keeps warm. This is also how many
+    files it converts at the same time."""
+    docling_worker_max_jobs: int = Field(default=50, ge=0)
+    """Number of files a Docling worker converts before it is replaced, to bound memory growth. Set to 0 to keep
+    workers until Langflow stops."""
+    docling_cache_enabled: bool = True
+    """If set to True, Docling results are cached in the config directory, keyed by file content and parser options."""
+    docling_cache_max_entries: int = Field(default=1000, ge=0)
+    """Maximum number of cached Docling results. The least recently used ones are removed first. Set to 0 for no
+    limit."""
 
     # MCP Server
     mcp_server_enabled: bool = True
@@ -321,10 +371,29 @@ class Settings(BaseSettings):
     """The time in seconds after which a public temporary flow will be considered expired and eligible for cleanup.
     Default is 24 hours (86400 seconds). Minimum is 600 seconds (10 minutes)."""
     event_delivery: Literal["polling", "streaming", "direct"] = "streaming"
-    """How to deliver build events to the frontend. Can be 'polling', 'streaming' or 'direct'."""
+    """How to deliver build events to the frontend. Can be 'polling', 'streaming' or 'direct'. With several workers,
+    'direct' is used unless job_queue_backend is 'redis'."""
+    token_coalesce_max_chars: int = Field(default=64, ge=0)
+    """Streamed tokens are sent as one event once this many characters are buffered. Set to 0 to send every token."""
+    token_coalesce_interval: float = Field(default=0.02, ge=0)
+    """The maximum time in seconds a streamed token is buffered before being sent. Set to 0 to send every token."""
+    component_process_pool_size: int = Field(default=0, ge=0)
+    """Number of processes, per Langflow worker, running the output methods of components that opt into it with
+    `run_outputs_in_process`, such as Split Text. Set to 0 to run them in threads like other components."""
+    graph_scheduler: Literal["layered", "dataflow"] = "layered"
+    """How `Graph.process` schedules vertices. 'layered' waits for a whole layer to finish before starting
+    the next one. 'dataflow' starts each vertex as soon as its last predecessor finishes."""
+    graph_max_concurrency: int = Field(default=0, ge=0)
+    """Maximum number of vertices the 'dataflow' scheduler builds at the same time. 0 means no limit."""
     lazy_load_components: bool = False
     """If set to True, Langflow will only partially load components at startup and fully load them on demand.
     This significantly reduces startup time but may cause a slight delay when a component is first used."""
+    component_class_cache_size: int = Field(default=512, ge=0)
+    """Maximum number of component classes kept in the process-wide cache of classes built from component code.
+    Set to 0 to rebuild the class from its code on every vertex build."""
+    prepared_graph_cache_size: int = Field(default=128, ge=0)
+    """Maximum number of prepared graphs (flow data with tweaks applied) kept for reuse by the run endpoint.
+    Each run gets its own copy of the cached graph. Set to 0 to rebuild the graph on every request."""
 
     # Starter Projects
     create_starter_projects: bool = True
@@ -375,8 +444,8 @@ class Settings(BaseSettings):
     def set_event_delivery(cls, value, info):
         # If workers > 1, we need to use direct delivery
         # because polling and streaming are not supported
-        # in multi-worker environments
-        if info.data.get("workers", 1) > 1:
+        # in multi-worker environments, unless the build events are shared through Redis
+        if info.data.get("workers", 1) > 1 and info.data.get("job_queue_backend", "memory") != "redis":
             logger.warning("Multi-worker environment detected, using direct event delivery")
             return "direct"
         return value
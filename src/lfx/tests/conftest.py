@@ -50,8 +50,9 @@ def pytest_configure(config):  # noqa: ARG001
     pytest.LOOP_TEST = data_path / "LoopTest.json"
 
 
-def pytest_collection_modifyitems(config, items):  # noqa: ARG001
+def pytest_collection_modifyitems(config, items):
     """Automatically add markers based on test file location."""
+    run_benchmarks = "benchmark" in config.getoption("markexpr", "")
     for item in items:
         if "tests/unit/" in str(item.fspath):
             item.add_marker(pytest.mark.unit)
@@ -59,6 +60,11 @@ def pytest_collection_modifyitems(config, items):  # noqa: ARG001
             item.add_marker(pytest.mark.integration)
         elif "tests/slow/" in str(item.fspath):
             item.add_marker(pytest.mark.slow)
+        elif "tests/performance/" in str(item.fspath):
+            item.add_marker(pytest.mark.benchmark)
+            # Benchmarks are opt-in: run them with `pytest tests/performance -m benchmark`
+            if not run_benchmarks:
+                item.add_marker(pytest.mark.skip(reason="Benchmarks only run with -m benchmark"))
 
 
 @pytest.fixture(autouse=True)
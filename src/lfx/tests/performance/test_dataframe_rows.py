@@ -0,0 +1,47 @@
+"""Benchmark the row-wise DataFrame paths on 10k to 1M rows.
+
+Compares the columnar `format_dataframe_rows` and the lazy `DataFrame.to_data_view` and
+`DataFrameBuilder` with the per-row paths they replaced.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from lfx.helpers.data import format_dataframe_rows
+from lfx.schema.dataframe import DataFrame, DataFrameBuilder
+
+SIZES = [10_000, 100_000, 1_000_000]
+TEMPLATE = "{id}: {text}"
+
+
+def make_rows(size: int) -> dict[str, list]:
+    return {"id": np.arange(size), "text": [f"row {i}" for i in range(size)]}
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_format_dataframe_rows(size):
+    format_dataframe_rows(TEMPLATE, pd.DataFrame(make_rows(size)))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_format_records(size):
+    dataframe = pd.DataFrame(make_rows(size))
+    [TEMPLATE.format(**record) for record in dataframe.to_dict(orient="records")]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_to_data_view_row(size):
+    DataFrame(make_rows(size)).to_data_view()[size // 2]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_to_dict_records(size):
+    DataFrame(make_rows(size)).to_dict(orient="records")
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_builder(size):
+    builder = DataFrameBuilder()
+    for record in DataFrame(make_rows(size)).to_dict(orient="records"):
+        builder.add_row(record)
+    builder.build()
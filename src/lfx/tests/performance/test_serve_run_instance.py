@@ -0,0 +1,33 @@
+"""Benchmark the per-request graph copies used by `lfx serve` on the starter projects.
+
+Measures the requests per second of `Graph.create_run_instance` and of the `copy.deepcopy` path it
+replaced, recorded as test properties (`--junitxml` writes them out).
+"""
+
+import copy
+import time
+
+import pytest
+
+from tests.starter_projects import get_starter_project_files, load_graph
+
+ITERATIONS = 10
+
+
+def requests_per_second(make_copy, graph) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        make_copy(graph)
+    return ITERATIONS / (time.perf_counter() - start)
+
+
+@pytest.mark.parametrize("template_file", get_starter_project_files(), ids=lambda x: x.name)
+def test_run_instance_throughput(template_file, record_property):
+    graph = load_graph(template_file)
+
+    deepcopy_rps = requests_per_second(copy.deepcopy, graph)
+    run_instance_rps = requests_per_second(lambda template: template.create_run_instance(), graph)
+
+    record_property("deepcopy_requests_per_second", round(deepcopy_rps, 1))
+    record_property("run_instance_requests_per_second", round(run_instance_rps, 1))
+    record_property("speedup", round(run_instance_rps / deepcopy_rps, 2))
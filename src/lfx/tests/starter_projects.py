@@ -0,0 +1,28 @@
+"""Loaders for the starter project flows shipped with langflow, shared by the unit and performance tests."""
+
+import json
+from pathlib import Path
+
+import pytest
+from lfx.graph.graph.base import Graph
+
+
+def get_starter_project_files() -> list[Path]:
+    current = Path(__file__).resolve().parent
+    while current != current.parent:
+        starter_path = current / "src" / "backend" / "base" / "langflow" / "initial_setup" / "starter_projects"
+        if starter_path.exists():
+            return sorted(starter_path.glob("*.json"))
+        current = current.parent
+    return []
+
+
+def load_graph(template_file: Path) -> Graph:
+    """Loads a starter project, skipping the test if its components need an optional dependency."""
+    flow = json.loads(template_file.read_text(encoding="utf-8"))
+    try:
+        return Graph.from_payload(flow["data"], flow_id=template_file.stem, flow_name=template_file.stem)
+    except ValueError as exc:
+        if "ModuleNotFoundError" in str(exc):
+            pytest.skip(f"Missing optional dependency: {exc}")
+        raise
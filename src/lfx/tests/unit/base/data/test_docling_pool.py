@@ -0,0 +1,146 @@
+"""Tests for the Docling worker pool and result cache, using a worker script that doesn't need Docling."""
+
+import os
+import textwrap
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from lfx.base.data import docling_pool
+from lfx.base.data.docling_pool import DoclingResultCache, DoclingWorkerPool, run_docling_job
+
+FAKE_WORKER_SCRIPT = textwrap.dedent(
+    r"""
+    import json, os, sys
+
+    for line in sys.stdin:
+        cfg = json.loads(line)
+        if cfg.get("crash"):
+            sys.stderr.write("worker crashed\n")
+            sys.exit(1)
+        print(json.dumps({"ok": True, "mode": "markdown", "text": str(os.getpid()), "meta": cfg}), flush=True)
+    """
+)
+
+
+def make_job(file_path="doc.pdf", **overrides):
+    job = {
+        "file_path": str(file_path),
+        "markdown": True,
+        "image_mode": "placeholder",
+        "md_image_placeholder": "<!-- image -->",
+        "md_page_break_placeholder": "",
+        "pipeline": "standard",
+        "ocr_engine": None,
+    }
+    job.update(overrides)
+    return job
+
+
+@pytest.fixture
+def pool():
+    pool = DoclingWorkerPool(size=2, max_jobs_per_worker=3, script=FAKE_WORKER_SCRIPT)
+    yield pool
+    pool.shutdown()
+
+
+class TestDoclingWorkerPool:
+    def test_workers_are_reused_then_recycled(self, pool):
+        pids = [pool.run(make_job())["text"] for _ in range(4)]
+
+        # Jobs run one at a time, so one worker handles 3 jobs before it is replaced
+        assert len(set(pids[:3])) == 1
+        assert pids[3] != pids[0]
+
+    def test_concurrent_jobs_use_at_most_size_workers(self, pool):
+        results = []
+
+        def run():
+            results.append(pool.run(make_job()))
+
+        threads = [threading.Thread(target=run) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 6
+        assert all(result["ok"] for result in results)
+        assert pool.idle_workers <= pool.size
+
+    def test_crashed_worker_returns_an_error_and_is_replaced(self, pool):
+        first = pool.run(make_job())["text"]
+
+        result = pool.run(make_job(crash=True))
+
+        assert result["ok"] is False
+        assert "worker crashed" in result["error"]
+        assert result["meta"] == {"file_path": "doc.pdf"}
+        assert pool.run(make_job())["text"] != first
+
+
+class TestDoclingResultCache:
+    def test_key_depends_on_content_and_options(self, tmp_path):
+        file_a = tmp_path / "a.pdf"
+        file_b = tmp_path / "b.pdf"
+        file_a.write_bytes(b"same content")
+        file_b.write_bytes(b"same content")
+
+        key = DoclingResultCache.key(file_a, make_job(file_a))
+
+        assert DoclingResultCache.key(file_b, make_job(file_b)) == key
+        assert DoclingResultCache.key(file_a, make_job(file_a, ocr_engine="easyocr")) != key
+        file_b.write_bytes(b"other content")
+        assert DoclingResultCache.key(file_b, make_job(file_b)) != key
+
+    def test_only_successful_results_are_stored(self, tmp_path):
+        cache = DoclingResultCache(tmp_path)
+
+        cache.set("failed", {"ok": False, "error": "boom"})
+        cache.set("done", {"ok": True, "mode": "markdown", "text": "hello"})
+
+        assert cache.get("failed") is None
+        assert cache.get("done") == {"ok": True, "mode": "markdown", "text": "hello"}
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = DoclingResultCache(tmp_path, max_entries=2)
+        for key in ("first", "second"):
+            cache.set(key, {"ok": True})
+        # Make "second" the least recently used entry
+        os.utime(tmp_path / "second.json", (0, 0))
+
+        cache.set("third", {"ok": True})
+
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+        assert cache.get("third") is not None
+
+
+def test_run_docling_job_reuses_results_for_identical_content(tmp_path):
+    settings = MagicMock(
+        config_dir=str(tmp_path),
+        docling_cache_enabled=True,
+        docling_cache_max_entries=10,
+        docling_worker_pool_size=1,
+        docling_worker_max_jobs=0,
+    )
+    settings_service = MagicMock(settings=settings)
+    file_a = tmp_path / "a.pdf"
+    file_b = tmp_path / "b.pdf"
+    file_a.write_bytes(b"%PDF same")
+    file_b.write_bytes(b"%PDF same")
+    fake_pool = MagicMock()
+    fake_pool.run.side_effect = lambda job: {"ok": True, "mode": "markdown", "text": "converted", "meta": dict(job)}
+
+    with (
+        patch.object(docling_pool, "get_settings_service", return_value=settings_service),
+        patch.object(docling_pool, "get_docling_pool", return_value=fake_pool),
+    ):
+        first = run_docling_job(make_job(file_a))
+        second = run_docling_job(make_job(file_b))
+        other_options = run_docling_job(make_job(file_b, markdown=False))
+
+    assert fake_pool.run.call_count == 2
+    assert first["text"] == second["text"] == "converted"
+    assert second["meta"]["file_path"] == str(file_b)
+    assert other_options["meta"]["markdown"] is False
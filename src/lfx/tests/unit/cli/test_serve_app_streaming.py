@@ -45,6 +45,9 @@ class MockGraph:
         }
         self.edges = edges or [MockEdge("input_node", "output_node")]
 
+    def create_run_instance(self):
+        return MockGraph(nodes=dict(self.nodes), edges=list(self.edges))
+
 
 @pytest.fixture
 def mock_graphs():
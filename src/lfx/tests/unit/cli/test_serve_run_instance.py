@@ -0,0 +1,23 @@
+"""Tests for the per-request graph copies used by `lfx serve` on the starter projects.
+
+Each request to a served flow runs on its own copy of the loaded graph, made with
+`Graph.create_run_instance`. Starter projects whose components need optional dependencies that
+are not installed are skipped.
+"""
+
+import pytest
+
+from tests.starter_projects import get_starter_project_files, load_graph
+
+
+@pytest.mark.parametrize("template_file", get_starter_project_files(), ids=lambda x: x.name)
+def test_run_instance_has_the_same_vertices_and_edges(template_file):
+    graph = load_graph(template_file)
+
+    run_graph = graph.create_run_instance()
+
+    assert run_graph is not graph
+    assert [vertex.id for vertex in run_graph.vertices] == [vertex.id for vertex in graph.vertices]
+    assert [(edge.source_id, edge.target_id) for edge in run_graph.edges] == [
+        (edge.source_id, edge.target_id) for edge in graph.edges
+    ]
@@ -0,0 +1,113 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from lfx.base.flow_controls import loop_map
+from lfx.components.flow_controls import LoopComponent
+from lfx.components.processing import ParserComponent, SplitTextComponent
+from lfx.components.processing.message_to_data import MessageToDataComponent
+from lfx.graph import Graph
+from lfx.schema.data import Data
+
+
+def make_loop_graph(**loop_params) -> Graph:
+    """Split "a", "b" and "c" into rows, loop over them and append "!" to each one."""
+    split_text = SplitTextComponent(_id="split_text")
+    split_text.set(data_inputs=[Data(text="a\n\nb\n\nc")], chunk_size=1, chunk_overlap=0, separator="\n\n")
+    loop = LoopComponent(_id="loop")
+    loop.set(data=split_text.split_text, **loop_params)
+    parser = ParserComponent(_id="parser")
+    parser.set(input_data=loop.item_output, pattern="{text}!", sep="\n")
+    message_to_data = MessageToDataComponent(_id="message_to_data")
+    message_to_data.set(message=parser.parse_combined_text)
+    loop.set(item=message_to_data.convert_message_to_data)
+    done = ParserComponent(_id="done")
+    done.set(input_data=loop.done_output, pattern="{text}", sep="|")
+    return Graph(start=split_text, end=done)
+
+
+async def run_loop_graph(graph: Graph) -> tuple[list[str], str]:
+    vertex_ids = [result.vertex.id async for result in graph.async_start() if hasattr(result, "vertex")]
+    return vertex_ids, graph.get_vertex("done").results["parsed_text"].text
+
+
+def test_get_loop_body():
+    graph = make_loop_graph()
+
+    body = loop_map.get_loop_body(graph, "loop")
+
+    assert sorted(body.vertex_ids) == ["message_to_data", "parser"]
+    assert body.item_targets == [("parser", "input_data")]
+    assert body.result_source == ("message_to_data", "data")
+
+
+async def test_map_mode_runs_the_body_outside_the_loop():
+    vertex_ids, text = await run_loop_graph(make_loop_graph(mode="Map", max_concurrency=2))
+
+    assert vertex_ids == ["split_text", "loop", "done"]
+    assert text == "a!|b!|c!"
+
+
+async def test_map_mode_matches_sequential_mode():
+    _, sequential_text = await run_loop_graph(make_loop_graph())
+    _, map_text = await run_loop_graph(make_loop_graph(mode="Map"))
+
+    assert map_text == sequential_text
+
+
+async def test_map_mode_limits_concurrency():
+    running = 0
+    max_running = 0
+    run_loop_body = loop_map.run_loop_body
+
+    async def counting_run_loop_body(*args):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        try:
+            return await run_loop_body(*args)
+        finally:
+            running -= 1
+
+    with patch.object(loop_map, "run_loop_body", counting_run_loop_body):
+        _, text = await run_loop_graph(make_loop_graph(mode="Map", max_concurrency=2))
+
+    assert text == "a!|b!|c!"
+    assert max_running == 2
+
+
+@pytest.mark.parametrize(
+    ("error_policy", "expected"),
+    [
+        ("Skip", [("a!", False), ("c!", False)]),
+        ("Collect", [("a!", False), ("ValueError: no b", True), ("c!", False)]),
+    ],
+)
+async def test_map_mode_error_policies(error_policy, expected):
+    run_loop_body = loop_map.run_loop_body
+
+    async def failing_run_loop_body(graph, template, body, item):
+        if item.text == "b":
+            msg = "no b"
+            raise ValueError(msg)
+        return await run_loop_body(graph, template, body, item)
+
+    graph = make_loop_graph(mode="Map", error_policy=error_policy)
+    with patch.object(loop_map, "run_loop_body", failing_run_loop_body):
+        await run_loop_graph(graph)
+
+    done = graph.get_vertex("loop").results["done"]
+    assert list(zip(done["text"], done["error"], strict=True)) == expected
+
+
+async def test_map_mode_fails_fast():
+    async def failing_run_loop_body(*_args):
+        msg = "no luck"
+        raise ValueError(msg)
+
+    with (
+        patch.object(loop_map, "run_loop_body", failing_run_loop_body),
+        pytest.raises(Exception, match="no luck"),
+    ):
+        await run_loop_graph(make_loop_graph(mode="Map"))
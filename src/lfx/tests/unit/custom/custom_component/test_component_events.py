@@ -1,4 +1,5 @@
 import asyncio
+import json
 import time
 from typing import Any
 from unittest.mock import MagicMock
@@ -261,3 +262,49 @@ async def test_component_streaming_message():
             tokens.append(event)
 
     assert len(tokens) > 0
+
+
+@pytest.mark.asyncio
+async def test_component_streaming_message_coalesces_tokens():
+    """Test that tokens sent through the default callback are coalesced into fewer events."""
+    queue = asyncio.Queue()
+    event_manager = EventManager(queue)
+    event_manager.register_event("on_token", "token")
+    event_manager.register_event("on_message", "add_message")
+
+    vertex = MagicMock()
+    vertex.graph.flow_id = str(uuid4())
+    component = ComponentForTesting(_vertex=vertex)
+    component.set_event_manager(event_manager)
+
+    class StreamChunk:
+        def __init__(self, content: str):
+            self.content = content
+
+    chunks = [f"token{i} " for i in range(100)]
+
+    async def text_generator():
+        for chunk in chunks:
+            yield StreamChunk(chunk)
+
+    message = Message(
+        sender="test_sender",
+        session_id="test_session",
+        sender_name="test_sender_name",
+        text=text_generator(),
+        properties=Properties(),
+    )
+
+    sent_message = await component.send_message(message)
+    assert sent_message.text == "".join(chunks)
+
+    token_events = []
+    while not queue.empty():
+        _, event_data, _ = queue.get_nowait()
+        event = json.loads(event_data)
+        if event["event"] == "token":
+            token_events.append(event["data"])
+
+    assert 1 < len(token_events) < len(chunks)
+    assert "".join(data["chunk"] for data in token_events) == "".join(chunks)
+    assert {data["id"] for data in token_events} == {str(sent_message.id)}
@@ -0,0 +1,61 @@
+from textwrap import dedent
+
+from lfx.custom.eval import ComponentClassCache, eval_custom_component_code, get_component_class_cache
+
+CODE = dedent(
+    """
+    from lfx.custom.custom_component.component import Component
+    from lfx.io import Output
+    from lfx.schema.message import Message
+
+
+    class CachedComponent(Component):
+        outputs = [Output(display_name="Message", name="message", method="build_message")]
+
+        def build_message(self) -> Message:
+            return Message(text="cached")
+    """
+)
+
+
+def test_eval_custom_component_code_reuses_class():
+    cache = get_component_class_cache()
+    cache.invalidate(CODE)
+    misses = cache.stats()["misses"]
+
+    first = eval_custom_component_code(CODE)
+    hits = cache.stats()["hits"]
+    second = eval_custom_component_code(CODE)
+
+    assert first is second
+    assert first.__name__ == "CachedComponent"
+    assert cache.stats()["misses"] == misses + 1
+    assert cache.stats()["hits"] == hits + 1
+
+
+def test_invalidate_rebuilds_class():
+    cache = get_component_class_cache()
+    first = eval_custom_component_code(CODE)
+    cache.invalidate(CODE)
+    second = eval_custom_component_code(CODE)
+
+    assert first is not second
+    assert first.__name__ == second.__name__
+
+
+def test_component_class_cache_is_bounded():
+    cache = ComponentClassCache(maxsize=2)
+    for index in range(3):
+        cache.set(f"code-{index}", type(f"Class{index}", (), {}))
+
+    assert cache.get("code-0") is None
+    assert cache.get("code-2").__name__ == "Class2"
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 2, "maxsize": 2}
+
+
+def test_component_class_cache_disabled():
+    cache = ComponentClassCache(maxsize=0)
+    cache.set("code", type("Class", (), {}))
+
+    assert cache.get("code") is None
+    assert cache.stats()["size"] == 0
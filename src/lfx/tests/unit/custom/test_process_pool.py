@@ -0,0 +1,106 @@
+import os
+import textwrap
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from lfx.custom import process_pool
+from lfx.custom.eval import eval_custom_component_code
+
+COMPONENT_CODE = textwrap.dedent(
+    """
+    import os
+
+    from lfx.custom.custom_component.component import Component
+    from lfx.io import IntInput, Output
+    from lfx.schema.data import Data
+
+
+    class ComponentError(Exception):
+        pass
+
+
+    class PidComponent(Component):
+        display_name = "Pid"
+        run_outputs_in_process = frozenset({"in_process"})
+
+        inputs = [IntInput(name="number", display_name="Number", value=1)]
+        outputs = [
+            Output(display_name="In Process", name="in_process", method="get_pid"),
+            Output(display_name="In Thread", name="in_thread", method="get_pid_again"),
+            Output(display_name="Fails", name="fails", method="fail"),
+        ]
+
+        def get_pid(self) -> Data:
+            self.log("computing")
+            self.status = f"squared {self.number}"
+            return Data(data={"pid": os.getpid(), "square": self.number**2})
+
+        def get_pid_again(self) -> Data:
+            return self.get_pid()
+
+        def fail(self) -> Data:
+            raise ComponentError("no luck")
+    """
+)
+
+
+@pytest.fixture
+def pool_size():
+    settings_service = MagicMock(settings=MagicMock(component_process_pool_size=1))
+    with patch.object(process_pool, "get_settings_service", return_value=settings_service):
+        yield settings_service.settings
+    process_pool.shutdown_component_process_pool()
+
+
+def make_component(number: int = 3):
+    component_class = eval_custom_component_code(COMPONENT_CODE)
+    component = component_class(number=number)
+    component._code = COMPONENT_CODE
+    return component
+
+
+@pytest.mark.usefixtures("pool_size")
+async def test_opted_in_output_runs_in_another_process():
+    component = make_component()
+    # Also run the failing output in the pool
+    component.run_outputs_in_process = frozenset({"in_process", "fails"})
+
+    result = await component._get_output_result(component._outputs_map["in_process"])
+
+    assert result.data["pid"] != os.getpid()
+    assert result.data["square"] == 9
+    assert component.status == "squared 3"
+    assert [log.message for log in component._logs] == ["computing"]
+
+    with pytest.raises(RuntimeError, match="ComponentError: no luck"):
+        await component._get_output_result(component._outputs_map["fails"])
+
+
+@pytest.mark.usefixtures("pool_size")
+async def test_other_outputs_run_in_a_thread():
+    component = make_component()
+
+    result = await component._get_output_result(component._outputs_map["in_thread"])
+
+    assert result.data["pid"] == os.getpid()
+
+
+@pytest.mark.usefixtures("pool_size")
+async def test_inputs_that_cant_be_pickled_fall_back_to_a_thread():
+    component = make_component()
+    component._attributes["lock"] = threading.Lock()
+
+    result = await component._get_output_result(component._outputs_map["in_process"])
+
+    assert result.data["pid"] == os.getpid()
+
+
+async def test_disabled_pool_runs_in_a_thread(pool_size):
+    pool_size.component_process_pool_size = 0
+    component = make_component()
+
+    result = await component._get_output_result(component._outputs_map["in_process"])
+
+    assert result.data["pid"] == os.getpid()
+    assert process_pool.get_component_process_pool() is None
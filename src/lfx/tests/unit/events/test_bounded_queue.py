@@ -0,0 +1,139 @@
+import asyncio
+import json
+
+import pytest
+from lfx.events.bounded_queue import BoundedEventQueue
+from lfx.events.event_manager import EventManager, create_default_event_manager
+
+
+def drain(queue: BoundedEventQueue) -> list:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def event_types(items: list) -> list[str]:
+    return [json.loads(data)["event"] for _, data, _ in items]
+
+
+async def test_unbounded_by_default():
+    queue = BoundedEventQueue()
+    manager = create_default_event_manager(queue)
+    for i in range(100):
+        manager.on_token(data={"chunk": str(i), "id": "m"})
+
+    assert queue.qsize() == 100
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError, match="Unknown overflow policy"):
+        BoundedEventQueue(10, "ignore")
+
+
+class TestBlockPolicy:
+    async def test_put_nowait_accepts_events_beyond_the_limit(self):
+        queue = BoundedEventQueue(2, "block")
+        manager = create_default_event_manager(queue)
+        for i in range(5):
+            manager.on_token(data={"chunk": str(i), "id": "m"})
+
+        assert queue.qsize() == 5
+        assert queue.dropped == queue.coalesced == 0
+
+    async def test_producers_wait_for_the_consumer(self):
+        queue = BoundedEventQueue(2, "block")
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+        produced = []
+
+        async def produce():
+            for i in range(6):
+                manager.on_token(data={"chunk": str(i), "id": "m"})
+                await manager.wait_for_capacity()
+                produced.append(i)
+
+        producer = asyncio.create_task(produce())
+        await asyncio.sleep(0.01)
+        # The producer stops once the queue is full
+        assert produced == [0]
+        assert queue.qsize() == 2
+
+        consumed = []
+        while len(consumed) < 6:
+            _, data, _ = await queue.get()
+            consumed.append(json.loads(data)["data"]["chunk"])
+        await producer
+
+        assert consumed == [str(i) for i in range(6)]
+        assert produced == list(range(6))
+
+
+class TestDropPolicy:
+    async def test_tokens_of_one_message_are_merged(self):
+        queue = BoundedEventQueue(2, "drop")
+        manager = create_default_event_manager(queue)
+        manager.on_message(data={"text": "start"})
+        for chunk in ("a", "b", "c", "d"):
+            manager.on_token(data={"chunk": chunk, "id": "m"})
+
+        items = drain(queue)
+
+        assert event_types(items) == ["add_message", "token"]
+        assert json.loads(items[1][1])["data"] == {"chunk": "abcd", "id": "m"}
+        assert queue.coalesced == 3
+        assert queue.dropped == 0
+
+    async def test_tokens_are_dropped_but_other_events_are_kept(self):
+        overflows = []
+        queue = BoundedEventQueue(2, "drop", on_overflow=overflows.append)
+        manager = create_default_event_manager(queue)
+        manager.on_message(data={"text": "one"})
+        manager.on_message(data={"text": "two"})
+        manager.on_token(data={"chunk": "lost", "id": "m"})
+        manager.on_end_vertex(data={"build_data": {}})
+        manager.on_end(data={})
+        queue.put_nowait((None, None, 0.0))
+
+        items = drain(queue)
+
+        assert event_types(items[:-1]) == ["add_message", "add_message", "end_vertex", "end"]
+        assert items[-1][1] is None
+        assert queue.dropped == 1
+        assert overflows == ["dropped"]
+
+
+class TestSpillPolicy:
+    async def test_events_are_spilled_and_read_back_in_order(self, tmp_path):
+        overflows = []
+        queue = BoundedEventQueue(3, "spill", spill_dir=str(tmp_path), on_overflow=overflows.append)
+        manager = create_default_event_manager(queue)
+        for i in range(10):
+            manager.on_token(data={"chunk": str(i), "id": "m"})
+        queue.put_nowait((None, None, 1.5))
+
+        assert queue.qsize() == 11
+        assert len(queue._queue) == 3
+        assert queue.spilled == 8
+        assert overflows == ["spilled"] * 8
+
+        chunks = []
+        while True:
+            _, data, put_time = await queue.get()
+            if data is None:
+                break
+            chunks.append(json.loads(data)["data"]["chunk"])
+
+        assert chunks == [str(i) for i in range(10)]
+        assert put_time == 1.5
+        assert queue.empty()
+        queue.close()
+
+    async def test_spill_file_is_reused_once_drained(self):
+        queue = BoundedEventQueue(1, "spill")
+        for round_ in range(3):
+            for i in range(4):
+                queue.put_nowait((f"token-{round_}-{i}", b"x" * i, 0.0))
+            assert [item[0] for item in drain(queue)] == [f"token-{round_}-{i}" for i in range(4)]
+        assert queue._spill_file.seek(0, 2) == 0
+        queue.close()
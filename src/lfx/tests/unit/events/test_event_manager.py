@@ -130,6 +130,50 @@ class TestEventManager:
         # Should not raise exception, just log debug message
         manager.send_event(event_type="test", data=test_data)
 
+    def test_is_direct_event(self):
+        """Test that only events without a custom callback are direct."""
+        manager = EventManager(None)
+        manager.register_event("on_token", "token")
+        manager.register_event("on_custom", "custom", lambda manager, event_type, data: None)  # noqa: ARG005
+
+        assert manager.is_direct_event("on_token")
+        assert not manager.is_direct_event("on_custom")
+        assert not manager.is_direct_event("on_missing")
+
+        manager.register_event("on_token", "token", lambda manager, event_type, data: None)  # noqa: ARG005
+        assert not manager.is_direct_event("on_token")
+
+    def test_send_encoded_event(self):
+        """Test that pre-encoded data is sent as is, with the registered event type."""
+        queue = MagicMock()
+        manager = EventManager(queue)
+        manager.register_event("on_end_vertex", "end_vertex")
+
+        manager.send_encoded_event("on_end_vertex", b'{"build_data": {"id": "vertex", "valid": true}}')
+
+        event_id, data_bytes, _ = queue.put_nowait.call_args[0][0]
+        assert event_id.startswith("end_vertex-")
+        assert data_bytes.endswith(b"\n\n")
+        assert json.loads(data_bytes) == {
+            "event": "end_vertex",
+            "data": {"build_data": {"id": "vertex", "valid": True}},
+        }
+
+    def test_send_encoded_event_with_custom_callback(self):
+        """Test that events with a custom callback get the decoded data."""
+        received = []
+        manager = EventManager(MagicMock())
+        manager.register_event(
+            "on_end_vertex",
+            "end_vertex",
+            lambda manager, event_type, data: received.append((event_type, data)),  # noqa: ARG005
+        )
+
+        manager.send_encoded_event("on_end_vertex", b'{"build_data": {}}')
+
+        assert received == [("end_vertex", {"build_data": {}})]
+        manager.queue.put_nowait.assert_not_called()
+
     def test_noop_method(self):
         """Test noop method."""
         queue = asyncio.Queue()
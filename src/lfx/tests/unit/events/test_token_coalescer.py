@@ -0,0 +1,50 @@
+import asyncio
+
+from lfx.events.token_coalescer import TokenCoalescer
+
+
+class TestTokenCoalescer:
+    async def test_flushes_when_max_chars_is_reached(self):
+        emitted = []
+        coalescer = TokenCoalescer(emitted.append, max_chars=5, interval=60)
+
+        for token in ["ab", "cd", "ef", "g"]:
+            coalescer.add(token)
+
+        assert emitted == ["abcdef"]
+        assert coalescer.buffered == 1
+        coalescer.flush()
+        assert emitted == ["abcdef", "g"]
+        assert coalescer.buffered == 0
+
+    async def test_flushes_after_interval_without_new_tokens(self):
+        emitted = []
+        coalescer = TokenCoalescer(emitted.append, max_chars=1000, interval=0.01)
+
+        coalescer.add("Hello")
+        coalescer.add(" ")
+        assert emitted == []
+
+        await asyncio.sleep(0.05)
+        assert emitted == ["Hello "]
+
+    async def test_flushes_on_add_when_the_loop_was_blocked(self):
+        emitted = []
+        coalescer = TokenCoalescer(emitted.append, max_chars=1000, interval=0.01)
+
+        coalescer.add("a")
+        # Simulate a synchronous producer holding the loop past the interval, so the timer can't run
+        coalescer._first_added_at -= 1
+        coalescer.add("b")
+
+        assert emitted == ["ab"]
+
+    async def test_flush_without_tokens_emits_nothing(self):
+        emitted = []
+        coalescer = TokenCoalescer(emitted.append, max_chars=10, interval=0.01)
+
+        coalescer.add("")
+        coalescer.flush()
+        await asyncio.sleep(0.02)
+
+        assert emitted == []
@@ -0,0 +1,175 @@
+import itertools
+import json
+import random
+from collections import Counter, defaultdict, deque
+from pathlib import Path
+
+import pytest
+from lfx.graph.graph.analysis import GraphAnalysis
+from lfx.graph.graph.base import Graph
+from lfx.graph.graph.utils import (
+    filter_vertices_from_vertex,
+    filter_vertices_up_to_vertex,
+    find_cycle_vertices,
+    get_sorted_vertices,
+)
+
+TEST_DATA_DIR = Path(__file__).parents[3] / "data"
+
+
+def random_graph(seed: int, size: int = 30, edges: int = 45) -> tuple[list[str], dict[str, list[str]]]:
+    rng = random.Random(seed)  # noqa: S311
+    vertex_ids = [f"V-{i}" for i in range(size)]
+    successor_map: dict[str, list[str]] = defaultdict(list)
+    for _ in range(edges):
+        source, target = rng.choice(vertex_ids), rng.choice(vertex_ids)
+        successor_map[source].append(target)
+    return vertex_ids, successor_map
+
+
+def reachable(successor_map: dict[str, list[str]], vertex_id: str) -> set[str]:
+    reached: set[str] = set()
+    queue = deque(successor_map.get(vertex_id, []))
+    while queue:
+        current = queue.popleft()
+        if current not in reached:
+            reached.add(current)
+            queue.extend(successor_map.get(current, []))
+    return reached
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_closure_and_cycles_match_reference(seed):
+    vertex_ids, successor_map = random_graph(seed)
+    predecessor_map: dict[str, list[str]] = defaultdict(list)
+    for source, targets in successor_map.items():
+        for target in targets:
+            predecessor_map[target].append(source)
+
+    analysis = GraphAnalysis(vertex_ids, successor_map)
+
+    edges = [(source, target) for source, targets in successor_map.items() for target in targets]
+    assert analysis.cycle_vertices == set(find_cycle_vertices(edges))
+    for vertex_id in vertex_ids:
+        assert analysis.descendants(vertex_id) == reachable(successor_map, vertex_id)
+        assert analysis.ancestors(vertex_id) == reachable(predecessor_map, vertex_id)
+
+
+def test_deep_chain_does_not_recurse():
+    vertex_ids = [f"V-{i}" for i in range(5000)]
+    successor_map = {source: [target] for source, target in itertools.pairwise(vertex_ids)}
+
+    analysis = GraphAnalysis(vertex_ids, successor_map)
+
+    assert len(analysis.descendants(vertex_ids[0])) == len(vertex_ids) - 1
+    assert analysis.ancestors(vertex_ids[0]) == frozenset()
+    assert not analysis.cycle_vertices
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_sorted_vertices_match_without_analysis(seed):
+    vertex_ids, successor_map = random_graph(seed, edges=35)
+    # Keep the graph acyclic so the sort is defined for every stop and start vertex
+    successor_map = {
+        source: [target for target in targets if int(target.split("-")[1]) > int(source.split("-")[1])]
+        for source, targets in successor_map.items()
+    }
+    predecessor_map: dict[str, list[str]] = defaultdict(list)
+    for source, targets in successor_map.items():
+        for target in targets:
+            predecessor_map[target].append(source)
+    in_degree_map = {vertex_id: len(predecessor_map[vertex_id]) for vertex_id in vertex_ids}
+    analysis = GraphAnalysis(vertex_ids, successor_map)
+
+    def sort(**kwargs):
+        first_layer, remaining_layers = get_sorted_vertices(
+            vertices_ids=vertex_ids,
+            cycle_vertices=set(),
+            in_degree_map=in_degree_map,
+            successor_map=defaultdict(list, successor_map),
+            predecessor_map=predecessor_map,
+            get_vertex_predecessors=lambda vertex_id: predecessor_map[vertex_id],
+            get_vertex_successors=lambda vertex_id: successor_map.get(vertex_id, []),
+            **kwargs,
+        )
+        # The order within a layer follows set iteration, so only the layers themselves are compared
+        return [set(layer) for layer in [first_layer, *remaining_layers]]
+
+    rng = random.Random(seed)  # noqa: S311
+    for _ in range(5):
+        stop_id, start_id = rng.choice(vertex_ids), rng.choice(vertex_ids)
+        assert sort(stop_component_id=stop_id, analysis=analysis) == sort(stop_component_id=stop_id)
+        assert sort(start_component_id=start_id, analysis=analysis) == sort(start_component_id=start_id)
+
+
+def test_graph_analysis_follows_topology():
+    data = json.loads((TEST_DATA_DIR / "simple_chat_no_llm.json").read_text(encoding="utf-8"))
+    graph = Graph.from_payload(data, flow_id="flow-id")
+    chat_input = graph.get_vertex(next(vertex.id for vertex in graph.vertices if vertex.id.startswith("ChatInput")))
+    chat_output = graph.get_vertex(next(vertex.id for vertex in graph.vertices if vertex.id.startswith("ChatOutput")))
+
+    assert graph.analysis is graph.analysis
+    assert graph.get_all_successors(chat_input) == [chat_output]
+    assert graph.get_all_predecessors(chat_output) == [chat_input]
+
+    graph.remove_vertex(chat_input.id)
+    graph.build_graph_maps()
+
+    assert chat_input.id not in graph.analysis
+    assert graph.get_all_predecessors(chat_output) == []
+
+
+def test_start_component_filter_looks_up_each_vertex_once():
+    size = 300
+    rng = random.Random(0)  # noqa: S311
+    vertex_ids = [f"V-{i}" for i in range(size)]
+    successor_map: dict[str, list[str]] = defaultdict(list)
+    predecessor_map: dict[str, list[str]] = defaultdict(list)
+    for index in range(1, size):
+        for source_index in rng.sample(range(index), min(index, 2)):
+            successor_map[vertex_ids[source_index]].append(vertex_ids[index])
+            predecessor_map[vertex_ids[index]].append(vertex_ids[source_index])
+    in_degree_map = {vertex_id: len(predecessor_map[vertex_id]) for vertex_id in vertex_ids}
+    start_id = vertex_ids[10]
+    lookups: Counter[str] = Counter()
+
+    def get_vertex_predecessors(vertex_id: str) -> list[str]:
+        lookups["predecessors"] += 1
+        return predecessor_map[vertex_id]
+
+    def get_vertex_successors(vertex_id: str) -> list[str]:
+        lookups["successors"] += 1
+        return successor_map[vertex_id]
+
+    first_layer, remaining_layers = get_sorted_vertices(
+        vertices_ids=vertex_ids,
+        cycle_vertices=set(),
+        start_component_id=start_id,
+        in_degree_map=in_degree_map,
+        successor_map=successor_map,
+        predecessor_map=predecessor_map,
+        get_vertex_predecessors=get_vertex_predecessors,
+        get_vertex_successors=get_vertex_successors,
+        analysis=GraphAnalysis(vertex_ids, successor_map),
+    )
+
+    # The filter used to walk the predecessors of every vertex reachable from the start vertex
+    connected_vertices: set[str] = set()
+    for vertex_id in filter_vertices_from_vertex(
+        vertex_ids,
+        start_id,
+        get_vertex_predecessors=predecessor_map.__getitem__,
+        get_vertex_successors=successor_map.__getitem__,
+    ):
+        connected_vertices.update(
+            filter_vertices_up_to_vertex(
+                vertex_ids,
+                vertex_id,
+                get_vertex_predecessors=predecessor_map.__getitem__,
+                get_vertex_successors=successor_map.__getitem__,
+            )
+        )
+
+    assert {*first_layer, *itertools.chain.from_iterable(remaining_layers)} == connected_vertices
+    assert lookups["predecessors"] <= size
+    assert lookups["successors"] <= size
@@ -0,0 +1,68 @@
+import copy
+import json
+from pathlib import Path
+
+from lfx.graph.graph.base import Graph
+from lfx.graph.graph.checkpoint import VertexRef, get_run_state, get_vertex_delta, restore_graph
+from lfx.graph.vertex.base import Vertex, VertexStates
+
+TEST_DATA_DIR = Path(__file__).parents[3] / "data"
+
+
+def load_graph() -> Graph:
+    data = json.loads((TEST_DATA_DIR / "simple_chat_no_llm.json").read_text(encoding="utf-8"))
+    return Graph.from_payload(data, flow_id="flow-id")
+
+
+async def build_all(graph: Graph) -> None:
+    graph.set_run_id("run-id")
+    graph.sort_vertices()
+    for vertex_id in [vertex.id for vertex in graph.vertices]:
+        await graph.build_vertex(vertex_id, inputs_dict={"input_value": "hello"}, user_id="user-id")
+
+
+async def test_changed_vertices_are_consumed_once():
+    graph = load_graph()
+    assert graph.consume_changed_vertices() == set()
+
+    await build_all(graph)
+
+    assert graph.consume_changed_vertices() == {vertex.id for vertex in graph.vertices}
+    assert graph.consume_changed_vertices() == set()
+
+
+async def test_vertex_delta_replaces_vertex_references():
+    graph = load_graph()
+    await build_all(graph)
+    chat_output = next(vertex for vertex in graph.vertices if vertex.id.startswith("ChatOutput"))
+
+    delta = get_vertex_delta(chat_output)
+
+    assert isinstance(delta["raw_params"]["input_value"], VertexRef)
+    assert not any(isinstance(value, Vertex) for value in delta["params"].values())
+    assert delta["built"] is True
+    assert delta["state"] == VertexStates.ACTIVE.value
+
+
+async def test_restore_graph_from_topology_and_deltas():
+    graph = load_graph()
+    topology = copy.deepcopy(graph)
+    await build_all(graph)
+    graph.run_manager.add_to_vertices_being_run("pending")
+
+    deltas = {vertex.id: get_vertex_delta(vertex) for vertex in graph.vertices}
+    restored = restore_graph(topology, get_run_state(graph), deltas)
+
+    assert restored.run_id == "run-id"
+    assert "pending" in restored.run_manager.vertices_being_run
+    for vertex in graph.vertices:
+        restored_vertex = restored.get_vertex(vertex.id)
+        assert restored_vertex.built
+        assert restored_vertex.results.keys() == vertex.results.keys()
+        assert [step.__self__ for step in restored_vertex.steps_ran] == [restored_vertex] * len(vertex.steps_ran)
+        for value in restored_vertex.raw_params.values():
+            if isinstance(value, Vertex):
+                assert value is restored.get_vertex(value.id)
+    chat_output = next(vertex for vertex in restored.vertices if vertex.id.startswith("ChatOutput"))
+    assert chat_output.results["message"].text == "hello"
+    assert restored.consume_changed_vertices() == set()
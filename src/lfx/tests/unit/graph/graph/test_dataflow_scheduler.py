@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+from lfx.components.input_output import TextInputComponent
+from lfx.custom.custom_component.component import Component
+from lfx.graph.graph.base import Graph
+from lfx.io import FloatInput, MessageTextInput, Output
+from lfx.schema.message import Message
+
+COMPLETION_ORDER: list[str] = []
+# How many Sleep vertices are running now, and the most that ran at the same time
+IN_FLIGHT = {"now": 0, "peak": 0}
+
+
+class Sleep(Component):
+    display_name = "Sleep"
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text"),
+        FloatInput(name="seconds", display_name="Seconds", value=0.0),
+    ]
+    outputs = [
+        Output(display_name="Message", name="message", method="sleep"),
+    ]
+
+    async def sleep(self) -> Message:
+        IN_FLIGHT["now"] += 1
+        IN_FLIGHT["peak"] = max(IN_FLIGHT["peak"], IN_FLIGHT["now"])
+        try:
+            await asyncio.sleep(self.seconds)
+        finally:
+            IN_FLIGHT["now"] -= 1
+        COMPLETION_ORDER.append(self._id)
+        return Message(text=self.text or "")
+
+
+class Join(Component):
+    display_name = "Join"
+
+    inputs = [
+        MessageTextInput(name="first", display_name="First"),
+        MessageTextInput(name="second", display_name="Second"),
+    ]
+    outputs = [
+        Output(display_name="Message", name="message", method="join"),
+    ]
+
+    def join(self) -> Message:
+        COMPLETION_ORDER.append(self._id)
+        return Message(text=f"{self.first}{self.second}")
+
+
+def build_graph() -> Graph:
+    COMPLETION_ORDER.clear()
+    IN_FLIGHT.update(now=0, peak=0)
+    text_input = TextInputComponent(_id="text_input")
+    text_input.set(input_value="a")
+    slow = Sleep(_id="slow")
+    slow.set(text=text_input.text_response, seconds=0.3)
+    fast = Sleep(_id="fast")
+    fast.set(text=text_input.text_response, seconds=0.0)
+    after_fast = Sleep(_id="after_fast")
+    after_fast.set(text=fast.sleep, seconds=0.0)
+    join = Join(_id="join")
+    join.set(first=slow.sleep, second=after_fast.sleep)
+    return Graph(text_input, join)
+
+
+async def test_dataflow_starts_vertices_without_waiting_for_layer():
+    graph = build_graph()
+    await graph.process(fallback_to_env_vars=False, scheduler="dataflow")
+
+    # after_fast only depends on fast, so it does not wait for slow to finish
+    assert COMPLETION_ORDER == ["fast", "after_fast", "slow", "join"]
+    assert IN_FLIGHT["peak"] == 2
+    assert graph.get_vertex("join").built
+    assert graph.get_vertex("join").results["message"].text == "aa"
+
+
+async def test_layered_waits_for_whole_layer():
+    graph = build_graph()
+    await graph.process(fallback_to_env_vars=False, scheduler="layered")
+
+    assert COMPLETION_ORDER == ["fast", "slow", "after_fast", "join"]
+    assert graph.get_vertex("join").results["message"].text == "aa"
+
+
+async def test_dataflow_respects_max_concurrency():
+    graph = build_graph()
+    await graph.process(fallback_to_env_vars=False, scheduler="dataflow", max_concurrency=1)
+
+    assert sorted(COMPLETION_ORDER) == ["after_fast", "fast", "join", "slow"]
+    assert COMPLETION_ORDER[-1] == "join"
+    assert IN_FLIGHT["peak"] == 1
+    assert graph.get_vertex("join").results["message"].text == "aa"
+
+
+async def test_invalid_scheduler_raises():
+    graph = build_graph()
+    with pytest.raises(ValueError, match="Invalid scheduler"):
+        await graph.process(fallback_to_env_vars=False, scheduler="unknown")  # type: ignore[arg-type]
@@ -0,0 +1,112 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from lfx.graph.graph.base import Graph
+
+TEST_DATA_DIR = Path(__file__).parents[3] / "data"
+
+
+def load_graph() -> Graph:
+    data = json.loads((TEST_DATA_DIR / "simple_chat_no_llm.json").read_text(encoding="utf-8"))
+    return Graph.from_payload(data, flow_id="flow-id")
+
+
+def get_ids(graph: Graph) -> tuple[str, str]:
+    chat_input = next(vertex.id for vertex in graph.vertices if vertex.id.startswith("ChatInput"))
+    chat_output = next(vertex.id for vertex in graph.vertices if vertex.id.startswith("ChatOutput"))
+    return chat_input, chat_output
+
+
+def test_edge_lookups_match_edges():
+    graph = load_graph()
+    chat_input, chat_output = get_ids(graph)
+    (edge,) = graph.edges
+
+    assert graph.get_vertex_edges(chat_input) == [edge]
+    assert graph.get_vertex_edges(chat_input, is_target=False) == [edge]
+    assert graph.get_vertex_edges(chat_input, is_source=False) == []
+    assert graph.get_vertices_with_target(chat_output) == [graph.get_vertex(chat_input)]
+    assert graph.get_vertex_neighbors(graph.get_vertex(chat_output)) == {graph.get_vertex(chat_input): 1}
+    assert graph.get_edge(chat_input, chat_output) is edge
+    assert graph.get_edge(chat_output, chat_input) is None
+
+
+def test_remove_vertex_updates_edge_index():
+    graph = load_graph()
+    chat_input, chat_output = get_ids(graph)
+
+    graph.remove_vertex(chat_input)
+
+    assert graph.edges == []
+    assert graph.get_vertex_edges(chat_output) == []
+    assert graph.get_vertices_with_target(chat_output) == []
+
+
+def test_update_adds_edges_to_index():
+    graph = load_graph()
+    chat_input, chat_output = get_ids(graph)
+    graph.remove_vertex(chat_input)
+
+    graph.update(load_graph())
+
+    assert len(graph.edges) == 1
+    assert graph.get_vertices_with_target(chat_output) == [graph.get_vertex(chat_input)]
+    assert graph.get_vertex(chat_output).edges == graph.edges
+
+
+@dataclass(frozen=True)
+class SyntheticVertex:
+    id: str
+
+
+class CountingEdge:
+    """An edge that counts how many times its endpoints are read."""
+
+    reads = 0
+
+    def __init__(self, source_id: str, target_id: str):
+        self._source_id = source_id
+        self._target_id = target_id
+
+    @property
+    def source_id(self) -> str:
+        CountingEdge.reads += 1
+        return self._source_id
+
+    @property
+    def target_id(self) -> str:
+        CountingEdge.reads += 1
+        return self._target_id
+
+
+def build_synthetic_graph(vertex_count: int) -> Graph:
+    """A chain where every vertex also feeds the one two steps ahead, so each has degree <= 4."""
+    graph = Graph()
+    graph.vertex_map = {str(index): SyntheticVertex(str(index)) for index in range(vertex_count)}
+    graph.edges = [
+        CountingEdge(str(index), str(index + step))
+        for index in range(vertex_count)
+        for step in (1, 2)
+        if index + step < vertex_count
+    ]
+    return graph
+
+
+def edge_reads_per_vertex(graph: Graph) -> float:
+    CountingEdge.reads = 0
+    for vertex_id, vertex in graph.vertex_map.items():
+        graph.get_vertex_edges(vertex_id)
+        graph.get_vertices_with_target(vertex_id)
+        graph.get_vertex_neighbors(vertex)
+    return CountingEdge.reads / len(graph.vertex_map)
+
+
+@pytest.mark.parametrize("vertex_count", [100, 1_000, 5_000])
+def test_edge_lookups_only_read_the_edges_of_the_vertex(vertex_count):
+    graph = build_synthetic_graph(vertex_count)
+
+    # Each of the three lookups reads at most both endpoints of the vertex's <= 4 edges,
+    # where a scan of every edge would read about 4 * vertex_count per vertex
+    assert edge_reads_per_vertex(graph) <= 3 * 4 * 2
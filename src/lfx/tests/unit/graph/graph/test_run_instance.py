@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+
+from lfx.components.input_output import ChatInput, ChatOutput
+from lfx.graph.graph.base import Graph
+from lfx.schema.schema import InputValueRequest
+
+TEST_DATA_DIR = Path(__file__).parents[3] / "data"
+
+
+def load_template() -> Graph:
+    data = json.loads((TEST_DATA_DIR / "simple_chat_no_llm.json").read_text(encoding="utf-8"))
+    return Graph.from_payload(data, flow_id="flow-id", flow_name="Simple Chat")
+
+
+def test_run_instance_shares_topology():
+    template = load_template()
+    run_graph = template.create_run_instance(context={"key": "value"})
+
+    assert run_graph is not template
+    assert run_graph.flow_id == template.flow_id
+    assert run_graph.context == {"key": "value"}
+    assert [vertex.id for vertex in run_graph.vertices] == [vertex.id for vertex in template.vertices]
+    assert run_graph.raw_graph_data is template.raw_graph_data
+    for vertex in run_graph.vertices:
+        assert vertex.graph is run_graph
+        assert vertex is not template.get_vertex(vertex.id)
+        assert vertex.custom_component is not template.get_vertex(vertex.id).custom_component
+        assert all(step.__self__ is vertex for step in vertex.steps)
+    assert run_graph.predecessor_map == template.predecessor_map
+    assert run_graph.predecessor_map is not template.predecessor_map
+
+
+async def test_run_instances_do_not_share_results():
+    template = load_template()
+    first = template.create_run_instance()
+    second = template.create_run_instance()
+
+    first_outputs = await first.arun([{"input_value": "first"}])
+    second_outputs = await second.arun([{"input_value": "second"}])
+
+    assert first_outputs[0].outputs[0].results["message"].text == "first"
+    assert second_outputs[0].outputs[0].results["message"].text == "second"
+    assert not any(vertex.built for vertex in template.vertices)
+
+    template_outputs = await template.arun([{"input_value": "template"}])
+    assert template_outputs[0].outputs[0].results["message"].text == "template"
+
+
+async def test_run_instance_of_graph_built_from_components():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=chat_input.message_response, sender_name="Bot")
+    template = Graph(chat_input, chat_output)
+
+    run_graph = template.create_run_instance()
+    results = [result async for result in run_graph.async_start(InputValueRequest(input_value="hello"))]
+
+    assert [result.vertex.id for result in results if hasattr(result, "vertex")] == ["chat_input", "chat_output"]
+    message = run_graph.get_vertex("chat_output").results["message"]
+    assert message.text == "hello"
+    assert message.sender_name == "Bot"
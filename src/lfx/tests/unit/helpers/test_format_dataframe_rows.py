@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+from lfx.helpers.data import format_dataframe_rows
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "{name} is {age} years old",
+        "{name}: {score}",
+        "{{literal}} {name}",
+        "no fields",
+        "{age:>5} {name!r}",
+        "{age.real}",
+        "",
+    ],
+)
+def test_format_dataframe_rows_matches_str_format(template):
+    dataframe = pd.DataFrame({"name": ["John", "Jane", None], "age": [30, 25, 35], "score": [1.5, np.nan, 2.0]})
+
+    expected = [template.format(**row) for row in dataframe.to_dict(orient="records")]
+
+    assert format_dataframe_rows(template, dataframe) == expected
+
+
+def test_format_dataframe_rows_missing_column_raises_key_error():
+    with pytest.raises(KeyError, match="missing"):
+        format_dataframe_rows("{name} {missing}", pd.DataFrame({"name": ["John"]}))
+
+
+def test_format_dataframe_rows_empty_dataframe():
+    assert format_dataframe_rows("{missing}", pd.DataFrame({"name": []})) == []
+
+
+def test_format_dataframe_rows_keeps_column_types():
+    # Formatting rows as Series upcasts ints to floats when a row also holds floats
+    dataframe = pd.DataFrame({"age": [30], "score": [1.5]})
+
+    assert format_dataframe_rows("{age} {score}", dataframe) == ["30 1.5"]
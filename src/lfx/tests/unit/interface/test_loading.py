@@ -0,0 +1,72 @@
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from lfx.interface.initialize.loading import (
+    collect_load_from_db_variable_names,
+    prefetch_load_from_db_variables,
+    update_params_with_load_from_db_fields,
+)
+
+
+def make_vertex(params, load_from_db_fields):
+    return SimpleNamespace(params=params, load_from_db_fields=load_from_db_fields)
+
+
+@pytest.fixture
+def vertices():
+    return [
+        make_vertex({"api_key": "OPENAI_API_KEY", "model": "gpt"}, ["api_key"]),
+        make_vertex({"api_key": "OPENAI_API_KEY", "token": ""}, ["api_key", "token"]),
+        make_vertex(
+            {
+                "headers": [{"key": "Authorization", "value": "AUTH_TOKEN"}, {"key": "X", "value": None}],
+                "headers_load_from_db_columns": ["value"],
+            },
+            ["table:headers"],
+        ),
+        make_vertex({"text": "hello"}, []),
+    ]
+
+
+def test_collect_load_from_db_variable_names(vertices):
+    assert collect_load_from_db_variable_names(vertices) == {"OPENAI_API_KEY", "AUTH_TOKEN"}
+
+
+async def test_prefetch_resolves_all_variables_with_one_call(vertices):
+    variable_service = MagicMock()
+    variable_service.get_variables = AsyncMock(return_value={})
+    session = MagicMock()
+
+    @asynccontextmanager
+    async def session_scope():
+        yield session
+
+    user_id = uuid4()
+    with (
+        patch("lfx.interface.initialize.loading.get_variable_service", return_value=variable_service),
+        patch("lfx.interface.initialize.loading.session_scope", session_scope),
+        patch("lfx.interface.initialize.loading.get_settings_service", return_value=None),
+    ):
+        await prefetch_load_from_db_variables(vertices, str(user_id), {"request_variables": {"AUTH_TOKEN": "x"}})
+
+    variable_service.get_variables.assert_awaited_once_with(user_id=user_id, names={"OPENAI_API_KEY"}, session=session)
+
+
+async def test_prefetch_without_user_or_variables_does_nothing(vertices):
+    with patch("lfx.interface.initialize.loading.get_variable_service") as get_variable_service:
+        await prefetch_load_from_db_variables(vertices, None)
+        await prefetch_load_from_db_variables([make_vertex({"text": "hello"}, [])], uuid4())
+
+    get_variable_service.assert_not_called()
+
+
+async def test_update_params_without_load_from_db_fields_skips_the_session():
+    params = {"text": "hello"}
+    with patch("lfx.interface.initialize.loading.session_scope") as session_scope:
+        result = await update_params_with_load_from_db_fields(MagicMock(), params, [])
+
+    assert result is params
+    session_scope.assert_not_called()
@@ -2,7 +2,7 @@ import pandas as pd
 import pytest
 from langchain_core.documents import Document
 from lfx.schema.data import Data
-from lfx.schema.dataframe import DataFrame
+from lfx.schema.dataframe import DataFrame, DataFrameBuilder
 
 
 @pytest.fixture
@@ -71,3 +71,44 @@ class TestDataFrameSchema:
 
         non_empty_df = DataFrame({"name": ["John"], "text": ["name is John"]})
         assert bool(non_empty_df)
+
+    def test_to_data_view(self, sample_dataframe):
+        """Test that the view creates the same Data objects as to_data_list, on access."""
+        data_frame = DataFrame(sample_dataframe)
+        view = data_frame.to_data_view()
+
+        assert len(view) == len(sample_dataframe)
+        assert view[0].data == {"name": "John", "text": "name is John"}
+        assert view[-1].data["name"] == "Jane"
+        assert [item.data for item in view[0:2]] == [item.data for item in data_frame.to_data_list()]
+        assert [item.data["name"] for item in view] == ["John", "Jane"]
+        with pytest.raises(IndexError):
+            view[2]
+
+    def test_to_data_view_converts_numpy_scalars(self):
+        data_frame = DataFrame({"count": [1, 2], "score": [0.5, 1.5]})
+
+        row = data_frame.to_data_view()[1].data
+
+        assert row == {"count": 2, "score": 1.5}
+        assert type(row["count"]) is int
+
+    def test_builder_matches_add_row(self, sample_dataframe):
+        """Test that the builder gives the same DataFrame as repeated add_row calls."""
+        rows = [{"name": "Bob", "text": "name is Bob"}, Data(data={"name": "Alice", "extra": 1})]
+        expected = DataFrame(sample_dataframe)
+        for row in rows:
+            expected = expected.add_row(row)
+
+        builder = DataFrameBuilder().add_rows(sample_dataframe.to_dict(orient="records"))
+        for row in rows:
+            builder.add_row(row)
+        result = builder.build()
+
+        assert isinstance(result, DataFrame)
+        assert len(builder) == len(expected)
+        assert result["name"].tolist() == expected["name"].tolist()
+        assert result["extra"].isna().tolist() == expected["extra"].isna().tolist()
+
+    def test_empty_builder(self):
+        assert not DataFrameBuilder().build()
@@ -0,0 +1,28 @@
+"""Tests for event_delivery validator in Settings."""
+
+from lfx.services.settings.base import Settings
+
+
+def test_single_worker_keeps_event_delivery(monkeypatch):
+    """Test that the configured event delivery is kept with one worker."""
+    monkeypatch.setenv("LANGFLOW_EVENT_DELIVERY", "polling")
+    settings = Settings()
+    assert settings.event_delivery == "polling"
+
+
+def test_several_workers_use_direct_delivery_with_memory_job_queue(monkeypatch):
+    """Test that several workers fall back to direct delivery when build events stay in each worker."""
+    monkeypatch.setenv("LANGFLOW_WORKERS", "2")
+    monkeypatch.setenv("LANGFLOW_EVENT_DELIVERY", "streaming")
+    settings = Settings()
+    assert settings.event_delivery == "direct"
+
+
+def test_several_workers_keep_event_delivery_with_redis_job_queue(monkeypatch):
+    """Test that several workers keep streaming or polling when build events are shared through Redis."""
+    monkeypatch.setenv("LANGFLOW_WORKERS", "2")
+    monkeypatch.setenv("LANGFLOW_JOB_QUEUE_BACKEND", "redis")
+    for event_delivery in ("streaming", "polling"):
+        monkeypatch.setenv("LANGFLOW_EVENT_DELIVERY", event_delivery)
+        settings = Settings()
+        assert settings.event_delivery == event_delivery